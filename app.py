@@ -5,13 +5,33 @@ import logging
 import os
 import traceback
 
-from flask import Flask, render_template, request
+from flask import Flask, jsonify, render_template, request
 
-from calculations.fixed_horizon import calculate_sample_size
+from calculations.bootstrap import bootstrap_std_ci
+from calculations.fixed_horizon import (
+    achieved_power,
+    calculate_sample_size,
+    minimum_detectable_effect,
+)
+from calculations.ingestion import (
+    DELIMITERS,
+    binary_format_for,
+    iter_float64_stream,
+    iter_parquet_columns,
+    parse_numbers,
+    read_delimited_column,
+    read_segmented_column,
+)
 from calculations.msprt import calculate_msprt_plan
 from calculations.std_calculator import (
+    calculate_ratio_metric_std,
+    calculate_robust_std,
+    calculate_segmented_std,
+    calculate_std_from_chunks,
+    calculate_std_from_conversion_chunks,
     calculate_std_from_conversion_data,
     calculate_std_from_data,
+    calculate_std_from_stream,
     estimate_conversion_rate_std,
     estimate_std_from_percentiles,
     estimate_std_from_range,
@@ -80,6 +100,37 @@ def validate_numeric_input(
         raise e
 
 
+def parse_json_numeric(payload, key, field_name, allow_none=False):
+    """Read a number or list of numbers from a JSON payload"""
+    value = payload.get(key)
+    if value is None:
+        if allow_none:
+            return None
+        raise ValueError(f"{field_name} is required")
+
+    values = value if isinstance(value, list) else [value]
+    if not values or not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in values
+    ):
+        raise ValueError(f"{field_name} must be a number or a list of numbers")
+    return [float(v) for v in values] if isinstance(value, list) else float(value)
+
+
+def to_json_results(results):
+    """Convert calculator results (possibly NumPy arrays) to JSON-safe values"""
+    return {
+        key: value.tolist() if hasattr(value, "tolist") else value
+        for key, value in results.items()
+    }
+
+
+# Seconds a web request may spend on bootstrap resampling
+BOOTSTRAP_TIME_BUDGET = 2.0
+
+# Sample sizes (as multiples of the planned n) shown in the power curve
+POWER_CURVE_MULTIPLIERS = [0.25, 0.5, 0.75, 1, 1.5, 2, 3, 4]
+
+
 @app.route("/")
 def home():
     return render_template("home.html")
@@ -87,7 +138,9 @@ def home():
 
 @app.route("/sample-size-calculator")
 def sample_size_calculator():
-    return render_template("fixed_horizon_form.html")
+    # baseline_mean / baseline_std query parameters prefill the form (links
+    # from the std calculator results)
+    return render_template("fixed_horizon_form.html", prefill=request.args)
 
 
 @app.route("/calculate-sample-size", methods=["POST"])
@@ -167,9 +220,203 @@ def calculate_sample_size_route():
         )
 
 
+@app.route("/power-calculator")
+def power_calculator():
+    return render_template("power_calculator_form.html")
+
+
+@app.route("/calculate-mde", methods=["POST"])
+def calculate_mde_route():
+    try:
+        logger.info("Starting minimum detectable effect calculation")
+        logger.debug(f"Form data received: {dict(request.form)}")
+
+        # Extract and validate form data
+        baseline_mean = validate_numeric_input(
+            request.form.get("baseline_mean"), "Baseline mean", min_val=0
+        )
+
+        baseline_std = validate_numeric_input(
+            request.form.get("baseline_std"),
+            "Baseline standard deviation",
+            min_val=0,
+            allow_none=True,
+        )
+
+        sample_size = validate_numeric_input(
+            request.form.get("sample_size_per_group"),
+            "Sample size per group",
+            min_val=2,
+        )
+        if not sample_size.is_integer():
+            raise ValueError("Sample size per group must be a whole number")
+        sample_size = int(sample_size)
+
+        power = validate_numeric_input(
+            request.form.get("power"), "Statistical power", min_val=0.01, max_val=0.99
+        )
+
+        alpha = validate_numeric_input(
+            request.form.get("alpha"), "Significance level", min_val=0.001, max_val=0.5
+        )
+
+        test_type = request.form.get("test_type")
+        if test_type not in ["two-sided", "one-sided"]:
+            raise ValueError("Test type must be 'two-sided' or 'one-sided'")
+
+        expected_improvement = validate_numeric_input(
+            request.form.get("relative_improvement"),
+            "Expected relative improvement (%)",
+            min_val=-100,
+            max_val=1000,
+            allow_none=True,
+        )
+        if expected_improvement == 0:
+            raise ValueError("Expected relative improvement must be non-zero")
+
+        logger.info(
+            f"Validated inputs: baseline_mean={baseline_mean}, baseline_std={baseline_std}, sample_size={sample_size}, power={power}, alpha={alpha}"
+        )
+
+        results = minimum_detectable_effect(
+            sample_size, baseline_mean, baseline_std, power, alpha, test_type
+        )
+
+        # Power and MDE curves: one array evaluation each
+        curve_sizes = [max(2, round(sample_size * m)) for m in POWER_CURVE_MULTIPLIERS]
+        curve_improvement = (
+            expected_improvement
+            if expected_improvement is not None
+            else results["relative_mde"]
+        )
+        curve_power = achieved_power(
+            curve_sizes,
+            baseline_mean,
+            baseline_std,
+            "relative",
+            curve_improvement,
+            alpha,
+            test_type,
+        )["power"]
+        curve_mde = minimum_detectable_effect(
+            curve_sizes, baseline_mean, baseline_std, power, alpha, test_type
+        )["relative_mde"]
+        power_curve = [
+            {"n": n, "power": float(p), "relative_mde": float(mde)}
+            for n, p, mde in zip(curve_sizes, curve_power, curve_mde)
+        ]
+
+        logger.info("Minimum detectable effect calculation completed successfully")
+        return render_template(
+            "power_calculator_results.html",
+            expected_improvement=expected_improvement,
+            curve_improvement=curve_improvement,
+            power_curve=power_curve,
+            **results,
+        )
+
+    except Exception as e:
+        error_context = {
+            "route": "/calculate-mde",
+            "form_data": dict(request.form),
+            "error_type": type(e).__name__,
+        }
+        log_error(e, error_context)
+        return render_template(
+            "error.html", error_message=str(e), back_url="/power-calculator"
+        )
+
+
+@app.route("/api/minimum-detectable-effect", methods=["POST"])
+def api_minimum_detectable_effect():
+    payload = request.get_json(silent=True) or {}
+    try:
+        test_type = payload.get("test_type", "two-sided")
+        if test_type not in ["two-sided", "one-sided"]:
+            raise ValueError("Test type must be 'two-sided' or 'one-sided'")
+
+        results = minimum_detectable_effect(
+            parse_json_numeric(
+                payload, "sample_size_per_group", "Sample size per group"
+            ),
+            parse_json_numeric(payload, "baseline_mean", "Baseline mean"),
+            parse_json_numeric(
+                payload,
+                "baseline_std",
+                "Baseline standard deviation",
+                allow_none=True,
+            ),
+            parse_json_numeric(payload, "power", "Statistical power"),
+            parse_json_numeric(payload, "alpha", "Significance level"),
+            test_type,
+        )
+        return jsonify(to_json_results(results))
+
+    except Exception as e:
+        log_error(e, {"route": "/api/minimum-detectable-effect", "json": payload})
+        return jsonify({"error": str(e)}), 400
+
+
+@app.route("/api/achieved-power", methods=["POST"])
+def api_achieved_power():
+    payload = request.get_json(silent=True) or {}
+    try:
+        test_type = payload.get("test_type", "two-sided")
+        if test_type not in ["two-sided", "one-sided"]:
+            raise ValueError("Test type must be 'two-sided' or 'one-sided'")
+
+        improvement_type = payload.get("improvement_type", "relative")
+        if improvement_type not in ["absolute", "relative"]:
+            raise ValueError("Improvement type must be 'absolute' or 'relative'")
+
+        results = achieved_power(
+            parse_json_numeric(
+                payload, "sample_size_per_group", "Sample size per group"
+            ),
+            parse_json_numeric(payload, "baseline_mean", "Baseline mean"),
+            parse_json_numeric(
+                payload,
+                "baseline_std",
+                "Baseline standard deviation",
+                allow_none=True,
+            ),
+            improvement_type,
+            parse_json_numeric(payload, "improvement_value", "Improvement value"),
+            parse_json_numeric(payload, "alpha", "Significance level"),
+            test_type,
+        )
+        return jsonify(to_json_results(results))
+
+    except Exception as e:
+        log_error(e, {"route": "/api/achieved-power", "json": payload})
+        return jsonify({"error": str(e)}), 400
+
+
+@app.route("/api/segmented-std", methods=["POST"])
+def api_segmented_std():
+    payload = request.get_json(silent=True) or {}
+    try:
+        segments = payload.get("segments")
+        values = payload.get("values")
+        if not isinstance(segments, list) or not isinstance(values, list):
+            raise ValueError("segments and values must be lists")
+        if len(segments) != len(values):
+            raise ValueError("segments and values must have the same length")
+        values = parse_json_numeric(payload, "values", "Values")
+
+        results = calculate_segmented_std(
+            (str(segment), value) for segment, value in zip(segments, values)
+        )
+        return jsonify(to_json_results(results))
+
+    except Exception as e:
+        log_error(e, {"route": "/api/segmented-std"})
+        return jsonify({"error": str(e)}), 400
+
+
 @app.route("/sequential-calculator")
 def sequential_calculator():
-    return render_template("msprt_form.html")
+    return render_template("msprt_form.html", prefill=request.args)
 
 
 @app.route("/calculate-msprt", methods=["POST"])
@@ -313,21 +560,8 @@ def calculate_std_from_data_route():
 
         logger.debug(f"Raw data input: {data_input}")
 
-        # Handle different input formats
-        data_points = []
         try:
-            if "," in data_input:
-                data_points = [
-                    float(x.strip()) for x in data_input.split(",") if x.strip()
-                ]
-            elif "\n" in data_input:
-                data_points = [
-                    float(x.strip()) for x in data_input.split("\n") if x.strip()
-                ]
-            else:
-                data_points = [
-                    float(x.strip()) for x in data_input.split() if x.strip()
-                ]
+            data_points = parse_numbers(data_input)
         except ValueError as e:
             raise ValueError(
                 f"Invalid data format. All values must be numbers. Error: {str(e)}"
@@ -340,9 +574,31 @@ def calculate_std_from_data_route():
 
         logger.info(f"Parsed {len(data_points)} data points")
 
-        results = calculate_std_from_data(data_points)
+        include_percentiles = request.form.get("include_percentiles") == "on"
+        results = calculate_std_from_data(data_points, percentiles=include_percentiles)
+
+        robust = None
+        if request.form.get("robust_std") == "on":
+            robust = calculate_robust_std(data_points)
+
+        bootstrap = None
+        if request.form.get("bootstrap_ci") == "on":
+            if len(data_points) < 3:
+                raise ValueError("At least 3 data points are required for a bootstrap")
+            bootstrap = bootstrap_std_ci(data_points, time_budget=BOOTSTRAP_TIME_BUDGET)
+            logger.info(
+                f"Bootstrap used {bootstrap['resamples']} resamples "
+                f"({bootstrap['stop_reason']})"
+            )
+
         logger.info("Std calculation from data completed successfully")
-        return render_template("std_calculator_results.html", method="data", **results)
+        return render_template(
+            "std_calculator_results.html",
+            method="data",
+            bootstrap=bootstrap,
+            robust=robust,
+            **results,
+        )
 
     except Exception as e:
         error_context = {
@@ -356,6 +612,107 @@ def calculate_std_from_data_route():
         )
 
 
+@app.route("/calculate-std-from-upload", methods=["POST"])
+def calculate_std_from_upload_route():
+    """
+    Std calculation from an uploaded metric file
+
+    Accepts CSV/TSV (optionally gzip-compressed), .npy, raw little-endian
+    float64 or Parquet (with pyarrow) files, either as a multipart form
+    with a data_file field or as the raw request body with options
+    (file_format, column, delimiter, include_percentiles, segment_column)
+    in the query string. With a segment_column (CSV/TSV only) statistics
+    are reported per segment. The body is read in chunks into a one-pass
+    accumulator.
+    """
+    try:
+        logger.info("Starting std calculation from uploaded file")
+
+        if request.mimetype == "multipart/form-data":
+            upload = request.files.get("data_file")
+            if upload is None or not upload.filename:
+                raise ValueError("Please choose a file to upload")
+            stream = upload.stream
+            filename = upload.filename
+            options = request.form
+        else:
+            stream = request.stream
+            filename = None
+            options = request.args
+
+        file_format = options.get("file_format", "auto")
+        if file_format not in ("auto", "csv", "npy", "float64", "parquet"):
+            raise ValueError(
+                "File format must be 'auto', 'csv', 'npy', 'float64' or 'parquet'"
+            )
+        if file_format == "auto":
+            file_format = binary_format_for(filename) or "csv"
+        percentiles = options.get("include_percentiles") == "on"
+
+        if file_format == "csv":
+            delimiter = options.get("delimiter", "auto")
+            if delimiter != "auto" and delimiter not in DELIMITERS:
+                raise ValueError(
+                    "Delimiter must be 'auto', 'comma', 'tab' or 'semicolon'"
+                )
+
+            segment_column = options.get("segment_column", "").strip()
+            if segment_column:
+                segment_column, column, rows = read_segmented_column(
+                    stream,
+                    segment_column,
+                    options.get("column", "").strip(),
+                    DELIMITERS.get(delimiter),
+                )
+                logger.info(f"Reading column {column} by {segment_column}")
+                results = calculate_segmented_std(rows)
+                logger.info(f"Std calculation for {results.n_segments} segments")
+                return render_template(
+                    "std_calculator_results.html",
+                    method="segments",
+                    segment_column=segment_column,
+                    source_column=column,
+                    **results,
+                )
+
+            column, values = read_delimited_column(
+                stream, options.get("column", "").strip(), DELIMITERS.get(delimiter)
+            )
+            logger.info(f"Reading column {column}")
+            results = calculate_std_from_stream(values, percentiles=percentiles)
+        elif file_format == "parquet":
+            column = options.get("column", "").strip()
+            if not column:
+                raise ValueError("Choose the column to read from the Parquet file")
+            results = calculate_std_from_chunks(
+                iter_parquet_columns(stream, column), percentiles=percentiles
+            )
+        else:
+            column = None
+            results = calculate_std_from_chunks(
+                iter_float64_stream(stream, file_format), percentiles=percentiles
+            )
+
+        logger.info(f"Std calculation from {results.n} uploaded values completed")
+        return render_template(
+            "std_calculator_results.html",
+            method="data",
+            source_column=column,
+            **results,
+        )
+
+    except Exception as e:
+        error_context = {
+            "route": "/calculate-std-from-upload",
+            "content_type": request.content_type,
+            "error_type": type(e).__name__,
+        }
+        log_error(e, error_context)
+        return render_template(
+            "error.html", error_message=str(e), back_url="/std-calculator"
+        )
+
+
 @app.route("/calculate-std-from-range", methods=["POST"])
 def calculate_std_from_range_route():
     try:
@@ -379,9 +736,10 @@ def calculate_std_from_range_route():
 
         results = estimate_std_from_range(min_val, max_val, method)
         logger.info("Std calculation from range completed successfully")
-        # Rename the 'method' key in results to avoid conflict with template parameter
-        results["estimation_method"] = results.pop("method", "")
-        return render_template("std_calculator_results.html", method="range", **results)
+        # Rename the 'method' field to avoid conflict with template parameter
+        fields = results.to_dict()
+        fields["estimation_method"] = fields.pop("method", "")
+        return render_template("std_calculator_results.html", method="range", **fields)
 
     except Exception as e:
         error_context = {
@@ -456,33 +814,15 @@ def calculate_conversion_rate_std_route():
             logger.debug(f"Conversions input: {conversions_input}")
             logger.debug(f"Visitors input: {visitors_input}")
 
-            # Parse conversions
             try:
-                if "," in conversions_input:
-                    conversions = [
-                        int(x.strip())
-                        for x in conversions_input.split(",")
-                        if x.strip()
-                    ]
-                else:
-                    conversions = [
-                        int(x.strip()) for x in conversions_input.split() if x.strip()
-                    ]
+                conversions = parse_numbers(conversions_input, integers=True)
             except ValueError as e:
                 raise ValueError(
                     f"Invalid conversions format. All values must be integers. Error: {str(e)}"
                 )
 
-            # Parse visitors
             try:
-                if "," in visitors_input:
-                    visitors = [
-                        int(x.strip()) for x in visitors_input.split(",") if x.strip()
-                    ]
-                else:
-                    visitors = [
-                        int(x.strip()) for x in visitors_input.split() if x.strip()
-                    ]
+                visitors = parse_numbers(visitors_input, integers=True)
             except ValueError as e:
                 raise ValueError(
                     f"Invalid visitors format. All values must be integers. Error: {str(e)}"
@@ -509,7 +849,9 @@ def calculate_conversion_rate_std_route():
 
             logger.info(f"Parsed {len(conversions)} conversion/visitor pairs")
 
-            results = calculate_std_from_conversion_data(conversions, visitors)
+            results = calculate_std_from_conversion_data(
+                conversions, visitors, return_rates=False
+            )
             logger.info(
                 "Conversion rate std calculation from historical data completed successfully"
             )
@@ -540,10 +882,10 @@ def calculate_conversion_rate_std_route():
                 "Theoretical conversion rate std calculation completed successfully"
             )
             # Add estimated_std for template compatibility
-            results["estimated_std"] = results["std_dev"]
             return render_template(
                 "std_calculator_results.html",
                 method="conversion_theoretical",
+                estimated_std=results.std_dev,
                 **results,
             )
 
@@ -559,6 +901,87 @@ def calculate_conversion_rate_std_route():
         )
 
 
+@app.route("/calculate-conversion-std-from-upload", methods=["POST"])
+def calculate_conversion_std_from_upload_route():
+    """Conversion rate std from conversions/visitors columns of a Parquet file"""
+    try:
+        logger.info("Starting conversion rate std calculation from uploaded file")
+
+        upload = request.files.get("data_file")
+        if upload is None or not upload.filename:
+            raise ValueError("Please choose a file to upload")
+        if binary_format_for(upload.filename) != "parquet":
+            raise ValueError("Conversion data uploads must be Parquet (.parquet) files")
+
+        columns = [
+            request.form.get("conversions_column", "").strip(),
+            request.form.get("visitors_column", "").strip(),
+        ]
+        if not all(columns):
+            raise ValueError("Both conversions and visitors columns are required")
+
+        results = calculate_std_from_conversion_chunks(
+            iter_parquet_columns(upload.stream, columns)
+        )
+        logger.info(
+            f"Conversion rate std from {results.n_periods} uploaded periods completed"
+        )
+        return render_template(
+            "std_calculator_results.html", method="conversion_data", **results
+        )
+
+    except Exception as e:
+        error_context = {
+            "route": "/calculate-conversion-std-from-upload",
+            "form_data": dict(request.form),
+            "error_type": type(e).__name__,
+        }
+        log_error(e, error_context)
+        return render_template(
+            "error.html", error_message=str(e), back_url="/std-calculator"
+        )
+
+
+@app.route("/calculate-ratio-metric-std", methods=["POST"])
+def calculate_ratio_metric_std_route():
+    try:
+        logger.info("Starting ratio metric std calculation")
+
+        numerators_input = request.form.get("numerators", "").strip()
+        denominators_input = request.form.get("denominators", "").strip()
+        if not numerators_input or not denominators_input:
+            raise ValueError("Both numerator and denominator data are required")
+
+        try:
+            numerators = parse_numbers(numerators_input)
+        except ValueError as e:
+            raise ValueError(f"Invalid numerator format. Error: {str(e)}")
+        try:
+            denominators = parse_numbers(denominators_input)
+        except ValueError as e:
+            raise ValueError(f"Invalid denominator format. Error: {str(e)}")
+
+        if len(numerators) != len(denominators):
+            raise ValueError(
+                "Number of numerator values must match number of denominator values"
+            )
+
+        results = calculate_ratio_metric_std(zip(numerators, denominators))
+        logger.info(f"Ratio metric std from {results.n} users completed")
+        return render_template("std_calculator_results.html", method="ratio", **results)
+
+    except Exception as e:
+        error_context = {
+            "route": "/calculate-ratio-metric-std",
+            "form_data": dict(request.form),
+            "error_type": type(e).__name__,
+        }
+        log_error(e, error_context)
+        return render_template(
+            "error.html", error_message=str(e), back_url="/std-calculator"
+        )
+
+
 @app.route("/robots.txt")
 def robots_txt():
     """Serve robots.txt file"""
@@ -0,0 +1,231 @@
+"""
+Vectorized bootstrap confidence intervals for the std, mean and median
+"""
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .statistics import norm_cdf, norm_ppf
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required here, checked when a bootstrap starts
+    np = None
+
+DEFAULT_SHARD_SIZE = 250
+
+# Resample matrix cells per block (32 MiB of indices), bounding memory per block
+BLOCK_CELLS = 1 << 22
+
+# Replicates needed before the intervals are checked for stability
+MIN_STABLE_RESAMPLES = 1000
+
+STATISTICS = ("std_dev", "mean", "median")
+
+
+def _bootstrap_shard(data, seed_sequence, size):
+    """
+    std, mean and median of size resamples, drawn as index-matrix blocks
+
+    Each block is a (rows, n) matrix of resample indices; the statistics are
+    reduced along axis 1, so every replicate in the block is computed at once.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    n = data.size
+    rows = max(1, min(size, BLOCK_CELLS // n))
+    replicates = {name: np.empty(size) for name in STATISTICS}
+    for start in range(0, size, rows):
+        stop = min(start + rows, size)
+        sample = data[rng.integers(0, n, (stop - start, n))]
+        replicates["std_dev"][start:stop] = sample.std(axis=1, ddof=1)
+        replicates["mean"][start:stop] = sample.mean(axis=1)
+        replicates["median"][start:stop] = np.median(sample, axis=1)
+    return replicates
+
+
+def _jackknife_std(data):
+    """Leave-one-out sample standard deviations in O(n)"""
+    n = data.size
+    centered = data - data.mean()
+    total_sq = np.dot(centered, centered)
+    # Removing x_i shifts the mean by -c_i / (n - 1)
+    m2 = total_sq - centered**2 * n / (n - 1)
+    return np.sqrt(np.maximum(m2, 0.0) / (n - 2))
+
+
+def _percentile_interval(replicates, confidence):
+    tail = (1 - confidence) / 2
+    lower, upper = np.quantile(replicates, [tail, 1 - tail])
+    return float(lower), float(upper)
+
+
+def _bca_interval(replicates, observed, jackknife, confidence):
+    """
+    Bias-corrected and accelerated interval (Efron 1987)
+
+    Bias correction z0 comes from the share of replicates below the observed
+    value, acceleration from the skewness of the jackknife values.
+    """
+    below = np.mean(replicates < observed) + 0.5 * np.mean(replicates == observed)
+    below = min(max(below, 0.5 / replicates.size), 1 - 0.5 / replicates.size)
+    z0 = norm_ppf(below)
+
+    deviations = jackknife.mean() - jackknife
+    spread = np.sum(deviations**2)
+    acceleration = np.sum(deviations**3) / (6 * spread**1.5) if spread > 0 else 0.0
+
+    tail = (1 - confidence) / 2
+    levels = []
+    for z in (norm_ppf(tail), norm_ppf(1 - tail)):
+        adjusted = z0 + (z0 + z) / (1 - acceleration * (z0 + z))
+        levels.append(norm_cdf(adjusted))
+    lower, upper = np.quantile(replicates, levels)
+    return float(lower), float(upper)
+
+
+def iter_bootstrap(
+    data, n_resamples=2000, seed=None, workers=1, shard_size=DEFAULT_SHARD_SIZE
+):
+    """
+    Stream bootstrap replicates of the std, mean and median, one shard at a time
+
+    Shards are vectorized NumPy index-matrix blocks; with workers > 1 they run
+    in a process pool. Each shard draws from its own child of
+    SeedSequence(seed), so replicates depend only on seed and shard_size,
+    never on the number of workers. Closing the generator early cancels the
+    shards not yet started.
+
+    Args:
+        data: Sequence of at least 3 numbers
+        n_resamples: Maximum number of bootstrap replicates
+        seed: Seed for reproducible results (None for fresh entropy)
+        workers: Number of worker processes (1 runs in-process)
+        shard_size: Replicates per shard
+
+    Yields:
+        dict: Arrays of replicates for std_dev, mean and median in each shard
+    """
+    if np is None:
+        raise ImportError("Bootstrap confidence intervals require NumPy")
+    data = np.asarray(data, dtype=float).ravel()
+    if data.size < 3:
+        raise ValueError("Need at least 3 data points for a bootstrap")
+    if n_resamples < 1:
+        raise ValueError("Number of resamples must be at least 1")
+    if shard_size < 1:
+        raise ValueError("Shard size must be at least 1")
+    if workers < 1:
+        raise ValueError("Workers must be at least 1")
+
+    sizes = [shard_size] * (n_resamples // shard_size)
+    if n_resamples % shard_size:
+        sizes.append(n_resamples % shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    futures = []
+    try:
+        if executor is None:
+            shards = map(_bootstrap_shard, [data] * len(sizes), seeds, sizes)
+        else:
+            futures = [
+                executor.submit(_bootstrap_shard, data, shard_seed, size)
+                for shard_seed, size in zip(seeds, sizes)
+            ]
+            shards = (future.result() for future in futures)
+        yield from shards
+    finally:
+        if executor is not None:
+            # Shards not yet started are dropped (cancel_futures needs 3.9+)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+def bootstrap_std_ci(
+    data,
+    confidence=0.95,
+    n_resamples=2000,
+    seed=None,
+    workers=1,
+    shard_size=DEFAULT_SHARD_SIZE,
+    time_budget=None,
+    tolerance=0.005,
+):
+    """
+    Bootstrap confidence intervals for the standard deviation of a metric
+
+    Replicates are drawn shard by shard until n_resamples is reached, the
+    time budget runs out, or (after MIN_STABLE_RESAMPLES) the percentile
+    interval for the std moves by less than tolerance * std between shards.
+
+    Args:
+        data: Sequence of at least 3 numbers
+        confidence: Confidence level of the intervals
+        n_resamples: Maximum number of bootstrap replicates
+        seed: Seed for reproducible results (None for fresh entropy)
+        workers: Number of worker processes (1 runs in-process)
+        shard_size: Replicates per shard
+        time_budget: Seconds after which the replicates so far are used
+            (optional; at least one shard always completes)
+        tolerance: Relative interval movement treated as stable (None to
+            always draw n_resamples)
+
+    Returns:
+        dict: std_dev with percentile and BCa intervals (std_ci_percentile,
+            std_ci_bca), percentile intervals for the mean and median, the
+            number of resamples used and why sampling stopped
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("Confidence must be between 0 and 1")
+
+    start = time.monotonic()
+    data = np.asarray(data, dtype=float).ravel() if np is not None else data
+    shards = iter_bootstrap(data, n_resamples, seed, workers, shard_size)
+    collected = {name: [] for name in STATISTICS}
+    observed_std = None
+    previous = None
+    stop_reason = "completed"
+    resamples = 0
+    try:
+        for shard in shards:
+            if observed_std is None:
+                observed_std = float(data.std(ddof=1))
+            for name in STATISTICS:
+                collected[name].append(shard[name])
+            resamples += shard["std_dev"].size
+
+            if resamples >= n_resamples:
+                break
+            if time_budget is not None and time.monotonic() - start >= time_budget:
+                stop_reason = "time_budget"
+                break
+            if tolerance is not None and resamples >= MIN_STABLE_RESAMPLES:
+                interval = _percentile_interval(
+                    np.concatenate(collected["std_dev"]), confidence
+                )
+                if previous is not None and max(
+                    abs(a - b) for a, b in zip(interval, previous)
+                ) <= tolerance * max(observed_std, sys.float_info.epsilon):
+                    stop_reason = "stable"
+                    break
+                previous = interval
+    finally:
+        shards.close()
+
+    replicates = {name: np.concatenate(values) for name, values in collected.items()}
+    std_replicates = replicates["std_dev"]
+    return {
+        "std_dev": observed_std,
+        "confidence": confidence,
+        "std_ci_percentile": _percentile_interval(std_replicates, confidence),
+        "std_ci_bca": _bca_interval(
+            std_replicates, observed_std, _jackknife_std(data), confidence
+        ),
+        "std_se": float(std_replicates.std(ddof=1)) if resamples > 1 else 0.0,
+        "mean_ci_percentile": _percentile_interval(replicates["mean"], confidence),
+        "median_ci_percentile": _percentile_interval(replicates["median"], confidence),
+        "resamples": resamples,
+        "stop_reason": stop_reason,
+        "elapsed": time.monotonic() - start,
+    }
@@ -0,0 +1,275 @@
+"""
+Weekly mSPRT status for many experiments in one vectorized pass
+"""
+import csv
+import json
+from itertools import islice
+
+from .msprt import WeekStatus, _week_status_text
+from .statistics import norm_ppf_batch, t_ppf_batch
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required here, checked when a batch is evaluated
+    np = None
+
+INPUT_FIELDS = (
+    "baseline_mean",
+    "baseline_std",
+    "absolute_improvement",
+    "alpha",
+    "weekly_visitors",
+    "week",
+)
+
+OUTPUT_FIELDS = (
+    "experiment_id",
+    "week",
+    "n",
+    "boundary_upper",
+    "boundary_lower",
+    "status",
+    "status_label",
+    "explanation",
+)
+
+DEFAULT_CHUNK_SIZE = 10000
+
+_STATUS_CODES = (
+    WeekStatus.SIGNIFICANT_IMPROVEMENT,
+    WeekStatus.SIGNIFICANT_DECLINE,
+    WeekStatus.KEEP_TESTING,
+)
+
+_TRUE_VALUES = ("1", "true", "yes", "y", "t")
+_FALSE_VALUES = ("", "0", "false", "no", "n", "f")
+
+
+def _check_rows(invalid, message, first_row):
+    """Raise ValueError naming the first experiment where invalid is set"""
+    if np.any(invalid):
+        row = first_row + int(np.argmax(invalid)) + 1
+        raise ValueError(f"Experiment {row}: {message}")
+
+
+def evaluate_experiments(experiments, explanations=True, first_row=0):
+    """
+    Evaluate the current week of many experiments at once
+
+    Gives the same boundaries and statuses as calling determine_week_status
+    once per experiment, but computes them as whole-column NumPy operations;
+    t critical values are solved once per distinct (df, alpha) pair.
+
+    Args:
+        experiments: Dict of equal-length columns: baseline_mean,
+            baseline_std (adjusted for variance inflation),
+            absolute_improvement, alpha, weekly_visitors and week; optional
+            use_t_test (bool per experiment) and experiment_id (passed through)
+        explanations: Also build the display label and explanation text
+        first_row: Offset added to row numbers in error messages
+
+    Returns:
+        dict: Columns week, n, boundary_upper, boundary_lower and status
+            (WeekStatus values), plus experiment_id, status_label and
+            explanation when available
+    """
+    if np is None:
+        raise ImportError("Bulk monitoring requires NumPy")
+
+    missing = [field for field in INPUT_FIELDS if field not in experiments]
+    if missing:
+        raise ValueError(f"Missing experiment fields: {', '.join(missing)}")
+
+    columns = {
+        field: np.asarray(experiments[field], dtype=float) for field in INPUT_FIELDS
+    }
+    size = columns["week"].size
+    if any(column.shape != (size,) for column in columns.values()):
+        raise ValueError("Experiment fields must be equal-length sequences")
+
+    baseline_mean = columns["baseline_mean"]
+    baseline_std = columns["baseline_std"]
+    delta = columns["absolute_improvement"]
+    alpha = columns["alpha"]
+    week = columns["week"]
+    n = columns["weekly_visitors"] * week
+
+    _check_rows(
+        ~np.isfinite(baseline_mean), "baseline mean must be a number", first_row
+    )
+    _check_rows(~(baseline_mean > 0), "baseline mean must be positive", first_row)
+    _check_rows(~(baseline_std > 0), "standard deviation must be positive", first_row)
+    _check_rows(~np.isfinite(delta), "improvement must be a number", first_row)
+    _check_rows(
+        ~((alpha > 0) & (alpha < 1)), "alpha must be between 0 and 1", first_row
+    )
+    _check_rows(
+        ~(columns["weekly_visitors"] > 0), "weekly visitors must be positive", first_row
+    )
+    _check_rows(~(week >= 1), "week must be at least 1", first_row)
+    _check_rows(np.mod(week, 1) != 0, "week must be a whole number", first_row)
+
+    # Same arithmetic as calculate_boundary_at_sample_size
+    se = baseline_std * np.sqrt(2 / n)
+    critical = norm_ppf_batch(1 - alpha / 2)
+    use_t_test = np.asarray(experiments.get("use_t_test", np.zeros(size, bool)), bool)
+    if np.any(use_t_test):
+        df = 2 * n[use_t_test] - 2
+        invalid = np.zeros(size, bool)
+        invalid[use_t_test] = df <= 0
+        _check_rows(
+            invalid,
+            "t-test boundaries need more than one observation per group",
+            first_row,
+        )
+        critical[use_t_test] = t_ppf_batch(df, 1 - alpha[use_t_test] / 2)
+    boundary = critical * se
+
+    detectable = np.abs(delta) >= boundary
+    index = np.where(detectable, np.where(delta > 0, 0, 1), 2)
+    status = np.array([code.value for code in _STATUS_CODES])[index]
+
+    results = {
+        "week": week,
+        "n": n,
+        "boundary_upper": boundary,
+        "boundary_lower": -boundary,
+        "status": status,
+    }
+    if "experiment_id" in experiments:
+        results["experiment_id"] = list(experiments["experiment_id"])
+    if explanations:
+        text = [
+            _week_status_text(d, b, m)
+            for d, b, m in zip(
+                delta.tolist(), boundary.tolist(), baseline_mean.tolist()
+            )
+        ]
+        results["status_label"] = [label for label, _ in text]
+        results["explanation"] = [explanation for _, explanation in text]
+    return results
+
+
+def _parse_bool(value, row):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Experiment {row}: invalid value for use_t_test")
+
+
+def _rows_to_columns(rows, first_row):
+    """Turn parsed records (dicts) into the columns evaluate_experiments takes"""
+    columns = {field: [] for field in INPUT_FIELDS}
+    ids, use_t_test = [], []
+    for offset, row in enumerate(rows):
+        number = first_row + offset + 1
+        for field in INPUT_FIELDS:
+            value = row.get(field)
+            try:
+                columns[field].append(float(value))
+            except (TypeError, ValueError):
+                raise ValueError(f"Experiment {number}: invalid value for {field}")
+        ids.append(row.get("experiment_id", number))
+        use_t_test.append(_parse_bool(row.get("use_t_test", False), number))
+
+    columns["experiment_id"] = ids
+    columns["use_t_test"] = use_t_test
+    return columns
+
+
+def read_csv_records(stream):
+    """Yield one dict per CSV row from a text stream with a header line"""
+    reader = csv.DictReader(stream)
+    missing = [
+        field for field in INPUT_FIELDS if field not in (reader.fieldnames or ())
+    ]
+    if missing:
+        raise ValueError(f"Missing experiment fields: {', '.join(missing)}")
+    yield from reader
+
+
+def read_json_records(stream):
+    """Yield one dict per line from a JSON Lines text stream (blank lines skipped)"""
+    for number, line in enumerate(stream, 1):
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                raise ValueError(f"Line {number}: invalid JSON")
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {number}: expected a JSON object")
+            yield record
+
+
+def _output_rows(results):
+    """Yield output records in OUTPUT_FIELDS order with plain Python values"""
+    for i in range(len(results["status"])):
+        n = float(results["n"][i])
+        yield {
+            "experiment_id": results["experiment_id"][i],
+            "week": int(results["week"][i]),
+            "n": int(n) if n.is_integer() else n,
+            "boundary_upper": float(results["boundary_upper"][i]),
+            "boundary_lower": float(results["boundary_lower"][i]),
+            "status": str(results["status"][i]),
+            "status_label": results["status_label"][i],
+            "explanation": results["explanation"][i],
+        }
+
+
+_READERS = {"csv": read_csv_records, "json": read_json_records}
+
+
+def evaluate_stream(
+    input_stream,
+    output_stream,
+    input_format="csv",
+    output_format=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """
+    Evaluate experiments from a text stream and write results as they are ready
+
+    Input is read, evaluated and written chunk_size experiments at a time,
+    so memory stays bounded and run time is linear in the number of rows.
+
+    Args:
+        input_stream: Text stream of CSV (with header) or JSON Lines records
+        output_stream: Writable text stream
+        input_format: 'csv' or 'json' (JSON Lines)
+        output_format: 'csv' or 'json' (defaults to input_format)
+        chunk_size: Experiments evaluated per vectorized batch
+
+    Returns:
+        int: Number of experiments evaluated
+    """
+    if input_format not in _READERS:
+        raise ValueError("Input format must be 'csv' or 'json'")
+    output_format = output_format or input_format
+    if output_format not in _READERS:
+        raise ValueError("Output format must be 'csv' or 'json'")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    records = _READERS[input_format](input_stream)
+    writer = None
+    if output_format == "csv":
+        writer = csv.DictWriter(output_stream, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+
+    count = 0
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return count
+        results = evaluate_experiments(_rows_to_columns(chunk, count), first_row=count)
+        for row in _output_rows(results):
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                output_stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+        count += len(chunk)
@@ -0,0 +1,440 @@
+"""
+Precomputed z and t critical values for the common alpha/power settings
+
+Generated by scripts/generate_critical_values.py - do not edit by hand.
+"""
+
+TABLE_VERSION = 1
+
+Z_CRITICAL = {
+    0.8: 0.8414567173547837,
+    0.85: 1.0364314851895609,
+    0.9: 1.281728756502709,
+    0.95: 1.645211440143815,
+    0.975: 1.9603949169253396,
+    0.99: 2.326785332558966,
+    0.995: 2.5762360813095704,
+}
+
+T_CRITICAL = {
+    (1, 0.8): 1.376381920471173,
+    (1, 0.85): 1.9626105055051488,
+    (1, 0.9): 3.077683537175252,
+    (1, 0.95): 6.313751514675031,
+    (1, 0.975): 12.706204736174685,
+    (1, 0.99): 31.820515953773914,
+    (1, 0.995): 63.656741162871484,
+    (2, 0.8): 1.0606601717798225,
+    (2, 0.85): 1.386206560167343,
+    (2, 0.9): 1.8856180831641265,
+    (2, 0.95): 2.919985580353723,
+    (2, 0.975): 4.302652729749461,
+    (2, 0.99): 6.964556734283271,
+    (2, 0.995): 9.92484320091829,
+    (3, 0.8): 0.9784723123633042,
+    (3, 0.85): 1.249778105033226,
+    (3, 0.9): 1.6377443536962102,
+    (3, 0.95): 2.353363434801822,
+    (3, 0.975): 3.1824463052837078,
+    (3, 0.99): 4.5407028585681335,
+    (3, 0.995): 5.840909309733353,
+    (4, 0.8): 0.9409645772351812,
+    (4, 0.85): 1.1895668524436942,
+    (4, 0.9): 1.5332062740589432,
+    (4, 0.95): 2.1318467863266495,
+    (4, 0.975): 2.776445105197794,
+    (4, 0.99): 3.7469473879791964,
+    (4, 0.995): 4.604094871349991,
+    (5, 0.8): 0.9195437802408284,
+    (5, 0.85): 1.155767342894294,
+    (5, 0.9): 1.4758840488244793,
+    (5, 0.95): 2.015048373333023,
+    (5, 0.975): 2.5705818356363137,
+    (5, 0.99): 3.364929998907218,
+    (5, 0.995): 4.032142983555226,
+    (6, 0.8): 0.9057032851805323,
+    (6, 0.85): 1.1341569306757573,
+    (6, 0.9): 1.4397557472651497,
+    (6, 0.95): 1.943180280515303,
+    (6, 0.975): 2.4469118511449692,
+    (6, 0.99): 3.142668403290983,
+    (6, 0.995): 3.7074280213247786,
+    (7, 0.8): 0.8960296443137638,
+    (7, 0.85): 1.1191591283613644,
+    (7, 0.9): 1.4149239276505077,
+    (7, 0.95): 1.8945786050900062,
+    (7, 0.975): 2.364624251592785,
+    (7, 0.99): 2.9979515668685277,
+    (7, 0.995): 3.4994832973504932,
+    (8, 0.8): 0.8888895177670201,
+    (8, 0.85): 1.1081454445582548,
+    (8, 0.9): 1.3968153097438656,
+    (8, 0.95): 1.8595480375308975,
+    (8, 0.975): 2.306004135204166,
+    (8, 0.99): 2.896459447709622,
+    (8, 0.995): 3.3553873313333953,
+    (9, 0.8): 0.8834038596855374,
+    (9, 0.85): 1.0997161963946607,
+    (9, 0.9): 1.3830287383966375,
+    (9, 0.95): 1.833112932656235,
+    (9, 0.975): 2.2621571627982036,
+    (9, 0.99): 2.8214379250258084,
+    (9, 0.995): 3.2498355415921254,
+    (10, 0.8): 0.8790578285505882,
+    (10, 0.85): 1.0930580735905258,
+    (10, 0.9): 1.372183641110333,
+    (10, 0.95): 1.812461122811678,
+    (10, 0.975): 2.2281388519862744,
+    (10, 0.99): 2.7637694581126966,
+    (10, 0.995): 3.169272672616951,
+    (11, 0.8): 0.8755299780738821,
+    (11, 0.85): 1.0876663803503819,
+    (11, 0.9): 1.3634303180205394,
+    (11, 0.95): 1.7958848187040444,
+    (11, 0.975): 2.2009851600916392,
+    (11, 0.99): 2.7180791838138623,
+    (11, 0.995): 3.10580651553928,
+    (12, 0.8): 0.8726092915881417,
+    (12, 0.85): 1.0832114204565133,
+    (12, 0.9): 1.3562173340232135,
+    (12, 0.95): 1.7822875556493163,
+    (12, 0.975): 2.1788128296672267,
+    (12, 0.99): 2.680997993120912,
+    (12, 0.995): 3.0545395893928995,
+    (13, 0.8): 0.8701515339681705,
+    (13, 0.85): 1.079468737035889,
+    (13, 0.9): 1.350171288780048,
+    (13, 0.95): 1.7709333959868736,
+    (13, 0.975): 2.160368656462795,
+    (13, 0.99): 2.6503088379121924,
+    (13, 0.995): 3.0122758387165804,
+    (14, 0.8): 0.8680547815574211,
+    (14, 0.85): 1.0762802445838175,
+    (14, 0.9): 1.3450303744546528,
+    (14, 0.95): 1.7613101357748915,
+    (14, 0.975): 2.144786687917802,
+    (14, 0.99): 2.6244940675900517,
+    (14, 0.995): 2.976842734370833,
+    (15, 0.8): 0.8662449731949527,
+    (15, 0.85): 1.0735313955824222,
+    (15, 0.9): 1.3406056078504573,
+    (15, 0.95): 1.7530503556925734,
+    (15, 0.975): 2.1314495455597746,
+    (15, 0.99): 2.6024802950111234,
+    (15, 0.995): 2.9467128834752376,
+    (16, 0.8): 0.864667001798292,
+    (16, 0.85): 1.0711371632843147,
+    (16, 0.9): 1.336757167327313,
+    (16, 0.95): 1.7458836762762495,
+    (16, 0.975): 2.119905299221255,
+    (16, 0.99): 2.583487185275991,
+    (16, 0.995): 2.920781622425099,
+    (17, 0.8): 0.8632790174200523,
+    (17, 0.85): 1.0690331106211055,
+    (17, 0.9): 1.3333793897216326,
+    (17, 0.95): 1.7396067260750725,
+    (17, 0.975): 2.1098155778333174,
+    (17, 0.99): 2.566933983724716,
+    (17, 0.995): 2.898230519677417,
+    (18, 0.8): 0.862048667989594,
+    (18, 0.85): 1.0671695155355496,
+    (18, 0.9): 1.3303909435699086,
+    (18, 0.95): 1.7340636066175381,
+    (18, 0.975): 2.1009220402410373,
+    (18, 0.99): 2.5523796301822514,
+    (18, 0.995): 2.8784404727386077,
+    (19, 0.8): 0.8609505502689322,
+    (19, 0.85): 1.0655073985870143,
+    (19, 0.9): 1.3277282090268052,
+    (19, 0.95): 1.7291328115213669,
+    (19, 0.975): 2.0930240544083083,
+    (19, 0.99): 2.5394831906239608,
+    (19, 0.995): 2.860934606464978,
+    (20, 0.8): 0.8599644397323847,
+    (20, 0.85): 1.0640157711603966,
+    (20, 0.9): 1.3253407069850445,
+    (20, 0.95): 1.724718242920787,
+    (20, 0.975): 2.0859634472658652,
+    (20, 0.99): 2.5279770027415736,
+    (20, 0.995): 2.8453397097861095,
+    (21, 0.8): 0.8590740351948273,
+    (21, 0.85): 1.0626696881250395,
+    (21, 0.9): 1.3231878738651748,
+    (21, 0.95): 1.7207429028118775,
+    (21, 0.975): 2.07961384472768,
+    (21, 0.99): 2.51764801604474,
+    (21, 0.995): 2.831359558023049,
+    (22, 0.8): 0.8582660516582026,
+    (22, 0.85): 1.061448843380463,
+    (22, 0.9): 1.3212367416133557,
+    (22, 0.95): 1.7171443743802413,
+    (22, 0.975): 2.073873067904027,
+    (22, 0.99): 2.5083245528990803,
+    (22, 0.995): 2.8187560606001445,
+    (23, 0.8): 0.8575295536880363,
+    (23, 0.85): 1.0603365395897408,
+    (23, 0.9): 1.319460239816166,
+    (23, 0.95): 1.7138715277470464,
+    (23, 0.975): 2.0686576104190473,
+    (23, 0.99): 2.4998667394946676,
+    (23, 0.995): 2.807335683769998,
+    (24, 0.8): 0.8568554580756543,
+    (24, 0.85): 1.0593189207557077,
+    (24, 0.9): 1.317835933673147,
+    (24, 0.95): 1.7108820799094306,
+    (24, 0.975): 2.063898561628026,
+    (24, 0.99): 2.492159473157757,
+    (24, 0.995): 2.796939504774458,
+    (25, 0.8): 0.8562361576764744,
+    (25, 0.85): 1.0583843926109138,
+    (25, 0.9): 1.3163450726738812,
+    (25, 0.95): 1.7081407612518964,
+    (25, 0.975): 2.059538552753295,
+    (25, 0.99): 2.4851071754107594,
+    (25, 0.995): 2.787435813676969,
+    (26, 0.8): 0.8556652333281676,
+    (26, 0.85): 1.0575231793060733,
+    (26, 0.9): 1.3149718642705162,
+    (26, 0.95): 1.7056179197592736,
+    (26, 0.975): 2.055529438642875,
+    (26, 0.99): 2.4786298235912425,
+    (26, 0.995): 2.7787145333296808,
+    (27, 0.8): 0.855137230694288,
+    (27, 0.85): 1.0567269804196777,
+    (27, 0.9): 1.3137029128292772,
+    (27, 0.95): 1.7032884457221245,
+    (27, 0.975): 2.051830516480283,
+    (27, 0.99): 2.472659911956006,
+    (27, 0.995): 2.7706829571222102,
+    (28, 0.8): 0.8546474855822166,
+    (28, 0.85): 1.0559887027683132,
+    (28, 0.9): 1.3125267815926527,
+    (28, 0.95): 1.7011309342659353,
+    (28, 0.975): 2.0484071417952485,
+    (28, 0.99): 2.4671400979674742,
+    (28, 0.995): 2.763262455461447,
+    (29, 0.8): 0.8541919858818584,
+    (29, 0.85): 1.0553022486563102,
+    (29, 0.9): 1.3114336473015586,
+    (29, 0.95): 1.699127026533495,
+    (29, 0.975): 2.0452296421327016,
+    (29, 0.99): 2.4620213601504113,
+    (29, 0.995): 2.7563859036706035,
+    (30, 0.8): 0.8537672614713055,
+    (30, 0.85): 1.0546623471785703,
+    (30, 0.9): 1.3104150253914095,
+    (30, 0.95): 1.6972608865939536,
+    (30, 0.975): 2.0422724563012347,
+    (30, 0.99): 2.4572615424005892,
+    (30, 0.995): 2.749995653567222,
+    (31, 0.8): 0.8533702956969405,
+    (31, 0.85): 1.0540644187002874,
+    (31, 0.9): 1.3094635494946407,
+    (31, 0.95): 1.6955187825458669,
+    (31, 0.975): 2.0395134463964055,
+    (31, 0.99): 2.4528241934026456,
+    (31, 0.995): 2.7440419192942707,
+    (32, 0.8): 0.8529984536518814,
+    (32, 0.85): 1.0535044651435754,
+    (32, 0.9): 1.3085727931295097,
+    (32, 0.95): 1.6938887483837135,
+    (32, 0.975): 2.036933343460103,
+    (32, 0.99): 2.448677633672053,
+    (32, 0.995): 2.7384814820121903,
+    (33, 0.8): 0.8526494236479853,
+    (33, 0.85): 1.052978980524486,
+    (33, 0.9): 1.3077371244508993,
+    (33, 0.95): 1.6923603090303427,
+    (33, 0.975): 2.034515297449337,
+    (33, 0.99): 2.4447941998078027,
+    (33, 0.995): 2.7332766423508343,
+    (34, 0.8): 0.8523211691345095,
+    (34, 0.85): 1.0524848775103763,
+    (34, 0.9): 1.30695158712644,
+    (34, 0.95): 1.6909242551868535,
+    (34, 0.975): 2.032244509317717,
+    (34, 0.99): 2.44114962790648,
+    (34, 0.995): 2.728394367070717,
+    (35, 0.8): 0.8520118889509567,
+    (35, 0.85): 1.0520194267480578,
+    (35, 0.9): 1.306211802016018,
+    (35, 0.95): 1.6895724577802695,
+    (35, 0.975): 2.0301079282503456,
+    (35, 0.99): 2.4377225471437414,
+    (35, 0.995): 2.723805589208095,
+    (36, 0.8): 0.8517199842763905,
+    (36, 0.85): 1.0515802064450344,
+    (36, 0.9): 1.3055138855362605,
+    (36, 0.95): 1.6882977141168112,
+    (36, 0.975): 2.0280940009804462,
+    (36, 0.99): 2.4344940612311365,
+    (36, 0.995): 2.7194846304500055,
+    (37, 0.8): 0.8514440309945973,
+    (37, 0.85): 1.0511650602376912,
+    (37, 0.9): 1.304854381497623,
+    (37, 0.95): 1.6870936195962647,
+    (37, 0.975): 2.02619246302911,
+    (37, 0.99): 2.4314474004646742,
+    (37, 0.995): 2.7154087215499887,
+    (38, 0.8): 0.8511827564679463,
+    (38, 0.85): 1.0507720618004077,
+    (38, 0.9): 1.3042302038904912,
+    (38, 0.95): 1.6859544601667176,
+    (38, 0.975): 2.0243941639119694,
+    (38, 0.99): 2.4285676308590904,
+    (38, 0.995): 2.7115576019130856,
+    (39, 0.8): 0.8509350199201283,
+    (39, 0.85): 1.0503994849695033,
+    (39, 0.9): 1.3036385886212833,
+    (39, 0.95): 1.684875121711243,
+    (39, 0.975): 2.0226909200367604,
+    (39, 0.99): 2.4258414097356296,
+    (39, 0.995): 2.7079131835176606,
+    (40, 0.8): 0.8506997957904544,
+    (40, 0.85): 1.0500457784051458,
+    (40, 0.9): 1.3030770526072002,
+    (40, 0.95): 1.683851013335662,
+    (40, 0.975): 2.021075390306267,
+    (40, 0.99): 2.423256779334856,
+    (40, 0.995): 2.704459267433159,
+    (41, 0.8): 0.8504761595474599,
+    (41, 0.85): 1.0497095440071067,
+    (41, 0.9): 1.302543358953382,
+    (41, 0.95): 1.6828780021327048,
+    (41, 0.975): 2.019540970441375,
+    (41, 0.99): 2.4208029917290794,
+    (41, 0.995): 2.701181303578523,
+    (42, 0.8): 0.8502632755480687,
+    (42, 0.85): 1.0493895184509145,
+    (42, 0.9): 1.302035487182522,
+    (42, 0.95): 1.6819523574675408,
+    (42, 0.975): 2.0180817028184426,
+    (42, 0.99): 2.4184703596346346,
+    (42, 0.995): 2.698066186219981,
+    (43, 0.8): 0.8500603866063307,
+    (43, 0.85): 1.0490845573307284,
+    (43, 0.9): 1.3015516076821663,
+    (43, 0.95): 1.6810707032025185,
+    (43, 0.975): 2.016692199227825,
+    (43, 0.99): 2.4162501287629676,
+    (43, 0.995): 2.6951020791576745,
+    (44, 0.8): 0.8498668049974073,
+    (44, 0.85): 1.0487936214894347,
+    (44, 0.9): 1.30109005968881,
+    (44, 0.95): 1.6802299765721338,
+    (44, 0.975): 2.015367574443764,
+    (44, 0.99): 2.414134368168736,
+    (44, 0.995): 2.69227826569302,
+    (45, 0.8): 0.8496819046714754,
+    (45, 0.85): 1.0485157651918688,
+    (45, 0.9): 1.3006493322502386,
+    (45, 0.95): 1.6794273926523566,
+    (45, 0.975): 2.014103388880846,
+    (45, 0.99): 2.412115875703359,
+    (45, 0.995): 2.689585019374643,
+    (46, 0.8): 0.849505114491978,
+    (46, 0.85): 1.048250125857726,
+    (46, 0.9): 1.300228047706928,
+    (46, 0.95): 1.6786604135568524,
+    (46, 0.975): 2.0128955989194313,
+    (46, 0.99): 2.4101880962013804,
+    (46, 0.995): 2.687013492242216,
+    (47, 0.8): 0.8493359123442777,
+    (47, 0.85): 1.0479959151192686,
+    (47, 0.9): 1.299824947311658,
+    (47, 0.95): 1.677926721641846,
+    (47, 0.975): 2.011740513729765,
+    (47, 0.99): 2.4083450504434283,
+    (47, 0.995): 2.684555617866525,
+    (48, 0.8): 0.8491738199868843,
+    (48, 0.85): 1.0477524110086054,
+    (48, 0.9): 1.2994388786713904,
+    (48, 0.95): 1.6772241961243473,
+    (48, 0.975): 2.0106347576242323,
+    (48, 0.99): 2.406581273275608,
+    (48, 0.995): 2.6822040269502145,
+    (49, 0.8): 0.8490183985380746,
+    (49, 0.85): 1.0475189511116108,
+    (49, 0.9): 1.2990687847477536,
+    (49, 0.95): 1.6765508926168635,
+    (49, 0.975): 2.0095752371292397,
+    (49, 0.99): 2.4048917595376667,
+    (49, 0.995): 2.679951973631551,
+    (50, 0.8): 0.8488692445086735,
+    (50, 0.85): 1.0472949265516902,
+    (50, 0.9): 1.2987136941948187,
+    (50, 0.95): 1.675905025163111,
+    (50, 0.975): 2.0085591121007598,
+    (50, 0.99): 2.403271916674172,
+    (50, 0.995): 2.6777932709408434,
+    (51, 0.8): 0.8487259863048754,
+    (51, 0.85): 1.0470797766884012,
+    (51, 0.9): 1.2983727128483695,
+    (51, 0.95): 1.6752849504249019,
+    (51, 0.975): 2.007583770315836,
+    (51, 0.99): 2.4017175230846983,
+    (51, 0.995): 2.675722234110649,
+    (52, 0.8): 0.8485882811380013,
+    (52, 0.85): 1.0468729844337532,
+    (52, 0.9): 1.29804501620972,
+    (52, 0.95): 1.6746891537259725,
+    (52, 0.975): 2.006646805061694,
+    (52, 0.99): 2.400224691418385,
+    (52, 0.995): 2.673733630647224,
+    (53, 0.8): 0.8484558122864293,
+    (53, 0.85): 1.0466740721038625,
+    (53, 0.9): 1.2977298427910675,
+    (53, 0.95): 1.6741162367031202,
+    (53, 0.975): 2.0057459953178682,
+    (53, 0.99): 2.398789836141437,
+    (53, 0.995): 2.671822636241004,
+    (54, 0.8): 0.8483282866640944,
+    (54, 0.85): 1.04648259773573,
+    (54, 0.9): 1.2974264882090756,
+    (54, 0.95): 1.6735649063521807,
+    (54, 0.975): 2.0048792881880564,
+    (54, 0.99): 2.397409644808455,
+    (54, 0.995): 2.669984795734891,
+    (55, 0.8): 0.8482054326562426,
+    (55, 0.85): 1.0462981518097874,
+    (55, 0.9): 1.2971342999309299,
+    (55, 0.95): 1.6730339652898927,
+    (55, 0.975): 2.0040447832891486,
+    (55, 0.99): 2.3960810525533183,
+    (55, 0.995): 2.668215988486196,
+    (56, 0.8): 0.8480869981886952,
+    (56, 0.85): 1.046120354326675,
+    (56, 0.9): 1.2968526725898064,
+    (56, 0.95): 1.6725223030755825,
+    (56, 0.975): 2.003240718847873,
+    (56, 0.99): 2.394801219386565,
+    (56, 0.995): 2.6665123975560614,
+    (57, 0.8): 0.847972749001558,
+    (57, 0.85): 1.045948852194375,
+    (57, 0.9): 1.29658104379905,
+    (57, 0.95): 1.6720288884610222,
+    (57, 0.975): 2.002465459291,
+    (57, 0.99): 2.393567509945547,
+    (57, 0.995): 2.6648704822419664,
+    (58, 0.8): 0.8478624671030282,
+    (58, 0.85): 1.0457833168881232,
+    (58, 0.9): 1.2963188904044063,
+    (58, 0.95): 1.67155276245484,
+    (58, 0.975): 2.0017174841452383,
+    (58, 0.99): 2.3923774753936815,
+    (58, 0.995): 2.6632869535376593,
+    (59, 0.8): 0.847755949381376,
+    (59, 0.85): 1.0456234423505661,
+    (59, 0.9): 1.2960657251220318,
+    (59, 0.95): 1.6710930321038509,
+    (59, 0.975): 2.00099537808827,
+    (59, 0.99): 2.391228837207361,
+    (59, 0.995): 2.661758752162972,
+    (60, 0.8): 0.8476530063566099,
+    (60, 0.85): 1.0454689431031805,
+    (60, 0.9): 1.2958210935157426,
+    (60, 0.95): 1.6706488649046582,
+    (60, 0.975): 2.000297822014258,
+    (60, 0.99): 2.390119472624913,
+    (60, 0.995): 2.6602830288550354,
+}
@@ -4,11 +4,51 @@ Fixed horizon sample size calculations
 import logging
 import math
 
-from .statistics import calculate_effect_size, estimate_std_dev, norm_ppf
+from .results import ResultRecord, result_record
+from .statistics import (
+    calculate_effect_size,
+    estimate_std_dev,
+    norm_cdf,
+    norm_cdf_batch,
+    norm_ppf,
+    norm_ppf_batch,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only the grid solver needs it
+    np = None
 
 logger = logging.getLogger(__name__)
 
 
+def _z_alpha(alpha, test_type, ppf=norm_ppf):
+    """Critical value for the significance level and test type"""
+    if test_type == "two-sided":
+        return ppf(1 - alpha / 2)
+    return ppf(1 - alpha)
+
+
+@result_record
+class SampleSizeResult(ResultRecord):
+    """Result of calculate_sample_size()"""
+
+    baseline_mean: float
+    baseline_std: float
+    test_mean: float
+    absolute_improvement: float
+    relative_improvement: float
+    effect_size: float
+    effect_size_ci_lower: float
+    effect_size_ci_upper: float
+    sample_size_per_group: int
+    total_sample_size: int
+    power: float
+    alpha: float
+    test_type: str
+    std_estimated: bool
+
+
 def calculate_sample_size(
     baseline_mean,
     baseline_std,
@@ -80,11 +120,7 @@ def calculate_sample_size(
             )
 
         # Critical values
-        if test_type == "two-sided":
-            z_alpha = norm_ppf(1 - alpha / 2)
-        else:
-            z_alpha = norm_ppf(1 - alpha)
-
+        z_alpha = _z_alpha(alpha, test_type)
         z_beta = norm_ppf(power)
 
         logger.debug(
@@ -105,23 +141,344 @@ def calculate_sample_size(
             f"Final calculation: sample_size_per_group={sample_size_per_group}"
         )
 
-        return {
-            "baseline_mean": baseline_mean,
-            "baseline_std": baseline_std,
-            "test_mean": test_mean,
-            "absolute_improvement": absolute_improvement,
-            "relative_improvement": relative_improvement,
-            "effect_size": effect_size,
-            "effect_size_ci_lower": effect_size_ci_lower,
-            "effect_size_ci_upper": effect_size_ci_upper,
-            "sample_size_per_group": sample_size_per_group,
-            "total_sample_size": total_sample_size,
-            "power": power,
-            "alpha": alpha,
-            "test_type": test_type,
-            "std_estimated": std_estimated,
-        }
+        return SampleSizeResult(
+            baseline_mean=baseline_mean,
+            baseline_std=baseline_std,
+            test_mean=test_mean,
+            absolute_improvement=absolute_improvement,
+            relative_improvement=relative_improvement,
+            effect_size=effect_size,
+            effect_size_ci_lower=effect_size_ci_lower,
+            effect_size_ci_upper=effect_size_ci_upper,
+            sample_size_per_group=sample_size_per_group,
+            total_sample_size=total_sample_size,
+            power=power,
+            alpha=alpha,
+            test_type=test_type,
+            std_estimated=std_estimated,
+        )
 
     except Exception as e:
         logger.error(f"Error in calculate_sample_size: {str(e)}")
         raise
+
+
+def calculate_sample_size_grid(
+    baseline_mean,
+    baseline_std,
+    improvement_type,
+    improvement_value,
+    power,
+    alpha,
+    test_type="two-sided",
+):
+    """
+    Calculate fixed horizon sample sizes over a grid of scenarios
+
+    Numeric arguments are broadcast against each other with NumPy rules, so
+    e.g. 3 baselines x 50 improvements x 4 power levels is one call. Inputs
+    are validated once for the whole grid and the kernel does no per-cell
+    logging.
+
+    Args:
+        baseline_mean: Baseline metric mean(s)
+        baseline_std: Baseline standard deviation(s), or None to estimate
+        improvement_type: 'absolute' or 'relative' (applies to every cell)
+        improvement_value: Expected improvement value(s)
+        power: Statistical power value(s)
+        alpha: Significance level(s)
+        test_type: 'two-sided' or 'one-sided' (applies to every cell)
+
+    Returns:
+        Dictionary of arrays with the broadcast grid shape, using the same
+        keys as calculate_sample_size
+    """
+    if np is None:
+        raise ImportError("calculate_sample_size_grid requires NumPy")
+
+    baseline_mean = np.asarray(baseline_mean, dtype=float)
+    improvement_value = np.asarray(improvement_value, dtype=float)
+    power = np.asarray(power, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+
+    # Validate inputs (NaN passes every comparison below, so check first)
+    if baseline_std is not None:
+        baseline_std = np.asarray(baseline_std, dtype=float)
+    for label, values in (
+        ("Baseline mean", baseline_mean),
+        ("Baseline standard deviation", baseline_std),
+        ("Improvement value", improvement_value),
+        ("Power", power),
+        ("Alpha", alpha),
+    ):
+        if values is not None and not np.all(np.isfinite(values)):
+            raise ValueError(f"{label} must be a finite number")
+    if np.any(baseline_mean <= 0):
+        raise ValueError("Baseline mean must be positive")
+    if baseline_std is not None:
+        if np.any(baseline_std <= 0):
+            raise ValueError("Baseline standard deviation must be positive")
+    if np.any((power <= 0) | (power >= 1)):
+        raise ValueError("Power must be between 0 and 1")
+    if np.any((alpha <= 0) | (alpha >= 1)):
+        raise ValueError("Alpha must be between 0 and 1")
+
+    # Handle unknown standard deviation
+    if baseline_std is None:
+        baseline_std = estimate_std_dev(baseline_mean, "conservative")
+        std_estimated = True
+    else:
+        std_estimated = False
+
+    # Calculate expected test mean
+    if improvement_type == "absolute":
+        absolute_improvement = improvement_value
+        relative_improvement = (absolute_improvement / baseline_mean) * 100
+    else:  # relative
+        relative_improvement = improvement_value
+        absolute_improvement = baseline_mean * (relative_improvement / 100)
+    test_mean = baseline_mean + absolute_improvement
+
+    # Effect size
+    effect_size = np.abs(test_mean - baseline_mean) / baseline_std
+    if np.any(effect_size == 0):
+        raise ValueError(
+            "Effect size cannot be zero - improvement value must be non-zero"
+        )
+
+    # Critical values are evaluated on the (usually tiny) un-broadcast inputs
+    z_alpha = _z_alpha(alpha, test_type, norm_ppf_batch)
+    z_beta = norm_ppf_batch(power)
+
+    # Sample size calculation
+    sample_size_per_group = np.ceil(2 * ((z_alpha + z_beta) ** 2) / (effect_size**2))
+    sample_size_per_group = sample_size_per_group.astype(np.int64)
+    total_sample_size = sample_size_per_group * 2
+
+    # Confidence intervals
+    margin = z_alpha * np.sqrt(2 / sample_size_per_group)
+    effect_size_ci_lower = effect_size - margin
+    effect_size_ci_upper = effect_size + margin
+
+    shape = sample_size_per_group.shape
+    logger.debug(f"Sample size grid calculated for {sample_size_per_group.size} cells")
+
+    return {
+        "baseline_mean": np.broadcast_to(baseline_mean, shape),
+        "baseline_std": np.broadcast_to(baseline_std, shape),
+        "test_mean": np.broadcast_to(test_mean, shape),
+        "absolute_improvement": np.broadcast_to(absolute_improvement, shape),
+        "relative_improvement": np.broadcast_to(relative_improvement, shape),
+        "effect_size": np.broadcast_to(effect_size, shape),
+        "effect_size_ci_lower": effect_size_ci_lower,
+        "effect_size_ci_upper": effect_size_ci_upper,
+        "sample_size_per_group": sample_size_per_group,
+        "total_sample_size": total_sample_size,
+        "power": np.broadcast_to(power, shape),
+        "alpha": np.broadcast_to(alpha, shape),
+        "test_type": test_type,
+        "std_estimated": std_estimated,
+    }
+
+
+def _solver_backend(*values):
+    """
+    Pick scalar or array arithmetic for the inverse solvers
+
+    Returns (as_input, ppf, cdf, any_true, all_finite): plain floats go
+    through the scalar functions, anything array-like through the NumPy
+    batch API.
+    """
+    if all(value is None or isinstance(value, (int, float)) for value in values):
+        return (lambda value: value), norm_ppf, norm_cdf, bool, math.isfinite
+    if np is None:
+        raise ImportError("Array inputs to the inverse solvers require NumPy")
+
+    def as_array(value):
+        return None if value is None else np.asarray(value, dtype=float)
+
+    def all_finite(value):
+        return bool(np.all(np.isfinite(value)))
+
+    return as_array, norm_ppf_batch, norm_cdf_batch, np.any, all_finite
+
+
+def _check_finite(all_finite, *labelled_values):
+    """Raise ValueError for the first NaN or infinite input (None is skipped)"""
+    for label, value in labelled_values:
+        if value is not None and not all_finite(value):
+            raise ValueError(f"{label} must be a finite number")
+
+
+def minimum_detectable_effect(
+    sample_size_per_group,
+    baseline_mean,
+    baseline_std,
+    power,
+    alpha,
+    test_type="two-sided",
+):
+    """
+    Calculate the minimum detectable effect for a given sample size
+
+    Closed-form inverse of calculate_sample_size. Every numeric argument may
+    be a scalar or an array (broadcast with NumPy rules), so a whole MDE
+    curve is a single evaluation.
+
+    Args:
+        sample_size_per_group: Sample size(s) per group
+        baseline_mean: Baseline metric mean
+        baseline_std: Baseline metric standard deviation (or None)
+        power: Statistical power (0.8, 0.9, etc.)
+        alpha: Significance level (0.05, 0.01, etc.)
+        test_type: 'two-sided' or 'one-sided'
+
+    Returns:
+        Dictionary with the detectable effect in absolute, relative and
+        Cohen's d terms
+    """
+    as_input, ppf, _, any_true, all_finite = _solver_backend(
+        sample_size_per_group, baseline_mean, baseline_std, power, alpha
+    )
+    n = as_input(sample_size_per_group)
+    baseline_mean = as_input(baseline_mean)
+    baseline_std = as_input(baseline_std)
+    power = as_input(power)
+    alpha = as_input(alpha)
+
+    # Validate inputs (NaN passes every comparison below, so check first)
+    _check_finite(
+        all_finite,
+        ("Sample size", n),
+        ("Baseline mean", baseline_mean),
+        ("Baseline standard deviation", baseline_std),
+        ("Power", power),
+        ("Alpha", alpha),
+    )
+    if any_true(n <= 0):
+        raise ValueError("Sample size must be positive")
+    if any_true(baseline_mean <= 0):
+        raise ValueError("Baseline mean must be positive")
+    if baseline_std is not None and any_true(baseline_std <= 0):
+        raise ValueError("Baseline standard deviation must be positive")
+    if any_true((power <= 0) | (power >= 1)):
+        raise ValueError("Power must be between 0 and 1")
+    if any_true((alpha <= 0) | (alpha >= 1)):
+        raise ValueError("Alpha must be between 0 and 1")
+
+    std_estimated = baseline_std is None
+    if std_estimated:
+        baseline_std = estimate_std_dev(baseline_mean, "conservative")
+
+    z_alpha = _z_alpha(alpha, test_type, ppf)
+    z_beta = ppf(power)
+
+    # Invert n = 2 (z_alpha + z_beta)^2 / d^2 for d
+    effect_size = (z_alpha + z_beta) * (2 / n) ** 0.5
+    absolute_mde = effect_size * baseline_std
+    relative_mde = (absolute_mde / baseline_mean) * 100
+
+    return {
+        "sample_size_per_group": n,
+        "total_sample_size": n * 2,
+        "baseline_mean": baseline_mean,
+        "baseline_std": baseline_std,
+        "std_estimated": std_estimated,
+        "effect_size": effect_size,
+        "absolute_mde": absolute_mde,
+        "relative_mde": relative_mde,
+        "test_mean": baseline_mean + absolute_mde,
+        "power": power,
+        "alpha": alpha,
+        "test_type": test_type,
+    }
+
+
+def achieved_power(
+    sample_size_per_group,
+    baseline_mean,
+    baseline_std,
+    improvement_type,
+    improvement_value,
+    alpha,
+    test_type="two-sided",
+):
+    """
+    Calculate the statistical power achieved for a given sample size
+
+    Closed-form inverse of calculate_sample_size in the power argument.
+    Passing an array of sample sizes returns the full power curve.
+
+    Args:
+        sample_size_per_group: Sample size(s) per group
+        baseline_mean: Baseline metric mean
+        baseline_std: Baseline metric standard deviation (or None)
+        improvement_type: 'absolute' or 'relative'
+        improvement_value: Expected improvement value
+        alpha: Significance level (0.05, 0.01, etc.)
+        test_type: 'two-sided' or 'one-sided'
+
+    Returns:
+        Dictionary with achieved power and the effect it was computed for
+    """
+    as_input, ppf, cdf, any_true, all_finite = _solver_backend(
+        sample_size_per_group, baseline_mean, baseline_std, improvement_value, alpha
+    )
+    n = as_input(sample_size_per_group)
+    baseline_mean = as_input(baseline_mean)
+    baseline_std = as_input(baseline_std)
+    improvement_value = as_input(improvement_value)
+    alpha = as_input(alpha)
+
+    # Validate inputs (NaN passes every comparison below, so check first)
+    _check_finite(
+        all_finite,
+        ("Sample size", n),
+        ("Baseline mean", baseline_mean),
+        ("Baseline standard deviation", baseline_std),
+        ("Improvement value", improvement_value),
+        ("Alpha", alpha),
+    )
+    if any_true(n <= 0):
+        raise ValueError("Sample size must be positive")
+    if any_true(baseline_mean <= 0):
+        raise ValueError("Baseline mean must be positive")
+    if baseline_std is not None and any_true(baseline_std <= 0):
+        raise ValueError("Baseline standard deviation must be positive")
+    if any_true((alpha <= 0) | (alpha >= 1)):
+        raise ValueError("Alpha must be between 0 and 1")
+
+    std_estimated = baseline_std is None
+    if std_estimated:
+        baseline_std = estimate_std_dev(baseline_mean, "conservative")
+
+    if improvement_type == "absolute":
+        absolute_improvement = improvement_value
+        relative_improvement = (absolute_improvement / baseline_mean) * 100
+    else:  # relative
+        relative_improvement = improvement_value
+        absolute_improvement = baseline_mean * (relative_improvement / 100)
+
+    effect_size = abs(absolute_improvement) / baseline_std
+    if any_true(effect_size == 0):
+        raise ValueError(
+            "Effect size cannot be zero - improvement value must be non-zero"
+        )
+
+    # Invert n = 2 (z_alpha + z_beta)^2 / d^2 for z_beta, then map to power
+    z_alpha = _z_alpha(alpha, test_type, ppf)
+    power = cdf(effect_size * (n / 2) ** 0.5 - z_alpha)
+
+    return {
+        "sample_size_per_group": n,
+        "total_sample_size": n * 2,
+        "baseline_mean": baseline_mean,
+        "baseline_std": baseline_std,
+        "std_estimated": std_estimated,
+        "absolute_improvement": absolute_improvement,
+        "relative_improvement": relative_improvement,
+        "effect_size": effect_size,
+        "power": power,
+        "alpha": alpha,
+        "test_type": test_type,
+    }
@@ -0,0 +1,582 @@
+"""
+Streaming readers that turn uploaded metric files and pasted text into numbers
+"""
+import csv
+import gzip
+import io
+import math
+import mmap
+import re
+import shutil
+import sys
+import tempfile
+from array import array
+from itertools import chain
+
+try:
+    import numpy as np
+    import numpy.lib.format as npy_format
+except ImportError:  # NumPy is optional, binary files fall back to mmap
+    np = None
+
+try:
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, only Parquet input needs it
+    pq = None
+
+# Bytes read from the underlying stream at a time
+READ_CHUNK_SIZE = 1 << 20
+
+# float64 values per chunk when reducing binary data (8 MiB)
+FLOAT64_CHUNK_SIZE = 1 << 20
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_NPY_MAGIC = b"\x93NUMPY"
+
+# Rows per Arrow record batch when reading Parquet
+PARQUET_BATCH_SIZE = 1 << 16
+
+# File extensions read as binary rather than text
+BINARY_EXTENSIONS = {
+    ".npy": "npy",
+    ".f64": "float64",
+    ".bin": "float64",
+    ".parquet": "parquet",
+}
+
+DELIMITERS = {"comma": ",", "tab": "\t", "semicolon": ";"}
+
+# Pasted values may be separated by any mix of these (and blank lines)
+_PASTE_SEPARATORS = bytes.maketrans(b",;\t\r\n\v\f", b" " * 7)
+
+# A comma joining two values rather than grouping digits: one following a
+# non-digit, a run of four or more digits or a group that does not start a
+# number (a decimal part or exponent), or one not followed by exactly three
+# digits. Commas followed by whitespace ("1,000, 2,000") or a line end work
+# like spaces between values, so they are not counted.
+_NOT_NUMBER_START = rb"[^\s;,+\-0-9]"
+_SEPARATOR_COMMA = re.compile(
+    rb",(?![ \t\r\n]|\Z)"
+    rb"(?:(?<![0-9],)|(?<=[0-9]{4},)"
+    rb"|(?<=" + _NOT_NUMBER_START + rb"[0-9],)"
+    rb"|(?<=" + _NOT_NUMBER_START + rb"[0-9]{2},)"
+    rb"|(?<=" + _NOT_NUMBER_START + rb"[0-9]{3},)"
+    rb"|(?![0-9]{3}(?![0-9])))"
+)
+
+# Anything other than a comma between values
+_VALUE_SEPARATOR = re.compile(rb"[\s;]")
+
+# Whitespace or a semicolon between two values on one line
+_INLINE_SEPARATOR = re.compile(rb"[ \t;](?<=[^\s;][ \t;])[ \t;]*[^\s,;]")
+
+# A value written with thousands separators after whitespace or a semicolon,
+# e.g. " -1,234,567.89"
+_GROUPED_VALUE = re.compile(
+    rb"[\s;]([+-]?[0-9]{1,3}(?:,[0-9]{3})+(?:\.[0-9]*)?)(?![^\s;,]|,[0-9])"
+)
+
+# A value holding commas, e.g. "100,200", and a comma inside one
+_JOINED_VALUE = re.compile(rb"([^\s,;]+(?:,[^\s,;]+)+)")
+_INNER_COMMA = re.compile(rb",[^\s,;]")
+
+# A line holding two values joined by one comma, e.g. "1,5"
+_AMBIGUOUS_LINE = re.compile(rb"^[ \t]*([^\s,;]+,[^\s,;]+)[ \t]*\r?$", re.MULTILINE)
+
+
+class _PrefixedStream(io.RawIOBase):
+    """Raw stream that replays bytes already read (for format sniffing)"""
+
+    def __init__(self, head, stream):
+        self._head = head
+        self._stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self._head))
+        buffer[:size] = self._head[:size]
+        self._head = self._head[size:]
+        data = self._stream.read(len(buffer) - size) if size < len(buffer) else b""
+        buffer[size : size + len(data)] = data
+        return size + len(data)
+
+
+def open_binary_stream(stream, chunk_size=READ_CHUNK_SIZE):
+    """
+    Buffered binary reader over a stream, decompressing gzip transparently
+
+    Gzip input is recognised by its magic bytes, so callers do not need to
+    know whether an upload was compressed.
+
+    Args:
+        stream: Binary file-like object with read() (e.g. request.stream)
+        chunk_size: Bytes read from the underlying stream at a time
+
+    Returns:
+        Binary file-like object yielding the (decompressed) bytes
+    """
+    head = stream.read(2)
+    reader = io.BufferedReader(_PrefixedStream(head, stream), chunk_size)
+    if head == _GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=reader, mode="rb")
+    return reader
+
+
+def _parse_number(token):
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+
+def _column_index(header, column):
+    """Index of a column given by header name or 1-based number"""
+    if column in header:
+        return header.index(column)
+    if column.isdigit() and 1 <= int(column) <= len(header):
+        return int(column) - 1
+    raise ValueError(f"Column '{column}' not found. Available columns: {header}")
+
+
+def _open_delimited(stream, delimiter):
+    """
+    Header and data rows of a CSV/TSV stream
+
+    Returns:
+        tuple: (header names, first data line number, iterator of rows)
+    """
+    text = io.TextIOWrapper(open_binary_stream(stream), encoding="utf-8-sig")
+    first_line = text.readline()
+    if not first_line.strip():
+        raise ValueError("The uploaded file is empty")
+    if delimiter is None:
+        delimiter = next((d for d in ("\t", ";") if d in first_line), ",")
+
+    first_row = next(csv.reader([first_line], delimiter=delimiter))
+    rows = csv.reader(text, delimiter=delimiter)
+    if any(_parse_number(cell) is None for cell in first_row if cell):
+        return [cell.strip() for cell in first_row], 2, rows
+    header = [str(i) for i in range(1, len(first_row) + 1)]
+    return header, 1, chain([first_row], rows)
+
+
+def _default_value_column(rows, skip=None):
+    """Index of the first numeric column in the first data row, and the rows"""
+    first = next(rows, [])
+    index = next(
+        (
+            i
+            for i, cell in enumerate(first)
+            if i != skip and _parse_number(cell) is not None
+        ),
+        None,
+    )
+    if index is None:
+        raise ValueError("No numeric column found; choose one explicitly")
+    return index, chain([first], rows)
+
+
+def _number(cell, line, name):
+    value = _parse_number(cell)
+    if value is None:
+        raise ValueError(f"Line {line}: '{cell}' in column {name} is not a number")
+    return value
+
+
+def read_delimited_column(stream, column=None, delimiter=None):
+    """
+    Stream one numeric column out of a CSV/TSV file
+
+    The file is decoded and parsed a buffer at a time, so memory does not
+    grow with its size. A header row is detected when the first row is not
+    all numbers; blank cells are skipped.
+
+    Args:
+        stream: Binary file-like object, optionally gzip-compressed
+        column: Header name or 1-based column number; defaults to the first
+            column whose first value is numeric
+        delimiter: Field delimiter; detected from the first line (tab,
+            semicolon or comma) when not given
+
+    Returns:
+        tuple: (column name, iterator of float values)
+    """
+    header, first_line, rows = _open_delimited(stream, delimiter)
+    if column:
+        index = _column_index(header, str(column).strip())
+    else:
+        index, rows = _default_value_column(rows)
+    name = header[index]
+
+    def values():
+        for line, row in enumerate(rows, first_line):
+            cell = row[index].strip() if index < len(row) else ""
+            if cell:
+                yield _number(cell, line, name)
+
+    return name, values()
+
+
+def read_segmented_column(stream, segment_column, column=None, delimiter=None):
+    """
+    Stream (segment, value) pairs out of a CSV/TSV file
+
+    Rows with a blank value are skipped; a blank segment is kept as ''.
+
+    Args:
+        stream: Binary file-like object, optionally gzip-compressed
+        segment_column: Header name or 1-based number of the segment column
+        column: Value column; defaults to the first numeric column other
+            than the segment column
+        delimiter: Field delimiter; detected from the first line when not given
+
+    Returns:
+        tuple: (segment column name, value column name, iterator of pairs)
+    """
+    header, first_line, rows = _open_delimited(stream, delimiter)
+    segment_index = _column_index(header, str(segment_column).strip())
+    if column:
+        index = _column_index(header, str(column).strip())
+    else:
+        index, rows = _default_value_column(rows, skip=segment_index)
+    name = header[index]
+
+    def pairs():
+        for line, row in enumerate(rows, first_line):
+            cell = row[index].strip() if index < len(row) else ""
+            if cell:
+                segment = row[segment_index].strip() if segment_index < len(row) else ""
+                yield segment, _number(cell, line, name)
+
+    return header[segment_index], name, pairs()
+
+
+def binary_format_for(filename):
+    """'npy', 'float64' or 'parquet' for binary file names, None for text"""
+    name = (filename or "").lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    for extension, file_format in BINARY_EXTENSIONS.items():
+        if name.endswith(extension):
+            return file_format
+    return None
+
+
+def _npy_values(array):
+    if array.dtype.kind not in "fiu":
+        raise ValueError(f"Unsupported .npy dtype {array.dtype}; expected numbers")
+    return array.reshape(-1, order="A")
+
+
+def open_float64_file(path, file_format=None):
+    """
+    Memory-map a .npy or raw little-endian float64 file
+
+    Nothing is read up front: slices of the returned sequence are views into
+    the mapping, so the only memory cost of a reduction over it is page cache.
+    Without NumPy, raw files are mapped with mmap and memoryview.cast('d').
+
+    Args:
+        path: File path
+        file_format: 'npy' or 'float64'; taken from the extension (or the
+            .npy magic bytes) when not given
+
+    Returns:
+        Read-only NumPy memmap, or a memoryview of doubles without NumPy
+    """
+    with open(path, "rb") as f:
+        is_npy = f.read(len(_NPY_MAGIC)) == _NPY_MAGIC
+    file_format = file_format or ("npy" if is_npy else "float64")
+    if file_format == "npy" and not is_npy:
+        raise ValueError(f"{path} is not a .npy file")
+
+    if np is not None:
+        if file_format == "npy":
+            return _npy_values(np.load(path, mmap_mode="r"))
+        return np.memmap(path, dtype="<f8", mode="r")
+
+    if file_format == "npy":
+        raise ImportError(".npy files require NumPy")
+    if sys.byteorder != "little":
+        raise ValueError("Raw float64 files without NumPy need a little-endian host")
+    with open(path, "rb") as f:
+        if f.seek(0, io.SEEK_END) % 8:
+            raise ValueError(f"{path} is not a whole number of float64 values")
+        if f.tell() == 0:
+            return memoryview(b"").cast("d")
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapping).cast("d")
+
+
+def iter_float64_chunks(values, chunk_size=FLOAT64_CHUNK_SIZE):
+    """Consecutive zero-copy slices of a memmap, array or memoryview"""
+    for start in range(0, len(values), chunk_size):
+        yield values[start : start + chunk_size]
+
+
+def _read_exactly(stream, size):
+    parts = []
+    while size:
+        data = stream.read(size)
+        if not data:
+            break
+        parts.append(data)
+        size -= len(data)
+    return b"".join(parts)
+
+
+def iter_float64_stream(stream, file_format=None, chunk_size=FLOAT64_CHUNK_SIZE):
+    """
+    Stream float64 chunks out of an uploaded .npy or raw float64 body
+
+    The body is read chunk_size values at a time and each chunk is wrapped
+    with numpy.frombuffer, so no per-value Python objects are created.
+
+    Args:
+        stream: Binary file-like object, optionally gzip-compressed
+        file_format: 'npy' or 'float64'; detected from the magic bytes
+            when not given
+        chunk_size: Values per chunk
+
+    Returns:
+        Iterator of 1-D float64 arrays
+    """
+    if np is None:
+        raise ImportError("Binary uploads require NumPy")
+    reader = open_binary_stream(stream)
+    is_npy = reader.peek(len(_NPY_MAGIC))[: len(_NPY_MAGIC)] == _NPY_MAGIC
+    if file_format == "npy" and not is_npy:
+        raise ValueError("The uploaded file is not a .npy file")
+
+    dtype = np.dtype("<f8")
+    if is_npy and file_format != "float64":
+        version = npy_format.read_magic(reader)
+        read_header = (
+            npy_format.read_array_header_1_0
+            if version == (1, 0)
+            else npy_format.read_array_header_2_0
+        )
+        # Memory order does not matter for order-free reductions
+        _, _, dtype = read_header(reader)
+        if dtype.kind not in "fiu":
+            raise ValueError(f"Unsupported .npy dtype {dtype}; expected numbers")
+
+    def chunks():
+        while True:
+            data = _read_exactly(reader, chunk_size * dtype.itemsize)
+            if not data:
+                return
+            if len(data) % dtype.itemsize:
+                raise ValueError("File size is not a whole number of values")
+            yield np.frombuffer(data, dtype=dtype).astype(float, copy=False)
+
+    return chunks()
+
+
+def _require_pyarrow():
+    if pq is None:
+        raise ImportError(
+            "Parquet files need the optional pyarrow package (pip install pyarrow)"
+        )
+
+
+def _seekable(stream):
+    """The stream itself if seekable, else a spooled copy (Parquet seeks)"""
+    if getattr(stream, "seekable", lambda: False)():
+        return stream
+    copy = tempfile.SpooledTemporaryFile(max_size=READ_CHUNK_SIZE * 16)
+    shutil.copyfileobj(stream, copy, READ_CHUNK_SIZE)
+    copy.seek(0)
+    return copy
+
+
+def iter_parquet_columns(source, columns, batch_size=PARQUET_BATCH_SIZE):
+    """
+    Stream numeric columns out of a Parquet file in record batches
+
+    Only the requested columns are read, one batch at a time. Each column
+    is cast to float64 by Arrow and exposed as a NumPy view of the Arrow
+    buffer, so no Python floats are created. Rows with a null in any of the
+    requested columns are dropped.
+
+    Args:
+        source: File path or binary file-like object
+        columns: Column name, or list of names read together
+        batch_size: Rows per record batch
+
+    Returns:
+        Iterator of float64 arrays (one column) or tuples of arrays (several)
+    """
+    _require_pyarrow()
+    names = [columns] if isinstance(columns, str) else list(columns)
+    if hasattr(source, "read"):
+        source = _seekable(source)
+    try:
+        parquet_file = pq.ParquetFile(source)
+    except Exception as e:
+        raise ValueError(f"Could not read Parquet file: {e}")
+
+    available = parquet_file.schema_arrow.names
+    missing = [name for name in names if name not in available]
+    if missing:
+        raise ValueError(
+            f"Column '{missing[0]}' not found. Available columns: {available}"
+        )
+
+    def batches():
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=names):
+            arrays = [batch.column(name) for name in names]
+            valid = None
+            for column in arrays:
+                if column.null_count:
+                    mask = pc.is_valid(column)
+                    valid = mask if valid is None else pc.and_(valid, mask)
+            if valid is not None:
+                arrays = [pc.filter(column, valid) for column in arrays]
+            try:
+                arrays = [
+                    pc.cast(column, "float64").to_numpy(zero_copy_only=True)
+                    for column in arrays
+                ]
+            except Exception:
+                raise ValueError(f"Columns {names} must be numeric")
+            yield arrays[0] if isinstance(columns, str) else tuple(arrays)
+
+    return batches()
+
+
+def _ambiguous(match):
+    """ValueError naming the line and text of an ambiguous comma match"""
+    number = match.string.count(b"\n", 0, match.start(1)) + 1
+    text = match.group(1).decode("utf-8", "replace")
+    return ValueError(
+        f"Line {number} ('{text}') is ambiguous; separate values "
+        "with spaces or semicolons and use '.' for decimals"
+    )
+
+
+def _strip_thousands(data):
+    """
+    Drop thousands separators, unless commas separate values
+
+    Commas followed by whitespace or a line end always separate values.
+    Any other comma either groups digits (1,234,567) or joins two values,
+    and the whole paste has to use them the same way:
+
+    - Values also separated by whitespace or semicolons ("1,000; 2,500",
+      "1,000, 2,000"): every joining comma is a thousands separator. Mixed
+      with comma-joined values ("1,5, 2,000") the paste is rejected.
+    - One value per line: "1,000" is a grouped number only if some group
+      starts with 0, since "100,200" could as well be two values; without
+      that the paste is rejected.
+    - A single line ("100,200,300") is always a list of values.
+
+    A multi-line paste with a line of two values joined by one comma ("1,5"
+    could be 1.5, 15 or a pair) is rejected too.
+    """
+    if b"," not in data:
+        return data
+    stripped = data.strip()
+    if not _VALUE_SEPARATOR.search(stripped):
+        return data
+    multiline = b"\n" in stripped or b"\r" in stripped
+    if not _SEPARATOR_COMMA.search(data):
+        if (multiline and b",0" in data) or _INLINE_SEPARATOR.search(stripped):
+            return data.replace(b",", b"")
+        inner = _INNER_COMMA.search(data)
+        match = None
+        if inner:
+            # Only the line holding the first joined value needs scanning
+            line_start = data.rfind(b"\n", 0, inner.start()) + 1
+            match = _JOINED_VALUE.search(data, line_start)
+    else:
+        match = _AMBIGUOUS_LINE.search(data) if multiline else None
+        if match is None and _INLINE_SEPARATOR.search(stripped):
+            # Leading space so a grouped first value is found too
+            match = _GROUPED_VALUE.search(b" " + data)
+    if match:
+        raise _ambiguous(match)
+    return data
+
+
+def _count_tokens(data):
+    """Number of whitespace-separated tokens in normalized bytes"""
+    filled = np.frombuffer(data, dtype=np.uint8) > 32
+    if not filled.size:
+        return 0
+    return int(filled[0]) + int(np.count_nonzero(filled[1:] & ~filled[:-1]))
+
+
+def _bad_token(tokens, integers):
+    """Error naming the first token that is not a (whole) number"""
+    for index, token in enumerate(tokens):
+        value = _parse_number(token)
+        text = token.decode("utf-8", "replace")
+        if value is None or not math.isfinite(value):
+            return ValueError(f"Value {index + 1} ('{text}') is not a number")
+        if integers and not value.is_integer():
+            return ValueError(f"Value {index + 1} ('{text}') is not a whole number")
+    return ValueError("Could not parse the values")
+
+
+def parse_numbers(text, integers=False):
+    """
+    Parse pasted numbers without building per-value Python lists
+
+    Values may be separated by any mix of commas, semicolons, tabs, spaces
+    and newlines; blank lines and empty fields are skipped and comma
+    thousands separators are removed (see _strip_thousands). Separators are
+    normalized once with bytes.translate, then with NumPy the whole text is
+    parsed in C by a single numpy.fromstring call; otherwise the tokens go
+    straight into an array('d'). Most of the time goes into the float
+    conversion itself (a few tenths of a second for 1M values).
+
+    Args:
+        text: Pasted text (str or bytes)
+        integers: Require whole numbers (e.g. conversion and visitor counts)
+
+    Returns:
+        NumPy float64 array (int64 with integers=True), or array('d') /
+        array('q') without NumPy
+
+    Raises:
+        ValueError: Naming the 1-based position and text of the first value
+            that is not a number
+    """
+    data = text.encode("utf-8") if isinstance(text, str) else bytes(text)
+    data = _strip_thousands(data).translate(_PASTE_SEPARATORS)
+
+    values = None
+    if np is not None:
+        try:
+            values = np.fromstring(data, sep=" ")
+        except ValueError:
+            values = None
+        # Older NumPy stops at a bad token with only a warning
+        if values is not None and values.size != _count_tokens(data):
+            values = None
+        if values is not None and not np.all(np.isfinite(values)):
+            values = None
+        if values is not None and integers:
+            if not np.all(values == np.trunc(values)):
+                values = None
+            else:
+                values = values.astype(np.int64)
+    if values is None:
+        tokens = data.split()
+        try:
+            values = array("d", map(float, tokens))
+        except ValueError:
+            raise _bad_token(tokens, integers) from None
+        if not all(map(math.isfinite, values)):
+            raise _bad_token(tokens, integers)
+        if integers:
+            if not all(v.is_integer() for v in values):
+                raise _bad_token(tokens, integers)
+            values = array("q", map(int, values))
+        if np is not None:
+            values = np.asarray(values)
+    return values
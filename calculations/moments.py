@@ -0,0 +1,276 @@
+"""
+One-pass, mergeable moment accumulation for metric data
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only add_array() needs it
+    np = None
+
+
+class MomentAccumulator:
+    """
+    Running count, mean, sum of squared deviations (M2), min and max
+
+    Values are folded in one at a time with Welford's update, so the data is
+    read once and never stored. Accumulators built over separate chunks (in
+    other threads or processes) combine exactly with merge(), using Chan et
+    al.'s parallel formula.
+    """
+
+    __slots__ = ("n", "mean", "m2", "min", "max")
+
+    def __init__(self, values=None):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        if values is not None:
+            self.update(values)
+
+    def add(self, value):
+        """Add one value (the per-row path for grouped accumulation)"""
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        if self.min is None:
+            self.min = self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+
+    def update(self, values):
+        """
+        Add every value from an iterable in a single pass
+
+        Args:
+            values: Iterable of numbers (consumed once, so generators work)
+
+        Returns:
+            MomentAccumulator: self, for chaining
+        """
+        n, mean, m2 = self.n, self.mean, self.m2
+        low, high = self.min, self.max
+        for x in values:
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+            if low is None:
+                low = high = x
+            elif x < low:
+                low = x
+            elif x > high:
+                high = x
+        self.n, self.mean, self.m2 = n, mean, m2
+        self.min, self.max = low, high
+        return self
+
+    def add_array(self, values):
+        """
+        Add a NumPy array (or array-like) chunk with vectorized moments
+
+        The chunk's own n, mean and M2 are computed with NumPy and merged in,
+        so large inputs can be streamed through in fixed-size blocks.
+
+        Returns:
+            MomentAccumulator: self, for chaining
+        """
+        if np is None:
+            raise ImportError("Array accumulation requires NumPy")
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size:
+            chunk = MomentAccumulator()
+            chunk.n = int(values.size)
+            chunk.mean = float(values.mean())
+            chunk.m2 = float(np.square(values - chunk.mean).sum())
+            chunk.min = float(values.min())
+            chunk.max = float(values.max())
+            self.merge(chunk)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one (Chan's parallel update)
+
+        Returns:
+            MomentAccumulator: self, for chaining
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.m2 = other.n, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance (n - 1 denominator)"""
+        if self.n < 2:
+            raise ValueError("Need at least 2 data points")
+        return max(self.m2, 0.0) / (self.n - 1)
+
+    @property
+    def std_dev(self):
+        """Sample standard deviation"""
+        return math.sqrt(self.variance)
+
+    def __getstate__(self):
+        return (self.n, self.mean, self.m2, self.min, self.max)
+
+    def __setstate__(self, state):
+        self.n, self.mean, self.m2, self.min, self.max = state
+
+    def __repr__(self):
+        return (
+            f"MomentAccumulator(n={self.n}, mean={self.mean}, m2={self.m2}, "
+            f"min={self.min}, max={self.max})"
+        )
+
+
+class RatioAccumulator:
+    """
+    Running moments of paired per-unit (numerator, denominator) values
+
+    Equivalent to keeping the five sums Σx, Σy, Σx², Σy² and Σxy, but held
+    as means and centered (co-)moments so that large, nearly constant values
+    do not cancel catastrophically. Memory is constant however many pairs
+    are added, and accumulators over separate chunks combine with merge().
+    """
+
+    __slots__ = ("n", "mean_x", "mean_y", "m2_x", "m2_y", "c_xy")
+
+    def __init__(self, pairs=None):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+        if pairs is not None:
+            self.update(pairs)
+
+    def add(self, x, y):
+        """Add one (numerator, denominator) pair"""
+        self.update(((x, y),))
+
+    def update(self, pairs):
+        """
+        Add every (numerator, denominator) pair from an iterable in one pass
+
+        Returns:
+            RatioAccumulator: self, for chaining
+        """
+        n, mean_x, mean_y = self.n, self.mean_x, self.mean_y
+        m2_x, m2_y, c_xy = self.m2_x, self.m2_y, self.c_xy
+        for x, y in pairs:
+            n += 1
+            dx = x - mean_x
+            dy = y - mean_y
+            mean_x += dx / n
+            mean_y += dy / n
+            m2_x += dx * (x - mean_x)
+            m2_y += dy * (y - mean_y)
+            c_xy += dx * (y - mean_y)
+        self.n, self.mean_x, self.mean_y = n, mean_x, mean_y
+        self.m2_x, self.m2_y, self.c_xy = m2_x, m2_y, c_xy
+        return self
+
+    def add_arrays(self, x, y):
+        """
+        Add paired NumPy array (or array-like) chunks with vectorized moments
+
+        Returns:
+            RatioAccumulator: self, for chaining
+        """
+        if np is None:
+            raise ImportError("Array accumulation requires NumPy")
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError(
+                "Numerator and denominator arrays must have the same length"
+            )
+        if x.size:
+            chunk = RatioAccumulator()
+            chunk.n = int(x.size)
+            chunk.mean_x = float(x.mean())
+            chunk.mean_y = float(y.mean())
+            dx = x - chunk.mean_x
+            dy = y - chunk.mean_y
+            chunk.m2_x = float(np.dot(dx, dx))
+            chunk.m2_y = float(np.dot(dy, dy))
+            chunk.c_xy = float(np.dot(dx, dy))
+            self.merge(chunk)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one (Chan's parallel update)
+
+        Returns:
+            RatioAccumulator: self, for chaining
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.__setstate__(other.__getstate__())
+            return self
+
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.m2_x += other.m2_x + dx * dx * weight
+        self.m2_y += other.m2_y + dy * dy * weight
+        self.c_xy += other.c_xy + dx * dy * weight
+        self.n = n
+        return self
+
+    def _df(self):
+        if self.n < 2:
+            raise ValueError("Need at least 2 data points")
+        return self.n - 1
+
+    @property
+    def variance_x(self):
+        """Sample variance of the numerators (n - 1 denominator)"""
+        return max(self.m2_x, 0.0) / self._df()
+
+    @property
+    def variance_y(self):
+        """Sample variance of the denominators (n - 1 denominator)"""
+        return max(self.m2_y, 0.0) / self._df()
+
+    @property
+    def covariance(self):
+        """Sample covariance of numerators and denominators"""
+        return self.c_xy / self._df()
+
+    def __getstate__(self):
+        return (self.n, self.mean_x, self.mean_y, self.m2_x, self.m2_y, self.c_xy)
+
+    def __setstate__(self, state):
+        self.n, self.mean_x, self.mean_y, self.m2_x, self.m2_y, self.c_xy = state
+
+    def __repr__(self):
+        return (
+            f"RatioAccumulator(n={self.n}, mean_x={self.mean_x}, "
+            f"mean_y={self.mean_y}, m2_x={self.m2_x}, m2_y={self.m2_y}, "
+            f"c_xy={self.c_xy})"
+        )
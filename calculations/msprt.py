@@ -1,9 +1,34 @@
 """
 mSPRT (Mixed Sequential Probability Ratio Test) calculations
 """
+import itertools
 import math
-
-from .statistics import calculate_effect_size, estimate_std_dev, norm_ppf, t_ppf
+from collections.abc import Sequence
+from enum import Enum
+from typing import Optional
+
+from . import student_t
+from .group_sequential import spending_boundary_provider
+from .results import ResultRecord, result_record
+from .statistics import (
+    calculate_effect_size,
+    estimate_std_dev,
+    norm_ppf,
+    t_ppf,
+    t_ppf_batch,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batches then go through plain sums
+    np = None
+
+ARMS = ("control", "treatment")
+
+# t quantiles are cached per df to DF_SIGNIFICANT_DIGITS significant digits
+# (student_t.quantize). With df = 2n - 2 the cache cannot tell apart changes
+# in n below this fraction of n, so Newton steps stop there at the latest.
+_N_RESOLUTION = 10.0 ** (1 - student_t.DF_SIGNIFICANT_DIGITS)
 
 
 def calculate_boundary_at_sample_size(n, baseline_std, alpha, use_t_test=False):
@@ -24,9 +49,7 @@ def calculate_boundary_at_sample_size(n, baseline_std, alpha, use_t_test=False):
 
     # Calculate boundary using appropriate distribution
     if use_t_test:
-        df = 2 * n - 2
-        t_alpha = t_ppf(df, 1 - alpha / 2) if df > 2 else 3.0
-        boundary = t_alpha * se
+        boundary = _t_critical(2 * n - 2, alpha) * se
     else:
         z_alpha = norm_ppf(1 - alpha / 2)
         boundary = z_alpha * se
@@ -34,6 +57,74 @@ def calculate_boundary_at_sample_size(n, baseline_std, alpha, use_t_test=False):
     return boundary
 
 
+def _t_critical(df, alpha):
+    """Two-sided t critical value; the exact engine accepts any df > 0"""
+    if df <= 0:
+        raise ValueError("t-test boundaries need more than one observation per group")
+    return t_ppf(df, 1 - alpha / 2)
+
+
+def solve_sample_size_for_boundary(
+    target_boundary,
+    baseline_std,
+    alpha,
+    use_t_test=False,
+    rtol=1e-9,
+    max_iterations=50,
+):
+    """
+    Solve for the sample size whose boundary equals target_boundary.
+
+    In t-test mode the degrees of freedom depend on n, so this runs Newton
+    steps on f(n) = n - (t(2n - 2) * c)^2 with c = std * sqrt(2) / target,
+    starting from the z-test solution. The derivative of t with respect to
+    df comes from the Cornish-Fisher series, so no extra quantiles are solved.
+
+    Args:
+        target_boundary: Target boundary value
+        baseline_std: Standard deviation (adjusted for variance inflation)
+        alpha: Type I error rate
+        use_t_test: Whether to use t-test (default: False for z-test)
+        rtol: Relative change in n at which the iteration stops (at least
+            the t quantile cache resolution, 1e-8)
+        max_iterations: Upper bound on Newton steps
+
+    Returns:
+        dict: n (sample size per group), iterations, converged
+    """
+    z_alpha = norm_ppf(1 - alpha / 2)
+    c = baseline_std * math.sqrt(2) / target_boundary
+    n = (z_alpha * c) ** 2
+    if not use_t_test:
+        return {"n": n, "iterations": 0, "converged": True}
+
+    # phi(n) = (t(2n - 2) * c)^2 decreases in n, so every evaluation brackets
+    # the root between n and phi(n)
+    lower, upper = 1.0, math.inf
+    if n <= 1:
+        n = 2.0
+    p = 1 - alpha / 2
+    for iteration in range(1, max_iterations + 1):
+        df = 2 * n - 2
+        t_alpha = _t_critical(df, alpha)
+        phi = (t_alpha * c) ** 2
+        if n < phi:
+            lower, upper = n, min(upper, phi)
+        else:
+            lower, upper = max(lower, phi), n
+
+        f_prime = 1 - 4 * t_alpha * c * c * student_t.quantile_df_slope(df, p)
+        n_new = n - (n - phi) / f_prime
+        if not lower < n_new < upper:
+            # Geometric midpoint: the bracket can span many orders of magnitude
+            n_new = math.sqrt(lower * upper)
+        if abs(n_new - n) <= max(rtol, _N_RESOLUTION) * n:
+            return {"n": n_new, "iterations": iteration, "converged": True}
+        n = n_new
+
+    return {"n": n, "iterations": max_iterations, "converged": False}
+
+
 def calculate_sample_size_for_boundary(
     target_boundary, baseline_std, alpha, use_t_test=False
 ):
@@ -49,23 +140,136 @@ def calculate_sample_size_for_boundary(
     Returns:
         float: Required sample size per group
     """
-    if use_t_test:
-        # For t-test, use iterative approach since df depends on n
-        # Start with z-test approximation
-        z_alpha = norm_ppf(1 - alpha / 2)
-        n_approx = (z_alpha * baseline_std * math.sqrt(2) / target_boundary) ** 2
+    return solve_sample_size_for_boundary(
+        target_boundary, baseline_std, alpha, use_t_test
+    )["n"]
 
-        # Refine with t-test
-        for _ in range(10):  # Max 10 iterations
-            df = 2 * n_approx - 2
-            t_alpha = t_ppf(df, 1 - alpha / 2) if df > 2 else 3.0
-            n_approx = (t_alpha * baseline_std * math.sqrt(2) / target_boundary) ** 2
 
-        return n_approx
+def calculate_sample_sizes_for_boundaries(
+    target_boundaries,
+    baseline_std,
+    alpha,
+    use_t_test=False,
+    rtol=1e-9,
+    max_iterations=50,
+):
+    """
+    Solve solve_sample_size_for_boundary for many target boundaries at once.
+
+    All targets share one z critical value for the starting guess and each
+    Newton step evaluates the t quantiles of every unconverged target in a
+    single t_ppf_batch call. Requires NumPy.
+
+    Args:
+        target_boundaries: Sequence of target boundary values
+        baseline_std: Standard deviation, scalar or broadcastable to the targets
+        alpha: Type I error rate
+        use_t_test: Whether to use t-test (default: False for z-test)
+        rtol: Relative change in n at which a target stops iterating (at
+            least the t quantile cache resolution, 1e-8)
+        max_iterations: Upper bound on Newton steps
+
+    Returns:
+        dict: n, iterations and converged arrays aligned with the targets
+    """
+    if np is None:
+        raise ImportError("calculate_sample_sizes_for_boundaries requires NumPy")
+
+    targets, stds = np.broadcast_arrays(
+        np.asarray(target_boundaries, dtype=float),
+        np.asarray(baseline_std, dtype=float),
+    )
+    z_alpha = norm_ppf(1 - alpha / 2)
+    c = stds * math.sqrt(2) / targets
+    n = (z_alpha * c) ** 2
+    iterations = np.zeros(n.shape, dtype=np.int64)
+    if not use_t_test:
+        return {"n": n, "iterations": iterations, "converged": np.ones(n.shape, bool)}
+
+    n = np.where(n > 1, n, 2.0)
+    p = 1 - alpha / 2
+    active = np.flatnonzero(np.ones(n.shape, bool))
+    flat_n = n.reshape(-1)
+    flat_c = c.reshape(-1)
+    flat_iterations = iterations.reshape(-1)
+    lower = np.ones(flat_n.shape)
+    upper = np.full(flat_n.shape, np.inf)
+    for iteration in range(1, max_iterations + 1):
+        n_active = flat_n[active]
+        c_active = flat_c[active]
+        df = 2 * n_active - 2
+        t_alpha = t_ppf_batch(df, p)
+        phi = (t_alpha * c_active) ** 2
+        below = n_active < phi
+        lower[active] = np.where(below, n_active, np.maximum(lower[active], phi))
+        upper[active] = np.where(below, np.minimum(upper[active], phi), n_active)
+
+        slope = student_t.quantile_df_slope(df, p)
+        f_prime = 1 - 4 * t_alpha * c_active * c_active * slope
+        n_new = n_active - (n_active - phi) / f_prime
+        low, high = lower[active], upper[active]
+        inside = (low < n_new) & (n_new < high)
+        n_new = np.where(inside, n_new, np.sqrt(low * high))
+
+        flat_n[active] = n_new
+        flat_iterations[active] = iteration
+        step = np.abs(n_new - n_active)
+        active = active[step > max(rtol, _N_RESOLUTION) * n_active]
+        if active.size == 0:
+            break
+
+    converged = np.ones(n.shape, bool)
+    converged.reshape(-1)[active] = False
+    return {"n": n, "iterations": iterations, "converged": converged}
+
+
+class WeekStatus(str, Enum):
+    """Machine-readable status of a monitoring look"""
+
+    SIGNIFICANT_IMPROVEMENT = "significant_improvement"
+    SIGNIFICANT_DECLINE = "significant_decline"
+    KEEP_TESTING = "keep_testing"
+
+
+STATUS_LABELS = {
+    WeekStatus.SIGNIFICANT_IMPROVEMENT: "✅ Significant Improvement",
+    WeekStatus.SIGNIFICANT_DECLINE: "❌ Significant Decline",
+    WeekStatus.KEEP_TESTING: "⏳ Keep Testing",
+}
+
+
+def _week_status_code(observed_effect, boundary):
+    """WeekStatus of an effect against a boundary"""
+    if abs(observed_effect) >= boundary:
+        if observed_effect > 0:
+            return WeekStatus.SIGNIFICANT_IMPROVEMENT
+        return WeekStatus.SIGNIFICANT_DECLINE
+    return WeekStatus.KEEP_TESTING
+
+
+def _week_status_text(observed_effect, boundary, baseline_mean):
+    """Display status and explanation for an effect against a boundary"""
+    code = _week_status_code(observed_effect, boundary)
+    status = STATUS_LABELS[code]
+    if code is WeekStatus.SIGNIFICANT_IMPROVEMENT:
+        if abs(observed_effect) > boundary * 1.1:
+            explanation = f"The {observed_effect: .3f} improvement is clearly detectable. You can confidently implement this change."
+        else:
+            explanation = f"The {observed_effect: .3f} improvement is just detectable. This is the minimum reliable improvement we can confirm."
+    elif code is WeekStatus.SIGNIFICANT_DECLINE:
+        if abs(observed_effect) > boundary * 1.1:
+            explanation = f"The {abs(observed_effect): .3f} decline is clearly detectable. You should keep the current version."
+        else:
+            explanation = f"The {abs(observed_effect): .3f} decline is just detectable. This is the minimum reliable decline we can confirm."
+    elif not math.isfinite(boundary):
+        explanation = "No type I error is spent at this look yet, so no effect can be declared. Keep collecting data."
     else:
-        # For z-test, direct calculation
-        z_alpha = norm_ppf(1 - alpha / 2)
-        return (z_alpha * baseline_std * math.sqrt(2) / target_boundary) ** 2
+        # Convert to relative percentage for easier understanding
+        min_detectable_percent = (boundary / baseline_mean) * 100
+        expected_percent = (abs(observed_effect) / baseline_mean) * 100
+        explanation = f"Can detect effects ≥{min_detectable_percent: .1f}%, but expecting {expected_percent: .1f}%. Need more data to detect smaller effects."
+
+    return status, explanation
 
 
 def determine_week_status(
@@ -95,28 +299,9 @@ def determine_week_status(
     n = weekly_visitors * week
     boundary = calculate_boundary_at_sample_size(n, baseline_std, alpha, use_t_test)
 
-    # Compare expected improvement against boundary
-    observed_effect = absolute_improvement
-
-    if abs(observed_effect) >= boundary:
-        if observed_effect > 0:
-            status = "✅ Significant Improvement"
-            if abs(observed_effect) > boundary * 1.1:
-                explanation = f"The {observed_effect: .3f} improvement is clearly detectable. You can confidently implement this change."
-            else:
-                explanation = f"The {observed_effect: .3f} improvement is just detectable. This is the minimum reliable improvement we can confirm."
-        else:
-            status = "❌ Significant Decline"
-            if abs(observed_effect) > boundary * 1.1:
-                explanation = f"The {abs(observed_effect): .3f} decline is clearly detectable. You should keep the current version."
-            else:
-                explanation = f"The {abs(observed_effect): .3f} decline is just detectable. This is the minimum reliable decline we can confirm."
-    else:
-        status = "⏳ Keep Testing"
-        # Convert to relative percentage for easier understanding
-        min_detectable_percent = (boundary / baseline_mean) * 100
-        expected_percent = (abs(observed_effect) / baseline_mean) * 100
-        explanation = f"Can detect effects ≥{min_detectable_percent: .1f}%, but expecting {expected_percent: .1f}%. Need more data to detect smaller effects."
+    status, explanation = _week_status_text(
+        absolute_improvement, boundary, baseline_mean
+    )
 
     return {
         "week": week,
@@ -128,6 +313,39 @@ def determine_week_status(
     }
 
 
+@result_record
+class MSPRTPlanResult(ResultRecord):
+    """Result of calculate_msprt_plan()"""
+
+    baseline_mean: float
+    baseline_std: float
+    original_std: float
+    std_method: str
+    test_mean: float
+    absolute_improvement: float
+    relative_improvement: float
+    effect_size: float
+    calibrated_effect_size: float
+    use_t_test: bool
+    alpha: float
+    beta: float
+    power: float
+    A: float
+    B: float
+    expected_n_h0: float
+    expected_n_h1: float
+    expected_n_half_effect: float
+    max_n: int
+    min_n: int
+    monitoring_points: Sequence
+    efficiency_gain: float
+    weekly_visitors: Optional[int]
+    max_weeks: Optional[int]
+    variance_inflation_factor: float
+    mixing_variance_factor: float
+    spending_function: Optional[str]
+
+
 def calculate_msprt_plan(
     baseline_mean,
     std_known,
@@ -142,6 +360,7 @@ def calculate_msprt_plan(
     max_weeks=None,
     variance_inflation_factor=1.5,
     mixing_variance_factor=2.0,
+    spending_function=None,
 ):
     """
     Calculate mSPRT sequential testing plan with realistic variance adjustments
@@ -160,6 +379,8 @@ def calculate_msprt_plan(
         max_weeks: Maximum test duration in weeks (optional)
         variance_inflation_factor: Multiplier for variance to account for clustering/temporal effects (default: 1.5)
         mixing_variance_factor: Multiplier for mixing variance calibration (default: 2.0)
+        spending_function: Optional alpha-spending function ('obrien_fleming',
+            'pocock' or 'power') for group-sequential monitoring boundaries
 
     Returns:
         Dictionary with mSPRT plan and weekly monitoring table
@@ -233,6 +454,9 @@ def calculate_msprt_plan(
     expected_n_h0 = max(min_n, min(abs(expected_n_h0), max_n))
 
     # Generate monitoring points
+    boundary_provider = (
+        spending_boundary_provider(spending_function) if spending_function else None
+    )
     if weekly_visitors and max_weeks:
         monitoring_points = _generate_weekly_monitoring_table(
             baseline_mean,
@@ -242,6 +466,7 @@ def calculate_msprt_plan(
             weekly_visitors,
             max_weeks,
             use_t_test,
+            boundary_provider,
         )
     else:
         monitoring_points = _generate_monitoring_table(
@@ -252,6 +477,7 @@ def calculate_msprt_plan(
             min_n,
             max_n,
             use_t_test,
+            boundary_provider,
         )
 
     # Calculate expected timeline for 50% of the effect using shared function
@@ -266,41 +492,180 @@ def calculate_msprt_plan(
     else:
         expected_n_half_effect = max_n
 
+    return MSPRTPlanResult(
+        baseline_mean=baseline_mean,
+        baseline_std=baseline_std,
+        original_std=original_std,
+        std_method=std_method,
+        test_mean=test_mean,
+        absolute_improvement=absolute_improvement,
+        relative_improvement=relative_improvement,
+        effect_size=effect_size,
+        calibrated_effect_size=calibrated_effect_size,
+        use_t_test=use_t_test,
+        alpha=alpha,
+        beta=beta,
+        power=1 - beta,
+        A=A,
+        B=B,
+        expected_n_h0=expected_n_h0,
+        expected_n_h1=expected_n_h1,
+        expected_n_half_effect=expected_n_half_effect,
+        max_n=max_n,
+        min_n=min_n,
+        monitoring_points=monitoring_points,
+        efficiency_gain=((max_n - expected_n_h1) / max_n * 100),
+        weekly_visitors=weekly_visitors,
+        max_weeks=max_weeks,
+        variance_inflation_factor=variance_inflation_factor,
+        mixing_variance_factor=mixing_variance_factor,
+        spending_function=spending_function,
+    )
+
+
+def _as_python(value):
+    """Convert NumPy scalars to plain Python numbers for templates and JSON"""
+    return value.item() if hasattr(value, "item") else value
+
+
+class MonitoringTable(Sequence):
+    """
+    Monitoring points stored as columns, with row dicts built on access
+
+    Behaves like the list of dicts it replaces (len, indexing, iteration,
+    equality), but the per-look numbers live in one array per field and a
+    row dict only exists while a caller (e.g. the template loop) holds it.
+    Weekly tables also derive the display status and explanation per row.
+    """
+
+    def __init__(self, columns, absolute_improvement=None, baseline_mean=None):
+        self.columns = columns
+        self.absolute_improvement = absolute_improvement
+        self.baseline_mean = baseline_mean
+        self._length = len(columns["n"])
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("monitoring table index out of range")
+        return self._row(index)
+
+    def __eq__(self, other):
+        if isinstance(other, (MonitoringTable, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def _row(self, i):
+        row = {name: _as_python(column[i]) for name, column in self.columns.items()}
+        if self.baseline_mean is not None:
+            row["status"], row["explanation"] = _week_status_text(
+                self.absolute_improvement, row["boundary_upper"], self.baseline_mean
+            )
+        return row
+
+
+def _monitoring_columns(
+    sample_sizes,
+    baseline_std,
+    absolute_improvement,
+    baseline_mean,
+    alpha,
+    use_t_test,
+    boundary_provider=None,
+):
+    """
+    n, se, boundary and CI columns for every look in one vectorized pass
+
+    boundary_provider, if given, maps (sample_sizes, alpha, use_t_test) to one
+    critical value per look (see group_sequential.spending_boundary_provider)
+    in place of the fixed-alpha critical value.
+    """
+    if boundary_provider is not None:
+        if np is None:
+            raise ImportError("Custom boundary providers require NumPy")
+        n = np.asarray(sample_sizes)
+        critical = boundary_provider(n, alpha, use_t_test)
+        return _columns_from_critical(
+            n, critical, baseline_std, absolute_improvement, baseline_mean
+        )
+
+    if np is None:
+        se = [baseline_std * math.sqrt(2 / n) for n in sample_sizes]
+        boundary_upper = [
+            calculate_boundary_at_sample_size(n, baseline_std, alpha, use_t_test)
+            for n in sample_sizes
+        ]
+        ci_lower = [absolute_improvement - abs(b) for b in boundary_upper]
+        ci_upper = [absolute_improvement + abs(b) for b in boundary_upper]
+        return {
+            "n": list(sample_sizes),
+            "se": se,
+            "boundary_upper": boundary_upper,
+            "boundary_lower": [-b for b in boundary_upper],
+            "ci_lower": ci_lower,
+            "ci_upper": ci_upper,
+            "rel_ci_lower": [(c / baseline_mean) * 100 for c in ci_lower],
+            "rel_ci_upper": [(c / baseline_mean) * 100 for c in ci_upper],
+        }
+
+    n = np.asarray(sample_sizes)
+
+    # Calculate boundaries
+    if use_t_test:
+        df = 2 * n - 2
+        if np.any(df <= 0):
+            raise ValueError(
+                "t-test boundaries need more than one observation per group"
+            )
+        critical = t_ppf_batch(df, 1 - alpha / 2)
+    else:
+        critical = norm_ppf(1 - alpha / 2)
+    return _columns_from_critical(
+        n, critical, baseline_std, absolute_improvement, baseline_mean
+    )
+
+
+def _columns_from_critical(
+    n, critical, baseline_std, absolute_improvement, baseline_mean
+):
+    """Monitoring columns from per-look critical values (NumPy arrays)"""
+    se = baseline_std * np.sqrt(2 / n)
+    boundary_upper = critical * se
+
+    # Confidence intervals
+    ci_margin = np.abs(boundary_upper)
+    ci_lower = absolute_improvement - ci_margin
+    ci_upper = absolute_improvement + ci_margin
+
     return {
-        "baseline_mean": baseline_mean,
-        "baseline_std": baseline_std,
-        "original_std": original_std,
-        "std_method": std_method,
-        "test_mean": test_mean,
-        "absolute_improvement": absolute_improvement,
-        "relative_improvement": relative_improvement,
-        "effect_size": effect_size,
-        "calibrated_effect_size": calibrated_effect_size,
-        "use_t_test": use_t_test,
-        "alpha": alpha,
-        "beta": beta,
-        "power": 1 - beta,
-        "A": A,
-        "B": B,
-        "expected_n_h0": expected_n_h0,
-        "expected_n_h1": expected_n_h1,
-        "expected_n_half_effect": expected_n_half_effect,
-        "max_n": max_n,
-        "min_n": min_n,
-        "monitoring_points": monitoring_points,
-        "efficiency_gain": ((max_n - expected_n_h1) / max_n * 100),
-        "weekly_visitors": weekly_visitors,
-        "max_weeks": max_weeks,
-        "variance_inflation_factor": variance_inflation_factor,
-        "mixing_variance_factor": mixing_variance_factor,
+        "n": n,
+        "se": se,
+        "boundary_upper": boundary_upper,
+        "boundary_lower": -boundary_upper,
+        "ci_lower": ci_lower,
+        "ci_upper": ci_upper,
+        "rel_ci_lower": (ci_lower / baseline_mean) * 100,
+        "rel_ci_upper": (ci_upper / baseline_mean) * 100,
     }
 
 
 def _generate_monitoring_table(
-    baseline_std, absolute_improvement, baseline_mean, alpha, min_n, max_n, use_t_test
+    baseline_std,
+    absolute_improvement,
+    baseline_mean,
+    alpha,
+    min_n,
+    max_n,
+    use_t_test,
+    boundary_provider=None,
 ):
     """Generate monitoring table for different sample sizes"""
-    monitoring_points = []
     sample_sizes = [min_n] + [
         int(x)
         for x in [
@@ -316,41 +681,16 @@ def _generate_monitoring_table(
     ]
     sample_sizes = sorted(list(set([n for n in sample_sizes if min_n <= n <= max_n])))
 
-    for n in sample_sizes:
-        # Standard error at this sample size
-        se = baseline_std * math.sqrt(2 / n)
-
-        # Calculate boundaries
-        if use_t_test:
-            df = 2 * n - 2
-            t_alpha = t_ppf(df, 1 - alpha / 2) if df > 2 else 3.0
-            boundary_upper = t_alpha * se
-        else:
-            z_alpha = norm_ppf(1 - alpha / 2)
-            boundary_upper = z_alpha * se
-
-        # Confidence intervals
-        ci_margin = abs(boundary_upper)
-        ci_lower = absolute_improvement - ci_margin
-        ci_upper = absolute_improvement + ci_margin
-
-        rel_ci_lower = (ci_lower / baseline_mean) * 100
-        rel_ci_upper = (ci_upper / baseline_mean) * 100
-
-        monitoring_points.append(
-            {
-                "n": n,
-                "se": se,
-                "boundary_upper": boundary_upper,
-                "boundary_lower": -boundary_upper,
-                "ci_lower": ci_lower,
-                "ci_upper": ci_upper,
-                "rel_ci_lower": rel_ci_lower,
-                "rel_ci_upper": rel_ci_upper,
-            }
-        )
-
-    return monitoring_points
+    columns = _monitoring_columns(
+        sample_sizes,
+        baseline_std,
+        absolute_improvement,
+        baseline_mean,
+        alpha,
+        use_t_test,
+        boundary_provider,
+    )
+    return MonitoringTable(columns)
 
 
 def _generate_weekly_monitoring_table(
@@ -361,48 +701,81 @@ def _generate_weekly_monitoring_table(
     weekly_visitors,
     max_weeks,
     use_t_test,
+    boundary_provider=None,
 ):
-    """Generate weekly monitoring table using shared functions for consistency"""
-    monitoring_points = []
+    """
+    Generate weekly monitoring table (same boundaries as determine_week_status)
 
-    for week in range(1, max_weeks + 1):
-        # Use shared function to determine week status
-        week_status = determine_week_status(
-            week,
+    A boundary_provider replaces the fixed-alpha boundary, e.g. with
+    group-sequential alpha-spending boundaries.
+    """
+    if np is not None:
+        weeks = np.arange(1, max_weeks + 1)
+        sample_sizes = weeks * weekly_visitors
+    else:
+        weeks = list(range(1, max_weeks + 1))
+        sample_sizes = [weekly_visitors * week for week in weeks]
+
+    columns = {"week": weeks}
+    columns.update(
+        _monitoring_columns(
+            sample_sizes,
+            baseline_std,
             absolute_improvement,
             baseline_mean,
-            baseline_std,
             alpha,
-            weekly_visitors,
             use_t_test,
+            boundary_provider,
         )
+    )
+    return MonitoringTable(columns, absolute_improvement, baseline_mean)
+
 
-        # Add additional fields for backward compatibility
-        n = weekly_visitors * week
-        se = baseline_std * math.sqrt(2 / n)
-        boundary_upper = week_status["boundary_upper"]
-
-        # Confidence intervals
-        ci_margin = abs(boundary_upper)
-        ci_lower = absolute_improvement - ci_margin
-        ci_upper = absolute_improvement + ci_margin
-
-        rel_ci_lower = (ci_lower / baseline_mean) * 100
-        rel_ci_upper = (ci_upper / baseline_mean) * 100
-
-        # Combine shared function results with additional fields
-        monitoring_points.append(
-            {
-                **week_status,  # Include all fields from shared function
-                "se": se,
-                "ci_lower": ci_lower,
-                "ci_upper": ci_upper,
-                "rel_ci_lower": rel_ci_lower,
-                "rel_ci_upper": rel_ci_upper,
-            }
+def _first_significant_week(results):
+    """
+    First week whose status is a significant improvement, or None
+
+    The fixed-alpha boundary decreases with n, so the crossing week is the
+    sample size solved by calculate_sample_size_for_boundary, rounded up to
+    whole weeks and checked against the neighbouring weeks' boundaries.
+    Spending-function tables are searched on their boundary column instead.
+    """
+    delta = results["absolute_improvement"]
+    weekly_visitors = results["weekly_visitors"]
+    max_weeks = results["max_weeks"]
+    if delta <= 0 or not max_weeks:
+        return None
+
+    if results.get("spending_function"):
+        for point_week, boundary in zip(
+            results["monitoring_points"].columns["week"],
+            results["monitoring_points"].columns["boundary_upper"],
+        ):
+            if _week_status_code(delta, boundary) is WeekStatus.SIGNIFICANT_IMPROVEMENT:
+                return _as_python(point_week)
+        return None
+
+    baseline_std = results["baseline_std"]
+    alpha = results["alpha"]
+    use_t_test = results["use_t_test"]
+
+    def significant(week):
+        boundary = calculate_boundary_at_sample_size(
+            weekly_visitors * week, baseline_std, alpha, use_t_test
         )
+        return _week_status_code(delta, boundary) is WeekStatus.SIGNIFICANT_IMPROVEMENT
 
-    return monitoring_points
+    n_required = calculate_sample_size_for_boundary(
+        delta, baseline_std, alpha, use_t_test
+    )
+    week = max(1, math.ceil(n_required / weekly_visitors))
+
+    # Rounding at the crossing can leave the solved week one off either way
+    while week > 1 and significant(week - 1):
+        week -= 1
+    while week <= max_weeks and not significant(week):
+        week += 1
+    return week if week <= max_weeks else None
 
 
 def validate_msprt_consistency(results):
@@ -418,12 +791,7 @@ def validate_msprt_consistency(results):
     if not results.get("weekly_visitors") or not results.get("monitoring_points"):
         return {"consistent": True, "reason": "No weekly monitoring data to validate"}
 
-    # Find first significant week
-    first_significant_week = None
-    for point in results["monitoring_points"]:
-        if "✅ Significant" in point["status"]:
-            first_significant_week = point["week"]
-            break
+    first_significant_week = _first_significant_week(results)
 
     if first_significant_week is None:
         return {
@@ -446,3 +814,224 @@ def validate_msprt_consistency(results):
         "tolerance": 2.0,
         "reason": f"Expected: {expected_weeks: .1f}w, Actual: {first_significant_week}w, Diff: {difference: .1f}w",
     }
+
+
+def validate_msprt_consistency_grid(parameter_grid, **fixed_parameters):
+    """
+    Validate consistency for every combination of a parameter grid.
+
+    Intended for regression testing: each combination is planned with
+    calculate_msprt_plan() and checked with validate_msprt_consistency().
+
+    Args:
+        parameter_grid: Dict of calculate_msprt_plan() argument -> list of values
+        **fixed_parameters: Arguments shared by every combination
+
+    Returns:
+        dict: cases (parameters and validation per combination), checked,
+            inconsistent (the failing cases) and consistent (all passed)
+    """
+    names = list(parameter_grid)
+    cases = []
+    for values in itertools.product(*(parameter_grid[name] for name in names)):
+        parameters = dict(fixed_parameters, **dict(zip(names, values)))
+        validation = validate_msprt_consistency(calculate_msprt_plan(**parameters))
+        cases.append({"parameters": parameters, "validation": validation})
+
+    inconsistent = [case for case in cases if not case["validation"]["consistent"]]
+    return {
+        "cases": cases,
+        "checked": len(cases),
+        "inconsistent": inconsistent,
+        "consistent": not inconsistent,
+    }
+
+
+class _ArmStatistics:
+    """Running count, sum and sum of squares for one arm (shifted for stability)"""
+
+    __slots__ = ("count", "shift", "total", "total_sq")
+
+    def __init__(self):
+        self.count = 0
+        self.shift = None
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, value):
+        if self.shift is None:
+            self.shift = value
+        d = value - self.shift
+        self.count += 1
+        self.total += d
+        self.total_sq += d * d
+
+    def add_batch(self, values):
+        if np is not None:
+            values = np.asarray(values, dtype=float).ravel()
+            if values.size == 0:
+                return
+            if self.shift is None:
+                self.shift = float(values[0])
+            d = values - self.shift
+            self.count += values.size
+            self.total += float(d.sum())
+            self.total_sq += float(np.dot(d, d))
+        else:
+            for value in values:
+                self.add(value)
+
+    @property
+    def mean(self):
+        return self.shift + self.total / self.count
+
+    @property
+    def m2(self):
+        """Sum of squared deviations from the mean"""
+        return max(0.0, self.total_sq - self.total * self.total / self.count)
+
+
+class MSPRTMonitor:
+    """
+    Streaming mSPRT for a live two-arm experiment
+
+    Keeps only per-arm running count, sum and sum of squares, so each
+    observation (or batch) is an O(1) update and raw data is never stored.
+    After every update the normal-mixture likelihood ratio is re-evaluated:
+
+        Lambda = sqrt(V / (V + tau^2)) * exp(tau^2 * diff^2 / (2 V (V + tau^2)))
+
+    where diff is the treatment minus control mean, V its variance and tau^2
+    the mixing variance. The always-valid p-value is the running minimum of
+    1 / Lambda; the stop decision uses the plan's A and B thresholds.
+    """
+
+    def __init__(self, alpha, beta, mixing_variance, baseline_std=None):
+        """
+        Args:
+            alpha: Type I error rate
+            beta: Type II error rate
+            mixing_variance: Variance tau^2 of the normal mixing distribution,
+                in squared metric units
+            baseline_std: Per-observation standard deviation if known; when
+                None the pooled sample variance is plugged in
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("Alpha must be between 0 and 1")
+        if not 0 < beta < 1:
+            raise ValueError("Beta must be between 0 and 1")
+        if mixing_variance <= 0:
+            raise ValueError("Mixing variance must be positive")
+        if baseline_std is not None and baseline_std <= 0:
+            raise ValueError("Baseline standard deviation must be positive")
+
+        self.alpha = alpha
+        self.beta = beta
+        self.mixing_variance = mixing_variance
+        self.baseline_std = baseline_std
+        self.A = (1 - beta) / alpha  # Upper threshold (reject H0)
+        self.B = beta / (1 - alpha)  # Lower threshold (accept H0)
+
+        self._arms = {arm: _ArmStatistics() for arm in ARMS}
+        self.likelihood_ratio = 1.0
+        self.p_value = 1.0
+        self.decision = "continue"
+        self.stopped_at = None
+        self.looks = 0
+
+    @classmethod
+    def from_plan(cls, results):
+        """
+        Build a monitor from the output of calculate_msprt_plan()
+
+        The mixing variance is the squared calibrated effect in metric units,
+        delta^2 / mixing_variance_factor, centring the mixture on the effect
+        the plan was sized for.
+        """
+        delta = results["absolute_improvement"]
+        if delta == 0:
+            raise ValueError("Plan must have a non-zero expected improvement")
+
+        baseline_std = None if results["use_t_test"] else results["baseline_std"]
+        return cls(
+            alpha=results["alpha"],
+            beta=results["beta"],
+            mixing_variance=delta**2 / results["mixing_variance_factor"],
+            baseline_std=baseline_std,
+        )
+
+    def _arm(self, arm):
+        try:
+            return self._arms[arm]
+        except KeyError:
+            raise ValueError(f"Arm must be one of {', '.join(ARMS)}")
+
+    def add(self, arm, value):
+        """Add a single observation to an arm and re-evaluate the test"""
+        self._arm(arm).add(value)
+        return self._evaluate()
+
+    def add_batch(self, arm, values):
+        """Add a batch of observations to an arm as one look"""
+        self._arm(arm).add_batch(values)
+        return self._evaluate()
+
+    def _variance_of_difference(self):
+        control, treatment = self._arms["control"], self._arms["treatment"]
+        if self.baseline_std is not None:
+            variance = self.baseline_std**2
+        else:
+            dof = control.count + treatment.count - 2
+            if dof <= 0:
+                return None
+            variance = (control.m2 + treatment.m2) / dof
+        return variance * (1 / control.count + 1 / treatment.count)
+
+    def _evaluate(self):
+        self.looks += 1
+        control, treatment = self._arms["control"], self._arms["treatment"]
+        if control.count == 0 or treatment.count == 0:
+            return self.state()
+
+        v = self._variance_of_difference()
+        if not v:
+            return self.state()
+
+        tau2 = self.mixing_variance
+        diff = treatment.mean - control.mean
+        log_lr = 0.5 * math.log(v / (v + tau2)) + tau2 * diff * diff / (
+            2 * v * (v + tau2)
+        )
+        self.likelihood_ratio = math.exp(min(log_lr, 700.0))
+        self.p_value = min(self.p_value, 1 / self.likelihood_ratio)
+
+        if self.decision == "continue":
+            if self.likelihood_ratio >= self.A:
+                self.decision = "reject_h0"
+            elif self.likelihood_ratio <= self.B:
+                self.decision = "accept_h0"
+            if self.decision != "continue":
+                self.stopped_at = (control.count, treatment.count)
+
+        return self.state()
+
+    def state(self):
+        """Current monitoring state"""
+        control, treatment = self._arms["control"], self._arms["treatment"]
+        control_mean = control.mean if control.count else None
+        treatment_mean = treatment.mean if treatment.count else None
+        difference = (
+            treatment_mean - control_mean if control.count and treatment.count else None
+        )
+        return {
+            "n_control": control.count,
+            "n_treatment": treatment.count,
+            "control_mean": control_mean,
+            "treatment_mean": treatment_mean,
+            "difference": difference,
+            "likelihood_ratio": self.likelihood_ratio,
+            "p_value": self.p_value,
+            "decision": self.decision,
+            "stopped_at": self.stopped_at,
+            "looks": self.looks,
+        }
@@ -0,0 +1,227 @@
+"""
+Mergeable streaming quantile sketch (KLL) for inputs too large to hold
+"""
+import math
+import random
+from bisect import bisect_left
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only update_array() needs it
+    np = None
+
+# Default number of items kept at the top level; about 3 * k items are
+# retained in total and the rank error is typically under 2 / k
+DEFAULT_SKETCH_SIZE = 200
+
+# Each lower level keeps this fraction of the capacity of the level above
+_CAPACITY_DECAY = 2 / 3
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a stream in bounded memory (Karnin-Lang-Liberty)
+
+    Values are buffered in a stack of compactors. When a level fills up it is
+    sorted and every other item (randomly the odd or even ones) moves up a
+    level with twice the weight, so memory stays at O(k) however many values
+    are added. Sketches built over separate chunks or workers merge into one
+    with the same accuracy guarantee. Count, min and max are exact.
+    """
+
+    def __init__(self, k=DEFAULT_SKETCH_SIZE, seed=None):
+        """
+        Args:
+            k: Accuracy parameter; larger k means smaller rank error and
+                proportionally more memory (must be at least 8)
+            seed: Seed for the compaction coin flips (for reproducible sketches)
+        """
+        if k < 8:
+            raise ValueError("Sketch size k must be at least 8")
+        self.k = int(k)
+        self.n = 0
+        self.min = None
+        self.max = None
+        self._random = random.Random(seed)
+        self._compactors = []
+        self._size = 0
+        self._max_size = 0
+        self._grow()
+
+    def _grow(self):
+        self._compactors.append([])
+        self._max_size = sum(
+            self._capacity(level) for level in range(len(self._compactors))
+        )
+
+    def _capacity(self, level):
+        depth = len(self._compactors) - level - 1
+        return int(math.ceil(_CAPACITY_DECAY**depth * self.k)) + 1
+
+    def _compress(self):
+        for level in range(len(self._compactors)):
+            compactor = self._compactors[level]
+            if len(compactor) >= self._capacity(level):
+                if level + 1 == len(self._compactors):
+                    self._grow()
+                compactor.sort()
+                # An odd leftover item stays behind at this level
+                keep = compactor.pop() if len(compactor) % 2 else None
+                offset = self._random.getrandbits(1)
+                self._compactors[level + 1].extend(compactor[offset::2])
+                compactor[:] = [] if keep is None else [keep]
+                self._size = sum(len(items) for items in self._compactors)
+                if self._size < self._max_size:
+                    return
+
+    def add(self, value):
+        """Add one value"""
+        self.update((value,))
+
+    def update(self, values):
+        """
+        Add every value from an iterable (consumed once)
+
+        Returns:
+            QuantileSketch: self, for chaining
+        """
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, max(self._max_size - self._size, 1)))
+            if not chunk:
+                return self
+            low, high = min(chunk), max(chunk)
+            if self.min is None or low < self.min:
+                self.min = low
+            if self.max is None or high > self.max:
+                self.max = high
+            self._compactors[0].extend(chunk)
+            self.n += len(chunk)
+            self._size += len(chunk)
+            if self._size >= self._max_size:
+                self._compress()
+
+    def update_array(self, values):
+        """
+        Add a NumPy array chunk, sorted and pre-compacted in vectorized form
+
+        A sorted block halved with a random offset is exactly one compaction
+        step, so the chunk is halved until it fits the sketch and lands
+        directly at the level matching its weight; only about k values per
+        chunk are turned into Python floats.
+
+        Returns:
+            QuantileSketch: self, for chaining
+        """
+        if np is None:
+            raise ImportError("Array sketching requires NumPy")
+        values = np.sort(np.asarray(values, dtype=float).ravel())
+        if not values.size:
+            return self
+        low, high = float(values[0]), float(values[-1])
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        self.n += int(values.size)
+
+        level = 0
+        while values.size > self.k:
+            while len(self._compactors) <= level + 1:
+                self._grow()
+            if values.size % 2:
+                # As in _compress, an odd leftover item stays at this level
+                self._compactors[level].append(float(values[-1]))
+                values = values[:-1]
+            values = values[self._random.getrandbits(1) :: 2]
+            level += 1
+        while len(self._compactors) <= level:
+            self._grow()
+        self._compactors[level].extend(values.tolist())
+        self._size = sum(len(items) for items in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one
+
+        Returns:
+            QuantileSketch: self, for chaining
+        """
+        if other.n == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for level, items in enumerate(other._compactors):
+            self._compactors[level].extend(items)
+        self.n += other.n
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._size = sum(len(items) for items in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted_items(self):
+        """Retained values in sorted order with their cumulative weights"""
+        items = sorted(
+            (value, 1 << level)
+            for level, compactor in enumerate(self._compactors)
+            for value in compactor
+        )
+        cumulative = []
+        total = 0
+        for _, weight in items:
+            total += weight
+            cumulative.append(total)
+        return [value for value, _ in items], cumulative
+
+    def quantiles(self, probabilities):
+        """
+        Approximate quantiles for several probabilities from one sorted view
+
+        Args:
+            probabilities: Iterable of probabilities in [0, 1]
+
+        Returns:
+            list: One value per probability (exact min and max at 0 and 1)
+        """
+        if self.n == 0:
+            raise ValueError("Sketch is empty")
+        values, cumulative = self._weighted_items()
+        total = cumulative[-1]
+        result = []
+        for p in probabilities:
+            if not 0 <= p <= 1:
+                raise ValueError("Probabilities must be between 0 and 1")
+            if p == 0:
+                result.append(self.min)
+            elif p == 1:
+                result.append(self.max)
+            else:
+                result.append(values[bisect_left(cumulative, p * total)])
+        return result
+
+    def quantile(self, p):
+        """Approximate quantile for one probability"""
+        return self.quantiles((p,))[0]
+
+    def rank(self, value):
+        """Approximate fraction of values less than or equal to value"""
+        if self.n == 0:
+            raise ValueError("Sketch is empty")
+        weight = sum(
+            (1 << level) * sum(1 for item in compactor if item <= value)
+            for level, compactor in enumerate(self._compactors)
+        )
+        total = sum(
+            (1 << level) * len(compactor)
+            for level, compactor in enumerate(self._compactors)
+        )
+        return weight / total
+
+    @property
+    def retained(self):
+        """Number of values currently held in memory"""
+        return self._size
@@ -0,0 +1,51 @@
+"""
+Slotted result records shared by the calculators
+"""
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+
+
+class ResultRecord(Mapping):
+    """
+    Read-only mapping view over a slotted dataclass
+
+    Fields are plain attributes (so templates can use result.mean), while
+    the Mapping interface keeps result["mean"], "mean" in result, .get()
+    and **result working for existing callers. to_dict() builds a real dict
+    only when one is needed.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.__dataclass_fields__)
+
+    def __len__(self):
+        return len(self.__dataclass_fields__)
+
+    def to_dict(self):
+        """Plain dict copy of the fields"""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+def result_record(cls):
+    """
+    Turn a ResultRecord subclass into a dataclass with __slots__
+
+    Equivalent to dataclass(slots=True, eq=False), which needs Python 3.10;
+    equality comes from Mapping, so records compare equal to matching dicts.
+    """
+    cls = dataclass(eq=False)(cls)
+    names = tuple(field.name for field in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
@@ -0,0 +1,140 @@
+"""
+Linear-time order statistics (median and percentiles) without sorting
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, quickselect is used without it
+    np = None
+
+# Percentiles reported alongside the median when requested
+PERCENTILE_LEVELS = (1, 5, 25, 75, 95, 99)
+
+# Below this size converting to an array costs more than it saves
+NUMPY_MIN_SIZE = 2000
+
+
+def _median_of_three(values):
+    a, b, c = values[0], values[len(values) // 2], values[-1]
+    if a < b:
+        return b if b < c else (c if a < c else a)
+    return a if a < c else (c if b < c else b)
+
+
+def order_statistics(values, ranks):
+    """
+    Values at several sorted positions, found in one multi-selection pass
+
+    Each partition step splits the remaining values around a pivot and sends
+    every requested rank to the side that contains it, so k ranks cost
+    O(n log k) expected time rather than a full O(n log n) sort.
+
+    Args:
+        values: Sequence of numbers (not modified)
+        ranks: Iterable of 0-based positions in sorted order
+
+    Returns:
+        dict: rank -> value at that rank
+    """
+    n = len(values)
+    wanted = sorted(set(ranks))
+    if not wanted:
+        return {}
+    if wanted[0] < 0 or wanted[-1] >= n:
+        raise ValueError(f"Ranks must be between 0 and {n - 1}")
+
+    if np is not None and n >= NUMPY_MIN_SIZE:
+        partitioned = np.partition(np.asarray(values, dtype=float), wanted)
+        return {rank: float(partitioned[rank]) for rank in wanted}
+
+    found = {}
+    stack = [(values, 0, wanted)]
+    while stack:
+        part, offset, part_ranks = stack.pop()
+        if len(part) <= 16:
+            ordered = sorted(part)
+            for rank in part_ranks:
+                found[rank] = ordered[rank - offset]
+            continue
+
+        pivot = _median_of_three(part)
+        lower = [x for x in part if x < pivot]
+        upper = [x for x in part if x > pivot]
+        equal_start = offset + len(lower)
+        equal_stop = offset + len(part) - len(upper)
+
+        lower_ranks, upper_ranks = [], []
+        for rank in part_ranks:
+            if rank < equal_start:
+                lower_ranks.append(rank)
+            elif rank >= equal_stop:
+                upper_ranks.append(rank)
+            else:
+                found[rank] = pivot
+        if lower_ranks:
+            stack.append((lower, offset, lower_ranks))
+        if upper_ranks:
+            stack.append((upper, equal_stop, upper_ranks))
+    return found
+
+
+def quantiles(values, probabilities):
+    """
+    Quantiles with linear interpolation between order statistics
+
+    Uses the same definition as numpy.percentile's default (position
+    p * (n - 1)), so the 0.5 quantile is the usual median.
+
+    Args:
+        values: Sequence of numbers
+        probabilities: Iterable of probabilities in [0, 1]
+
+    Returns:
+        list: One quantile per probability, in the order given
+    """
+    return quantiles_with_ranks(values, probabilities, ())[0]
+
+
+def quantiles_with_ranks(values, probabilities, ranks):
+    """
+    Quantiles plus extra order statistics, all from one selection pass
+
+    Args:
+        values: Sequence of numbers
+        probabilities: Iterable of probabilities in [0, 1]
+        ranks: Iterable of additional 0-based positions in sorted order
+
+    Returns:
+        tuple: (list of quantiles as in quantiles(), dict rank -> value
+            covering ranks)
+    """
+    n = len(values)
+    if n == 0:
+        raise ValueError("Need at least 1 data point")
+    positions = []
+    for p in probabilities:
+        if not 0 <= p <= 1:
+            raise ValueError("Probabilities must be between 0 and 1")
+        positions.append(p * (n - 1))
+
+    wanted = set(ranks)
+    for position in positions:
+        wanted.add(math.floor(position))
+        wanted.add(math.ceil(position))
+    found = order_statistics(values, wanted)
+
+    result = []
+    for position in positions:
+        low, high = math.floor(position), math.ceil(position)
+        if low == high:
+            result.append(found[low])
+        else:
+            weight = position - low
+            result.append(found[low] * (1 - weight) + found[high] * weight)
+    return result, found
+
+
+def median(values):
+    """Median of a sequence in expected O(n) time"""
+    return quantiles(values, (0.5,))[0]
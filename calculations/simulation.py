@@ -0,0 +1,270 @@
+"""
+Monte Carlo operating characteristics for mSPRT plans
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required here, checked when a simulation starts
+    np = None
+
+DEFAULT_SHARD_SIZE = 2000
+
+SCENARIOS = ("h0", "h1")
+
+
+def _look_sample_sizes(results):
+    """Per-group sample size at each look of the plan's monitoring table"""
+    table = results["monitoring_points"]
+    columns = getattr(table, "columns", None)
+    sizes = columns["n"] if columns is not None else [point["n"] for point in table]
+    sizes = np.asarray(sizes, dtype=float)
+    if sizes.size == 0 or sizes[0] < 1 or np.any(np.diff(sizes) <= 0):
+        raise ValueError("Monitoring looks must have increasing sample sizes")
+    return sizes
+
+
+def _simulation_parameters(results, data_std):
+    """Everything a shard needs, as plain picklable values"""
+    delta = results["absolute_improvement"]
+    if delta == 0:
+        raise ValueError("Plan must have a non-zero expected improvement")
+
+    plan_std = results["baseline_std"]
+    return {
+        "looks": _look_sample_sizes(results),
+        "A": results["A"],
+        "B": results["B"],
+        "mixing_variance": delta**2 / results["mixing_variance_factor"],
+        "plan_std": plan_std,
+        "data_std": plan_std if data_std is None else data_std,
+        "delta": delta,
+        "use_t_test": results["use_t_test"],
+    }
+
+
+def _simulate_arm(rng, params, size, mean):
+    """
+    Cumulative sum and sum of squared deviations of one arm at every look
+
+    Each look's batch is drawn through its sufficient statistics: the batch
+    mean is normal and the within-batch sum of squares is sigma^2 chi^2(m - 1),
+    so the cost is O(looks) per simulated experiment whatever the traffic.
+    """
+    looks = params["looks"]
+    batch = np.diff(looks, prepend=0.0)
+    sigma = params["data_std"]
+
+    batch_mean = mean + sigma / np.sqrt(batch) * rng.standard_normal((size, batch.size))
+    total = np.cumsum(batch * batch_mean, axis=1)
+    if not params["use_t_test"]:
+        return total, None
+
+    within = sigma**2 * rng.gamma((batch - 1) / 2, 2.0, (size, batch.size))
+    total_sq = np.cumsum(within + batch * batch_mean**2, axis=1)
+    return total, np.maximum(total_sq - total**2 / looks, 0.0)
+
+
+def _simulate_scenario(rng, params, size, effect):
+    """Stopping look (len(looks) if never stopped) and decision per experiment"""
+    looks = params["looks"]
+    control_sum, control_m2 = _simulate_arm(rng, params, size, 0.0)
+    treatment_sum, treatment_m2 = _simulate_arm(rng, params, size, effect)
+    diff = (treatment_sum - control_sum) / looks
+
+    if params["use_t_test"]:
+        dof = 2 * looks - 2
+        pooled = (control_m2 + treatment_m2) / np.where(dof > 0, dof, 1)
+        v = pooled * (2 / looks)
+    else:
+        dof = None
+        v = np.broadcast_to(params["plan_std"] ** 2 * (2 / looks), diff.shape)
+
+    tau2 = params["mixing_variance"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_lr = 0.5 * np.log(v / (v + tau2)) + tau2 * diff * diff / (
+            2 * v * (v + tau2)
+        )
+    valid = v > 0
+    if dof is not None:
+        valid &= dof > 0
+    log_lr = np.where(valid, log_lr, 0.0)
+
+    reject = log_lr >= math.log(params["A"])
+    accept = log_lr <= math.log(params["B"])
+    stopped = reject | accept
+    stop_look = np.where(stopped.any(axis=1), stopped.argmax(axis=1), looks.size)
+    rows = np.arange(size)
+    last = np.minimum(stop_look, looks.size - 1)
+    rejected = (stop_look < looks.size) & reject[rows, last]
+    accepted = (stop_look < looks.size) & accept[rows, last] & ~rejected
+    return stop_look, rejected, accepted
+
+
+def _simulate_shard(params, seed_sequence, size):
+    """Simulate one shard under H0 and H1 and reduce it to counts"""
+    rng = np.random.default_rng(seed_sequence)
+    looks = params["looks"]
+    counts = {}
+    for scenario, effect in zip(SCENARIOS, (0.0, params["delta"])):
+        stop_look, rejected, accepted = _simulate_scenario(rng, params, size, effect)
+        stop_n = np.append(looks, looks[-1])[stop_look]
+        counts[scenario] = {
+            "rejections": int(rejected.sum()),
+            "acceptances": int(accepted.sum()),
+            "stopping_looks": np.bincount(stop_look, minlength=looks.size + 1),
+            "total_n": float(stop_n.sum()),
+        }
+    return counts
+
+
+def _proportion_error(successes, trials):
+    """Agresti-Coull standard error, non-zero even when no event was seen yet"""
+    p = (successes + 2) / (trials + 4)
+    return math.sqrt(p * (1 - p) / (trials + 4))
+
+
+def _estimates(totals, simulations, params, n_sims):
+    """Running estimates from the counts accumulated so far"""
+    h0, h1 = totals["h0"], totals["h1"]
+    looks = params["looks"]
+    return {
+        "simulations": simulations,
+        "complete": simulations >= n_sims,
+        "type_i_error": h0["rejections"] / simulations,
+        "type_i_error_se": _proportion_error(h0["rejections"], simulations),
+        "power": h1["rejections"] / simulations,
+        "power_se": _proportion_error(h1["rejections"], simulations),
+        "futility_rate_h1": h1["acceptances"] / simulations,
+        "expected_n_h0": h0["total_n"] / simulations,
+        "expected_n_h1": h1["total_n"] / simulations,
+        "look_sample_sizes": looks.tolist(),
+        # One entry per look plus a final "never stopped" bucket
+        "stopping_distribution_h0": (h0["stopping_looks"] / simulations).tolist(),
+        "stopping_distribution_h1": (h1["stopping_looks"] / simulations).tolist(),
+    }
+
+
+def iter_msprt_simulation(
+    results,
+    n_sims=10000,
+    seed=None,
+    workers=1,
+    shard_size=DEFAULT_SHARD_SIZE,
+    data_std=None,
+):
+    """
+    Stream Monte Carlo estimates for an mSPRT plan, one shard at a time
+
+    Simulates experiments under H0 (no effect) and H1 (the planned effect),
+    looking at the data at every sample size in the plan's monitoring table
+    and applying the mixture likelihood ratio against the plan's A and B
+    thresholds, as MSPRTMonitor does. Shards are vectorized NumPy batches;
+    with workers > 1 they run in a process pool. Each shard draws from its
+    own child of SeedSequence(seed), so results depend only on seed and
+    shard_size, never on the number of workers.
+
+    Closing the generator early (e.g. breaking out of the loop once the
+    standard errors are small enough) cancels the shards not yet started.
+
+    Args:
+        results: Output of calculate_msprt_plan()
+        n_sims: Number of simulated experiments per scenario
+        seed: Seed for reproducible results (None for fresh entropy)
+        workers: Number of worker processes (1 runs in-process)
+        shard_size: Simulated experiments per shard
+        data_std: True per-observation standard deviation of the simulated
+            data (defaults to the plan's adjusted standard deviation)
+
+    Yields:
+        dict: Cumulative estimates after each completed shard
+    """
+    if np is None:
+        raise ImportError("mSPRT simulation requires NumPy")
+    if n_sims < 1:
+        raise ValueError("Number of simulations must be at least 1")
+    if shard_size < 1:
+        raise ValueError("Shard size must be at least 1")
+    if workers < 1:
+        raise ValueError("Workers must be at least 1")
+
+    params = _simulation_parameters(results, data_std)
+    sizes = [shard_size] * (n_sims // shard_size)
+    if n_sims % shard_size:
+        sizes.append(n_sims % shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    totals = {
+        scenario: {
+            "rejections": 0,
+            "acceptances": 0,
+            "stopping_looks": np.zeros(params["looks"].size + 1, dtype=np.int64),
+            "total_n": 0.0,
+        }
+        for scenario in SCENARIOS
+    }
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    futures = []
+    try:
+        if executor is None:
+            shards = map(_simulate_shard, [params] * len(sizes), seeds, sizes)
+        else:
+            futures = [
+                executor.submit(_simulate_shard, params, shard_seed, size)
+                for shard_seed, size in zip(seeds, sizes)
+            ]
+            shards = (future.result() for future in futures)
+
+        simulations = 0
+        for size, counts in zip(sizes, shards):
+            simulations += size
+            for scenario in SCENARIOS:
+                for key, value in counts[scenario].items():
+                    totals[scenario][key] += value
+            yield _estimates(totals, simulations, params, n_sims)
+    finally:
+        if executor is not None:
+            # Shards not yet started are dropped (cancel_futures needs 3.9+)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+def simulate_msprt_plan(
+    results,
+    n_sims=10000,
+    seed=None,
+    workers=1,
+    shard_size=DEFAULT_SHARD_SIZE,
+    data_std=None,
+    tolerance=None,
+):
+    """
+    Estimate type I error, power and stopping times of an mSPRT plan
+
+    Args:
+        results: Output of calculate_msprt_plan()
+        n_sims: Number of simulated experiments per scenario
+        seed: Seed for reproducible results (None for fresh entropy)
+        workers: Number of worker processes (1 runs in-process)
+        shard_size: Simulated experiments per shard
+        data_std: True standard deviation of the simulated data (optional)
+        tolerance: Stop early once the standard errors of both the type I
+            error and power estimates are at or below this value (optional)
+
+    Returns:
+        dict: Final estimates (see iter_msprt_simulation)
+    """
+    estimates = None
+    for estimates in iter_msprt_simulation(
+        results, n_sims, seed, workers, shard_size, data_std
+    ):
+        if (
+            tolerance is not None
+            and estimates["type_i_error_se"] <= tolerance
+            and estimates["power_se"] <= tolerance
+        ):
+            break
+    return estimates
@@ -2,21 +2,31 @@
 Statistical functions for A/B testing calculations
 """
 import math
+from array import array
 
+from . import student_t
+from .critical_values import T_CRITICAL, Z_CRITICAL
 
-def norm_ppf(p):
-    """Approximation of the inverse normal CDF"""
-    if p <= 0 or p >= 1:
-        raise ValueError("p must be between 0 and 1")
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch functions fall back to array('d')
+    np = None
+
+# Coefficients for the normal quantile approximation (Abramowitz & Stegun 26.2.23)
+_PPF_C = (2.515517, 0.802853, 0.010328)
+_PPF_D = (1.432788, 0.189269, 0.001308)
 
+
+def _norm_ppf(p):
+    """Inverse normal CDF kernel shared by the scalar and fallback batch paths"""
     if p < 0.5:
-        return -norm_ppf(1 - p)
+        return -_norm_ppf(1 - p)
 
     p = p - 0.5
     t = math.sqrt(-2 * math.log(0.5 - p))
 
-    c0, c1, c2 = 2.515517, 0.802853, 0.010328
-    d1, d2, d3 = 1.432788, 0.189269, 0.001308
+    c0, c1, c2 = _PPF_C
+    d1, d2, d3 = _PPF_D
 
     numerator = c0 + c1 * t + c2 * t * t
     denominator = 1 + d1 * t + d2 * t * t + d3 * t * t * t
@@ -24,20 +34,181 @@ def norm_ppf(p):
     return t - numerator / denominator
 
 
+def _t_ppf(df, p):
+    """t-distribution inverse CDF kernel (exact, memoized per (df, p))"""
+    # Fast path: precomputed critical values for the common (df, p) pairs
+    if p < 0.5:
+        critical = T_CRITICAL.get((df, 1 - p))
+        if critical is not None:
+            return -critical
+    else:
+        critical = T_CRITICAL.get((df, p))
+        if critical is not None:
+            return critical
+
+    return student_t.t_quantile(df, p)
+
+
+def norm_ppf(p):
+    """Approximation of the inverse normal CDF"""
+    if p <= 0 or p >= 1:
+        raise ValueError("p must be between 0 and 1")
+
+    # Fast path: precomputed critical values for the common alpha/power settings
+    if p < 0.5:
+        critical = Z_CRITICAL.get(1 - p)
+        if critical is not None:
+            return -critical
+    else:
+        critical = Z_CRITICAL.get(p)
+        if critical is not None:
+            return critical
+
+    return _norm_ppf(p)
+
+
 def norm_cdf(x):
     """Approximation of the normal CDF"""
     return 0.5 * (1 + math.erf(x / math.sqrt(2)))
 
 
 def t_ppf(df, p):
-    """Approximation of t-distribution inverse CDF"""
-    if df >= 30:
-        return norm_ppf(p)
-
-    # Simple approximation for t-distribution
-    z = norm_ppf(p)
-    correction = (z**3 + z) / (4 * df)
-    return z + correction
+    """Exact t-distribution inverse CDF (see calculations.student_t)"""
+    if p <= 0 or p >= 1:
+        raise ValueError("p must be between 0 and 1")
+
+    return _t_ppf(df, p)
+
+
+def _as_batch(values):
+    """Coerce a scalar or sequence to a float array (NumPy if available)"""
+    if np is not None:
+        return np.asarray(values, dtype=float)
+    if isinstance(values, (int, float)):
+        return array("d", [values])
+    return array("d", values)
+
+
+def _check_probabilities(p):
+    """Raise ValueError if any probability lies outside the open interval (0, 1)"""
+    if np is not None:
+        invalid = np.any((p <= 0) | (p >= 1) | np.isnan(p))
+    else:
+        invalid = any(not 0 < value < 1 for value in p)
+    if invalid:
+        raise ValueError("p must be between 0 and 1")
+
+
+def _np_norm_ppf(p):
+    """Vectorized inverse normal CDF, same arithmetic as _norm_ppf"""
+    upper = np.where(p < 0.5, 1 - p, p)
+    t = np.sqrt(-2 * np.log(0.5 - (upper - 0.5)))
+
+    c0, c1, c2 = _PPF_C
+    d1, d2, d3 = _PPF_D
+
+    numerator = c0 + c1 * t + c2 * t * t
+    denominator = 1 + d1 * t + d2 * t * t + d3 * t * t * t
+
+    z = t - numerator / denominator
+    return np.where(p < 0.5, -z, z)
+
+
+def _np_erf(x):
+    """math.erf per element, so batch results match norm_cdf bit for bit"""
+    return np.asarray(np.frompyfunc(math.erf, 1, 1)(x), dtype=float)
+
+
+def norm_ppf_batch(p):
+    """
+    Inverse normal CDF for many probabilities in one vectorized pass
+
+    Args:
+        p: Scalar or sequence of probabilities in (0, 1)
+
+    Returns:
+        NumPy array (or array('d') when NumPy is not installed)
+    """
+    p = _as_batch(p)
+    _check_probabilities(p)
+
+    if np is not None:
+        z = _np_norm_ppf(p)
+        # Table entries keep batch results bit-identical to norm_ppf for hot
+        # values: one sorted lookup of the upper tail, as norm_ppf does
+        keys = np.array(sorted(Z_CRITICAL))
+        critical = np.array([Z_CRITICAL[q] for q in keys])
+        upper = np.where(p < 0.5, 1 - p, p)
+        index = np.minimum(np.searchsorted(keys, upper), keys.size - 1)
+        hit = keys[index] == upper
+        z[hit] = np.where(p[hit] < 0.5, -critical[index[hit]], critical[index[hit]])
+        return z
+    return array("d", map(_norm_ppf, p))
+
+
+def norm_cdf_batch(x):
+    """
+    Normal CDF for many values
+
+    Uses math.erf element by element, the kernel of norm_cdf, so batch and
+    scalar results are identical and a value cannot land on different
+    sides of a boundary in the two paths.
+
+    Args:
+        x: Scalar or sequence of values
+
+    Returns:
+        NumPy array (or array('d') when NumPy is not installed)
+    """
+    x = _as_batch(x)
+
+    if np is not None:
+        return 0.5 * (1 + _np_erf(x / math.sqrt(2)))
+    return array("d", map(norm_cdf, x))
+
+
+def t_ppf_batch(df, p):
+    """
+    t-distribution inverse CDF for many (df, p) pairs in one vectorized pass
+
+    Args:
+        df: Scalar or sequence of degrees of freedom
+        p: Scalar or sequence of probabilities in (0, 1), broadcast against df
+
+    Returns:
+        NumPy array (or array('d') when NumPy is not installed)
+    """
+    df = _as_batch(df)
+    p = _as_batch(p)
+    _check_probabilities(p)
+
+    if np is not None:
+        df, p = np.broadcast_arrays(df, p)
+        result = np.empty(df.shape)
+
+        # Very large df: the engine's series is plain arithmetic, so vectorize it
+        large = df > student_t.LARGE_DF
+        for q in np.unique(p[large]):
+            mask = large & (p == q)
+            result[mask] = student_t.large_df_quantile(np.round(df[mask], 6), q)
+
+        # Each remaining distinct (df, p) pair is solved once
+        small = ~large
+        if np.any(small):
+            pairs, inverse = np.unique(
+                np.stack([df[small], p[small]], axis=1), axis=0, return_inverse=True
+            )
+            quantiles = np.array([_t_ppf(float(d), float(q)) for d, q in pairs])
+            result[small] = quantiles[inverse.ravel()]
+        return result
+
+    if len(df) == 1:
+        df = array("d", [df[0]]) * len(p)
+    elif len(p) == 1:
+        p = array("d", [p[0]]) * len(df)
+    if len(df) != len(p):
+        raise ValueError("df and p must have the same length")
+    return array("d", map(_t_ppf, df, p))
 
 
 def calculate_effect_size(baseline_mean, test_mean, baseline_std):
@@ -2,16 +2,63 @@
 Standard Deviation Calculator for A/B Testing Metrics
 """
 import math
-
-from .statistics import norm_ppf
-
-
-def calculate_std_from_data(data_points):
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+from typing import Optional
+
+from .moments import MomentAccumulator, RatioAccumulator
+from .quantile_sketch import DEFAULT_SKETCH_SIZE, QuantileSketch
+from .results import ResultRecord, result_record
+from .selection import NUMPY_MIN_SIZE, PERCENTILE_LEVELS
+from .selection import median as select_median
+from .selection import quantiles, quantiles_with_ranks
+from .statistics import norm_ppf, t_ppf
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, array inputs use vectorized paths
+    np = None
+
+# Values read at a time by calculate_std_from_stream
+STREAM_CHUNK_SIZE = 65536
+
+# Fraction of each tail cut by the trimmed std (and clamped by the winsorized)
+ROBUST_TRIM_FRACTION = 0.01
+
+# Scale factors making MAD and IQR consistent with sigma for normal data
+MAD_SCALE = 1.4826
+IQR_SCALE = 1.349
+
+
+@result_record
+class StdFromDataResult(ResultRecord):
+    """Result of calculate_std_from_data()"""
+
+    n: int
+    mean: float
+    median: float
+    std_dev: float
+    variance: float
+    min: float
+    max: float
+    cv: float
+    sem: float
+    ci_lower: float
+    ci_upper: float
+    ci_margin: float
+    percentiles: Optional[dict] = None
+    quantiles_approximate: bool = False
+
+
+def calculate_std_from_data(data_points, percentiles=False):
     """
     Calculate standard deviation from a list of data points
 
     Args:
-        data_points: List of numeric values
+        data_points: List (or array) of numeric values
+        percentiles: Also report p1, p5, p25, p75, p95 and p99 (found in
+            the same selection pass as the median)
 
     Returns:
         Dictionary with statistical measures
@@ -20,19 +67,110 @@ def calculate_std_from_data(data_points):
     if n < 2:
         raise ValueError("Need at least 2 data points")
 
-    # Basic statistics
-    mean = sum(data_points) / n
-    variance = sum((x - mean) ** 2 for x in data_points) / (n - 1)  # Sample variance
-    std_dev = math.sqrt(variance)
+    # Mean, sample variance, min and max in one pass
+    if hasattr(data_points, "dtype"):
+        moments = MomentAccumulator().add_array(data_points)
+    else:
+        moments = MomentAccumulator(data_points)
+
+    # Median (and optional percentiles) by selection, without sorting
+    levels = PERCENTILE_LEVELS if percentiles else ()
+    median, *values = quantiles(data_points, [0.5] + [p / 100 for p in levels])
+    percentile_values = (
+        {f"p{p}": value for p, value in zip(levels, values)} if percentiles else None
+    )
+    return _std_result(moments, median, percentile_values)
+
+
+def calculate_std_from_stream(
+    values,
+    percentiles=False,
+    sketch_size=DEFAULT_SKETCH_SIZE,
+    chunk_size=STREAM_CHUNK_SIZE,
+):
+    """
+    Calculate standard deviation from an iterable too large to hold in memory
+
+    Values are read once in chunks; the moments are exact and the median and
+    percentiles come from a QuantileSketch, so memory is bounded by the
+    sketch size rather than the number of values.
+
+    Args:
+        values: Iterable of numeric values (consumed once)
+        percentiles: Also report approximate p1, p5, p25, p75, p95 and p99
+        sketch_size: Sketch accuracy parameter k (rank error about 2 / k)
+        chunk_size: Values read per chunk
+
+    Returns:
+        Dictionary with statistical measures (quantiles_approximate is True)
+    """
+    iterator = iter(values)
+    chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+    return calculate_std_from_chunks(chunks, percentiles, sketch_size)
+
+
+def calculate_std_from_chunks(
+    chunks, percentiles=False, sketch_size=DEFAULT_SKETCH_SIZE
+):
+    """
+    Calculate standard deviation from a sequence of data chunks
+
+    NumPy array chunks (e.g. slices of a memory-mapped file) are reduced with
+    vectorized moments and sketch updates; other chunks (lists, memoryview
+    slices) are iterated value by value.
+
+    Args:
+        chunks: Iterable of NumPy arrays or sequences of numbers
+        percentiles: Also report approximate p1, p5, p25, p75, p95 and p99
+        sketch_size: Sketch accuracy parameter k (rank error about 2 / k)
+
+    Returns:
+        Dictionary with statistical measures (quantiles_approximate is True)
+    """
+    moments = MomentAccumulator()
+    sketch = QuantileSketch(sketch_size)
+    for chunk in chunks:
+        if hasattr(chunk, "dtype"):
+            moments.add_array(chunk)
+            sketch.update_array(chunk)
+        else:
+            moments.update(chunk)
+            sketch.update(chunk)
+    return calculate_std_from_summary(moments, sketch, percentiles)
+
+
+def calculate_std_from_summary(moments, sketch, percentiles=False):
+    """
+    Calculate standard deviation from pre-built (possibly merged) summaries
+
+    Lets chunks or workers each build a MomentAccumulator and QuantileSketch
+    and report on their merge.
 
-    # Additional useful statistics
-    median = (
-        sorted(data_points)[n // 2]
-        if n % 2 == 1
-        else sum(sorted(data_points)[n // 2 - 1 : n // 2 + 1]) / 2
+    Args:
+        moments: MomentAccumulator over the data
+        sketch: QuantileSketch over the same data
+        percentiles: Also report approximate p1, p5, p25, p75, p95 and p99
+
+    Returns:
+        Dictionary with statistical measures (quantiles_approximate is True)
+    """
+    if moments.n < 2:
+        raise ValueError("Need at least 2 data points")
+
+    levels = PERCENTILE_LEVELS if percentiles else ()
+    median, *values = sketch.quantiles([0.5] + [p / 100 for p in levels])
+    percentile_values = (
+        {f"p{p}": value for p, value in zip(levels, values)} if percentiles else None
     )
-    min_val = min(data_points)
-    max_val = max(data_points)
+    return _std_result(moments, median, percentile_values, quantiles_approximate=True)
+
+
+def _std_result(moments, median, percentile_values, quantiles_approximate=False):
+    """Descriptive statistics shared by the exact and streaming calculators"""
+    n = moments.n
+    mean = moments.mean
+    variance = moments.variance
+    std_dev = math.sqrt(variance)
 
     # Coefficient of variation
     cv = (std_dev / mean) * 100 if mean != 0 else 0
@@ -41,27 +179,244 @@ def calculate_std_from_data(data_points):
     sem = std_dev / math.sqrt(n)
 
     # 95% confidence interval for the mean
-    t_critical = 1.96 if n >= 30 else norm_ppf(0.975)  # Approximate for small samples
+    t_critical = 1.96 if n >= 30 else t_ppf(n - 1, 0.975)  # Exact for small samples
     ci_margin = t_critical * sem
     ci_lower = mean - ci_margin
     ci_upper = mean + ci_margin
 
+    return StdFromDataResult(
+        n=n,
+        mean=mean,
+        median=median,
+        std_dev=std_dev,
+        variance=variance,
+        min=moments.min,
+        max=moments.max,
+        cv=cv,
+        sem=sem,
+        ci_lower=ci_lower,
+        ci_upper=ci_upper,
+        ci_margin=ci_margin,
+        percentiles=percentile_values,
+        quantiles_approximate=quantiles_approximate,
+    )
+
+
+@result_record
+class SegmentedStdResult(ResultRecord):
+    """Result of calculate_segmented_std()"""
+
+    segments: dict
+    n_segments: int
+    total: dict
+    pooled_within_std: Optional[float]
+
+
+def _segment_summary(moments):
+    """n, mean, std and CV of one accumulator (std is None below 2 values)"""
+    std_dev = moments.std_dev if moments.n >= 2 else None
+    cv = (
+        (std_dev / moments.mean) * 100
+        if std_dev is not None and moments.mean != 0
+        else 0
+    )
     return {
-        "n": n,
-        "mean": mean,
-        "median": median,
+        "n": moments.n,
+        "mean": moments.mean,
         "std_dev": std_dev,
-        "variance": variance,
-        "min": min_val,
-        "max": max_val,
         "cv": cv,
-        "sem": sem,
-        "ci_lower": ci_lower,
-        "ci_upper": ci_upper,
-        "ci_margin": ci_margin,
+        "min": moments.min,
+        "max": moments.max,
     }
 
 
+def calculate_segmented_std(rows):
+    """
+    Calculate standard deviation per segment from (segment, value) rows
+
+    One MomentAccumulator per segment key is kept in a dict while the rows
+    are read once; the overall totals are the Chan merge of the segments.
+
+    Args:
+        rows: Iterable of (segment, value) pairs (consumed once)
+
+    Returns:
+        Dictionary with per-segment n, mean, std_dev, cv, min and max
+        (segments, in order of first appearance), the same statistics over
+        all rows (total) and the pooled within-segment standard deviation
+    """
+    accumulators = {}
+    for segment, value in rows:
+        moments = accumulators.get(segment)
+        if moments is None:
+            moments = accumulators[segment] = MomentAccumulator()
+        moments.add(value)
+
+    total = MomentAccumulator()
+    for moments in accumulators.values():
+        total.merge(moments)
+    if total.n < 2:
+        raise ValueError("Need at least 2 data points")
+
+    # sqrt(sum of within-segment squared deviations / (N - segments))
+    within_df = total.n - len(accumulators)
+    pooled_within_std = (
+        math.sqrt(sum(m.m2 for m in accumulators.values()) / within_df)
+        if within_df > 0
+        else None
+    )
+
+    return SegmentedStdResult(
+        segments={
+            segment: _segment_summary(moments)
+            for segment, moments in accumulators.items()
+        },
+        n_segments=len(accumulators),
+        total=_segment_summary(total),
+        pooled_within_std=pooled_within_std,
+    )
+
+
+@result_record
+class RobustStdResult(ResultRecord):
+    """Result of calculate_robust_std()"""
+
+    n: int
+    median: float
+    std_dev: float
+    mad: float
+    mad_std: float
+    q1: float
+    q3: float
+    iqr: float
+    iqr_std: float
+    trim_fraction: float
+    trimmed_n: int
+    trimmed_mean: float
+    trimmed_std: float
+    winsorized_std: float
+
+
+def _constant_moments(value, count):
+    """Accumulator holding count copies of value"""
+    moments = MomentAccumulator()
+    if count > 0:
+        moments.n, moments.mean = count, value
+        moments.min = moments.max = value
+    return moments
+
+
+def _copies_in_ranks(below, equal, start, stop):
+    """How many of the equal values (sorted ranks below..below+equal) fall in
+    ranks start..stop"""
+    return max(0, min(below + equal, stop) - max(below, start))
+
+
+def calculate_robust_std(data_points, trim=ROBUST_TRIM_FRACTION):
+    """
+    Calculate outlier-resistant spread estimates for heavy-tailed metrics
+
+    The quartiles, median and the two trimming cut-offs are found together
+    in one selection pass (no sort). A linear scan then accumulates the
+    values strictly between the cut-offs; adding the tied cut-off values
+    gives the trimmed moments, and adding k more copies of each cut-off
+    gives the winsorized ones. Only the MAD needs a second selection, over
+    the absolute deviations from the median.
+
+    Args:
+        data_points: Sequence of numeric values (list or NumPy array)
+        trim: Fraction of values cut from each tail (0 <= trim < 0.5)
+
+    Returns:
+        Dictionary with the sample std for comparison, MAD and MAD-based
+        sigma (1.4826 * MAD), IQR and IQR / 1.349, and the trimmed and
+        winsorized std
+    """
+    n = len(data_points)
+    if n < 2:
+        raise ValueError("Need at least 2 data points")
+    if not 0 <= trim < 0.5:
+        raise ValueError("Trim fraction must be at least 0 and below 0.5")
+    # Values cut from each tail (the epsilon guards 0.07 * 100 = 6.99...)
+    k = int(math.floor(trim * n + 1e-9))
+    if n - 2 * k < 2:
+        raise ValueError("Trimming must leave at least 2 data points")
+
+    (q1, median, q3), found = quantiles_with_ranks(
+        data_points, (0.25, 0.5, 0.75), (k, n - k - 1)
+    )
+    low, high = found[k], found[n - k - 1]
+
+    if np is not None and (hasattr(data_points, "dtype") or n >= NUMPY_MIN_SIZE):
+        values = np.asarray(data_points, dtype=float)
+        moments = MomentAccumulator().add_array(values)
+        inside = MomentAccumulator().add_array(values[(values > low) & (values < high)])
+        below_low = int(np.count_nonzero(values < low))
+        equal_low = int(np.count_nonzero(values == low))
+        below_high = int(np.count_nonzero(values < high))
+        equal_high = int(np.count_nonzero(values == high))
+        deviations = np.abs(values - median)
+    else:
+        moments = MomentAccumulator(data_points)
+        inside = MomentAccumulator(x for x in data_points if low < x < high)
+        below_low = equal_low = below_high = equal_high = 0
+        for x in data_points:
+            if x < low:
+                below_low += 1
+            elif x == low:
+                equal_low += 1
+            if x < high:
+                below_high += 1
+            elif x == high:
+                equal_high += 1
+        deviations = [abs(x - median) for x in data_points]
+
+    # The kept values are sorted ranks k..n-k-1; ties at the cut-offs are
+    # split between the kept and the cut ranks
+    trimmed = MomentAccumulator().merge(inside)
+    trimmed.merge(
+        _constant_moments(low, _copies_in_ranks(below_low, equal_low, k, n - k))
+    )
+    if high != low:
+        trimmed.merge(
+            _constant_moments(high, _copies_in_ranks(below_high, equal_high, k, n - k))
+        )
+    winsorized = MomentAccumulator().merge(trimmed)
+    winsorized.merge(_constant_moments(low, k)).merge(_constant_moments(high, k))
+
+    mad = select_median(deviations)
+    return RobustStdResult(
+        n=n,
+        median=median,
+        std_dev=moments.std_dev,
+        mad=mad,
+        mad_std=MAD_SCALE * mad,
+        q1=q1,
+        q3=q3,
+        iqr=q3 - q1,
+        iqr_std=(q3 - q1) / IQR_SCALE,
+        trim_fraction=trim,
+        trimmed_n=trimmed.n,
+        trimmed_mean=trimmed.mean,
+        trimmed_std=trimmed.std_dev,
+        winsorized_std=winsorized.std_dev,
+    )
+
+
+@result_record
+class StdFromRangeResult(ResultRecord):
+    """Result of estimate_std_from_range()"""
+
+    estimated_std: float
+    min_val: float
+    max_val: float
+    range: float
+    method: str
+    accuracy: str
+    mean_estimate: float
+    cv_estimate: float
+
+
 def estimate_std_from_range(min_val, max_val, method="range_rule"):
     """
     Estimate standard deviation from min/max values
@@ -92,16 +447,30 @@ def estimate_std_from_range(min_val, max_val, method="range_rule"):
     mean_estimate = (min_val + max_val) / 2
     cv_estimate = (estimated_std / mean_estimate) * 100 if mean_estimate != 0 else 0
 
-    return {
-        "estimated_std": estimated_std,
-        "min_val": min_val,
-        "max_val": max_val,
-        "range": range_val,
-        "method": method_name,
-        "accuracy": accuracy,
-        "mean_estimate": mean_estimate,
-        "cv_estimate": cv_estimate,
-    }
+    return StdFromRangeResult(
+        estimated_std=estimated_std,
+        min_val=min_val,
+        max_val=max_val,
+        range=range_val,
+        method=method_name,
+        accuracy=accuracy,
+        mean_estimate=mean_estimate,
+        cv_estimate=cv_estimate,
+    )
+
+
+@result_record
+class StdFromPercentilesResult(ResultRecord):
+    """Result of estimate_std_from_percentiles()"""
+
+    estimated_std_iqr: float
+    estimated_std_mad: float
+    iqr: float
+    q1: float
+    median: float
+    q3: float
+    method: str
+    accuracy: str
 
 
 def estimate_std_from_percentiles(p25, p50, p75):
@@ -124,25 +493,78 @@ def estimate_std_from_percentiles(p25, p50, p75):
     # Assuming roughly normal, MAD ≈ 0.6745 * std
     mad_based_std = (p75 - p25) / (2 * 0.6745)  # Approximation
 
-    return {
-        "estimated_std_iqr": estimated_std,
-        "estimated_std_mad": mad_based_std,
-        "iqr": iqr,
-        "q1": p25,
-        "median": p50,
-        "q3": p75,
-        "method": "Interquartile Range (IQR ÷ 1.35)",
-        "accuracy": "Good estimate for normal data",
-    }
+    return StdFromPercentilesResult(
+        estimated_std_iqr=estimated_std,
+        estimated_std_mad=mad_based_std,
+        iqr=iqr,
+        q1=p25,
+        median=p50,
+        q3=p75,
+        method="Interquartile Range (IQR ÷ 1.35)",
+        accuracy="Good estimate for normal data",
+    )
 
 
-def calculate_std_from_conversion_data(conversions, visitors):
+def estimate_std_from_sketch(sketch):
+    """
+    Estimate standard deviation from the approximate quartiles of a sketch
+
+    Args:
+        sketch: QuantileSketch over the metric values
+
+    Returns:
+        Dictionary with estimated standard deviation (see
+        estimate_std_from_percentiles)
+    """
+    p25, p50, p75 = sketch.quantiles((0.25, 0.5, 0.75))
+    return estimate_std_from_percentiles(p25, p50, p75)
+
+
+@result_record
+class ConversionStdResult(ResultRecord):
+    """Result of calculate_std_from_conversion_data()"""
+
+    n_periods: int
+    conversion_rates: Optional[Sequence]
+    mean_rate: float
+    std_dev_observed: float
+    theoretical_std: float
+    total_conversions: int
+    total_visitors: int
+    pooled_rate: float
+    pooled_std: float
+    avg_visitors_per_period: float
+    ci_lower: float
+    ci_upper: float
+    ci_margin: float
+
+
+def _conversion_arrays(conversions, visitors):
+    """Per-period rates and count totals of one pair of count arrays"""
+    if len(conversions) != len(visitors):
+        raise ValueError("Conversions and visitors lists must have the same length")
+    conversions = np.asarray(conversions)
+    visitors = np.asarray(visitors)
+    if not visitors.all():
+        raise ValueError("Visitor count cannot be zero")
+    return conversions / visitors, conversions.sum().item(), visitors.sum().item()
+
+
+def calculate_std_from_conversion_data(conversions, visitors, return_rates=True):
     """
     Calculate standard deviation for conversion rate data
 
+    The rates, their moments and the count totals come from one fused pass:
+    a single vectorized divide and reductions over the count arrays with
+    NumPy, otherwise one loop that folds each rate into a MomentAccumulator
+    as it goes. Suited to batch jobs over many conversion histories.
+
     Args:
-        conversions: List of conversion counts
-        visitors: List of visitor counts (corresponding to conversions)
+        conversions: Sequence or array of conversion counts
+        visitors: Sequence or array of visitor counts (corresponding to
+            conversions)
+        return_rates: Include the per-period rates as an array (NumPy
+            array, or array('d') without NumPy); False skips them
 
     Returns:
         Dictionary with conversion rate statistics
@@ -153,29 +575,85 @@ def calculate_std_from_conversion_data(conversions, visitors):
     if len(conversions) < 2:
         raise ValueError("Need at least 2 data points")
 
-    # Calculate conversion rates for each period
-    conversion_rates = []
-    for conv, vis in zip(conversions, visitors):
-        if vis == 0:
-            raise ValueError("Visitor count cannot be zero")
-        conversion_rates.append(conv / vis)
+    if np is not None:
+        rates, total_conversions, total_visitors = _conversion_arrays(
+            conversions, visitors
+        )
+        moments = MomentAccumulator().add_array(rates)
+    else:
+        moments = MomentAccumulator()
+        rates = array("d")
+        total_conversions = total_visitors = 0
+        for conv, vis in zip(conversions, visitors):
+            if vis == 0:
+                raise ValueError("Visitor count cannot be zero")
+            rate = conv / vis
+            moments.add(rate)
+            if return_rates:
+                rates.append(rate)
+            total_conversions += conv
+            total_visitors += vis
+
+    return _conversion_result(
+        moments.n,
+        moments.mean,
+        moments.variance,
+        total_conversions,
+        total_visitors,
+        rates if return_rates else None,
+    )
+
 
-    # Calculate standard statistics on conversion rates
-    n = len(conversion_rates)
-    mean_rate = sum(conversion_rates) / n
+def calculate_std_from_conversion_chunks(chunks):
+    """
+    Calculate conversion rate statistics from chunks of paired arrays
+
+    Each chunk is a (conversions, visitors) pair of NumPy arrays, e.g. a
+    Parquet record batch; rates feed a MomentAccumulator and the counts are
+    summed, so memory does not grow with the number of periods. Per-period
+    rates are not kept (conversion_rates is None).
 
-    # Sample standard deviation of conversion rates
-    variance = sum((rate - mean_rate) ** 2 for rate in conversion_rates) / (n - 1)
+    Args:
+        chunks: Iterable of (conversions, visitors) array pairs
+
+    Returns:
+        Dictionary with conversion rate statistics
+    """
+    moments = MomentAccumulator()
+    total_conversions = 0
+    total_visitors = 0
+    for conversions, visitors in chunks:
+        rates, chunk_conversions, chunk_visitors = _conversion_arrays(
+            conversions, visitors
+        )
+        moments.add_array(rates)
+        total_conversions += chunk_conversions
+        total_visitors += chunk_visitors
+
+    if moments.n < 2:
+        raise ValueError("Need at least 2 data points")
+    return _conversion_result(
+        moments.n,
+        moments.mean,
+        moments.variance,
+        total_conversions,
+        total_visitors,
+        None,
+    )
+
+
+def _conversion_result(
+    n, mean_rate, variance, total_conversions, total_visitors, conversion_rates
+):
+    """Conversion statistics shared by the array and chunked calculators"""
     std_dev = math.sqrt(variance)
 
     # Theoretical standard deviation for a single conversion rate
     # σ = √(p × (1-p) / n) where p is the mean conversion rate and n is average sample size
-    avg_visitors = sum(visitors) / len(visitors)
+    avg_visitors = total_visitors / n
     theoretical_std = math.sqrt(mean_rate * (1 - mean_rate) / avg_visitors)
 
     # Additional statistics
-    total_conversions = sum(conversions)
-    total_visitors = sum(visitors)
     pooled_rate = total_conversions / total_visitors
 
     # Confidence interval for pooled rate
@@ -185,21 +663,150 @@ def calculate_std_from_conversion_data(conversions, visitors):
     ci_lower = max(0, pooled_rate - ci_margin)
     ci_upper = min(1, pooled_rate + ci_margin)
 
-    return {
-        "n_periods": n,
-        "conversion_rates": conversion_rates,
-        "mean_rate": mean_rate,
-        "std_dev_observed": std_dev,
-        "theoretical_std": theoretical_std,
-        "total_conversions": total_conversions,
-        "total_visitors": total_visitors,
-        "pooled_rate": pooled_rate,
-        "pooled_std": pooled_std,
-        "avg_visitors_per_period": avg_visitors,
-        "ci_lower": ci_lower,
-        "ci_upper": ci_upper,
-        "ci_margin": ci_margin,
-    }
+    return ConversionStdResult(
+        n_periods=n,
+        conversion_rates=conversion_rates,
+        mean_rate=mean_rate,
+        std_dev_observed=std_dev,
+        theoretical_std=theoretical_std,
+        total_conversions=total_conversions,
+        total_visitors=total_visitors,
+        pooled_rate=pooled_rate,
+        pooled_std=pooled_std,
+        avg_visitors_per_period=avg_visitors,
+        ci_lower=ci_lower,
+        ci_upper=ci_upper,
+        ci_margin=ci_margin,
+    )
+
+
+@result_record
+class RatioMetricResult(ResultRecord):
+    """Result of calculate_ratio_metric_std()"""
+
+    n: int
+    ratio: float
+    mean_numerator: float
+    mean_denominator: float
+    std_numerator: float
+    std_denominator: float
+    correlation: Optional[float]
+    delta_variance: float
+    ratio_se: float
+    effective_std: float
+    ci_lower: float
+    ci_upper: float
+    ci_margin: float
+
+
+def calculate_ratio_metric_std(rows):
+    """
+    Calculate delta-method variance for a ratio metric from per-unit rows
+
+    For metrics such as revenue per session randomized by user, each row
+    is one user's (numerator, denominator) total. The rows are read once
+    into a RatioAccumulator, so memory stays constant over millions of
+    users.
+
+    Args:
+        rows: Iterable of (numerator, denominator) pairs (consumed once)
+
+    Returns:
+        Dictionary with the ratio, its delta-method variance and standard
+        error, and the effective per-user std for sample size planning
+    """
+    return calculate_ratio_metric_std_from_summary(RatioAccumulator(rows))
+
+
+def calculate_ratio_metric_std_from_chunks(chunks):
+    """
+    Calculate delta-method variance for a ratio metric from array chunks
+
+    Args:
+        chunks: Iterable of (numerators, denominators) NumPy array pairs,
+            e.g. Parquet record batches
+
+    Returns:
+        Dictionary with ratio metric statistics (see
+        calculate_ratio_metric_std)
+    """
+    moments = RatioAccumulator()
+    for numerators, denominators in chunks:
+        moments.add_arrays(numerators, denominators)
+    return calculate_ratio_metric_std_from_summary(moments)
+
+
+def calculate_ratio_metric_std_from_summary(moments):
+    """
+    Ratio metric statistics from a (possibly merged) RatioAccumulator
+
+    With R = mean(x) / mean(y), the delta method gives
+    Var(R) ~ (var(x) - 2 R cov(x, y) + R^2 var(y)) / (n * mean(y)^2).
+    The effective std is sqrt(n * Var(R)): planning with it and the ratio as
+    the baseline mean accounts for users contributing several sessions,
+    which treating each session as independent would understate.
+
+    Args:
+        moments: RatioAccumulator over the per-unit rows
+
+    Returns:
+        Dictionary with ratio metric statistics
+    """
+    if moments.n < 2:
+        raise ValueError("Need at least 2 data points")
+    if moments.mean_y == 0:
+        raise ValueError("Denominator mean cannot be zero")
+
+    n = moments.n
+    ratio = moments.mean_x / moments.mean_y
+    variance_x = moments.variance_x
+    variance_y = moments.variance_y
+    covariance = moments.covariance
+
+    effective_variance = max(
+        variance_x - 2 * ratio * covariance + ratio**2 * variance_y, 0.0
+    ) / (moments.mean_y**2)
+    delta_variance = effective_variance / n
+    ratio_se = math.sqrt(delta_variance)
+
+    std_x = math.sqrt(variance_x)
+    std_y = math.sqrt(variance_y)
+    correlation = covariance / (std_x * std_y) if std_x > 0 and std_y > 0 else None
+
+    # 95% confidence interval for the ratio
+    ci_margin = 1.96 * ratio_se
+
+    return RatioMetricResult(
+        n=n,
+        ratio=ratio,
+        mean_numerator=moments.mean_x,
+        mean_denominator=moments.mean_y,
+        std_numerator=std_x,
+        std_denominator=std_y,
+        correlation=correlation,
+        delta_variance=delta_variance,
+        ratio_se=ratio_se,
+        effective_std=math.sqrt(effective_variance),
+        ci_lower=ratio - ci_margin,
+        ci_upper=ratio + ci_margin,
+        ci_margin=ci_margin,
+    )
+
+
+@result_record
+class ConversionRateStdResult(ResultRecord):
+    """Result of estimate_conversion_rate_std()"""
+
+    baseline_rate: float
+    sample_size: int
+    std_dev: float
+    standard_error: float
+    ci_lower: float
+    ci_upper: float
+    ci_margin: float
+    mde_absolute: float
+    mde_relative: float
+    sample_sizes_for_effects: list
 
 
 def estimate_conversion_rate_std(baseline_rate, sample_size):
@@ -263,18 +870,28 @@ def estimate_conversion_rate_std(baseline_rate, sample_size):
             }
         )
 
-    return {
-        "baseline_rate": baseline_rate,
-        "sample_size": sample_size,
-        "std_dev": std_dev,
-        "standard_error": standard_error,
-        "ci_lower": ci_lower,
-        "ci_upper": ci_upper,
-        "ci_margin": ci_margin,
-        "mde_absolute": mde_absolute,
-        "mde_relative": mde_relative,
-        "sample_sizes_for_effects": sample_sizes_needed,
-    }
+    return ConversionRateStdResult(
+        baseline_rate=baseline_rate,
+        sample_size=sample_size,
+        std_dev=std_dev,
+        standard_error=standard_error,
+        ci_lower=ci_lower,
+        ci_upper=ci_upper,
+        ci_margin=ci_margin,
+        mde_absolute=mde_absolute,
+        mde_relative=mde_relative,
+        sample_sizes_for_effects=sample_sizes_needed,
+    )
+
+
+@result_record
+class StdSampleSizeResult(ResultRecord):
+    """Result of sample_size_for_std_estimation()"""
+
+    n_required: int
+    target_precision: float
+    confidence_level: float
+    interpretation: str
 
 
 def sample_size_for_std_estimation(target_precision, confidence_level=0.95):
@@ -297,9 +914,9 @@ def sample_size_for_std_estimation(target_precision, confidence_level=0.95):
 
     n_required = (z / (target_precision * math.sqrt(2))) ** 2
 
-    return {
-        "n_required": math.ceil(n_required),
-        "target_precision": target_precision * 100,  # Convert to percentage
-        "confidence_level": confidence_level * 100,
-        "interpretation": f"With {math.ceil(n_required)} samples, you can estimate the standard deviation within ±{target_precision * 100: .1f}% with {confidence_level * 100: .0f}% confidence",
-    }
+    return StdSampleSizeResult(
+        n_required=math.ceil(n_required),
+        target_precision=target_precision * 100,  # Convert to percentage
+        confidence_level=confidence_level * 100,
+        interpretation=f"With {math.ceil(n_required)} samples, you can estimate the standard deviation within ±{target_precision * 100: .1f}% with {confidence_level * 100: .0f}% confidence",
+    )
@@ -0,0 +1,358 @@
+"""
+Exact Student-t distribution via the regularized incomplete beta function
+"""
+import math
+import sys
+from functools import lru_cache
+
+# Bounded memo of (df, p) -> quantile, shared by every caller in the process
+CACHE_SIZE = 4096
+
+# Above this df the 4-term Cornish-Fisher series is exact to double precision
+LARGE_DF = 1e4
+
+# Cache keys keep df to this many significant digits (see quantize)
+DF_SIGNIFICANT_DIGITS = 9
+
+_MAX_ITERATIONS = 10000
+_EPSILON = 1e-16
+_TINY = 1e-300
+_LOG_MIN_FLOAT = math.log(sys.float_info.min)
+
+# Below this lower-tail p, 1 - p loses too much relative precision, so the
+# tail is passed through as is (above it, +-p give exactly mirrored values)
+_PRECISE_TAIL = 1e-3
+
+# Acklam's rational approximation to the normal quantile (refined below)
+_ACKLAM_A = (
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+)
+_ACKLAM_B = (
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+)
+_ACKLAM_C = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+)
+_ACKLAM_D = (
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e00,
+    3.754408661907416e00,
+)
+
+
+def normal_quantile(p):
+    """Normal quantile accurate to double precision (Acklam plus one Halley step)"""
+    if p < 0.02425:
+        q = math.sqrt(-2 * math.log(p))
+        c, d = _ACKLAM_C, _ACKLAM_D
+        x = (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / (
+            (((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1
+        )
+    elif p > 1 - 0.02425:
+        return -normal_quantile(1 - p)
+    else:
+        q = p - 0.5
+        r = q * q
+        a, b = _ACKLAM_A, _ACKLAM_B
+        x = (
+            (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5])
+            * q
+            / (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+        )
+
+    error = 0.5 * math.erfc(-x / math.sqrt(2)) - p
+    u = error * math.sqrt(2 * math.pi) * math.exp(x * x / 2)
+    return x - u / (1 + x * u / 2)
+
+
+def _cornish_fisher_terms(z):
+    """Coefficients g1..g4 of the Cornish-Fisher series (A&S 26.7.5)"""
+    z2 = z * z
+    g1 = (z2 + 1) * z / 4
+    g2 = ((5 * z2 + 16) * z2 + 3) * z / 96
+    g3 = (((3 * z2 + 19) * z2 + 17) * z2 - 15) * z / 384
+    g4 = ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) * z / 92160
+    return g1, g2, g3, g4
+
+
+def _cornish_fisher(df, z):
+    """t quantile from the normal quantile z (Abramowitz & Stegun 26.7.5)"""
+    g1, g2, g3, g4 = _cornish_fisher_terms(z)
+    return z + (g1 + (g2 + (g3 + g4 / df) / df) / df) / df
+
+
+def _log_beta(a, b):
+    return math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b)
+
+
+def _beta_continued_fraction(a, b, x):
+    """Continued fraction for the incomplete beta function (modified Lentz)"""
+    qab = a + b
+    qap = a + 1
+    qam = a - 1
+    c = 1.0
+    d = 1 - qab * x / qap
+    if abs(d) < _TINY:
+        d = _TINY
+    d = 1 / d
+    h = d
+
+    for m in range(1, _MAX_ITERATIONS + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        if abs(d) < _TINY:
+            d = _TINY
+        c = 1 + aa / c
+        if abs(c) < _TINY:
+            c = _TINY
+        d = 1 / d
+        h *= d * c
+
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        if abs(d) < _TINY:
+            d = _TINY
+        c = 1 + aa / c
+        if abs(c) < _TINY:
+            c = _TINY
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < _EPSILON:
+            return h
+
+    raise ArithmeticError("Incomplete beta continued fraction did not converge")
+
+
+def betainc(a, b, x):
+    """
+    Regularized incomplete beta function I_x(a, b)
+
+    Args:
+        a: First shape parameter (> 0)
+        b: Second shape parameter (> 0)
+        x: Upper integration limit in [0, 1]
+
+    Returns:
+        float: I_x(a, b)
+    """
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+
+    log_front = a * math.log(x) + b * math.log1p(-x) - _log_beta(a, b)
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_front) * _beta_continued_fraction(a, b, x) / a
+    return 1 - math.exp(log_front) * _beta_continued_fraction(b, a, 1 - x) / b
+
+
+def betaincinv(a, b, target, x0=0.5):
+    """
+    Inverse of the regularized incomplete beta function in x
+
+    Uses Newton steps on I_x(a, b) - target, safeguarded by a shrinking
+    bracket so the iterate never leaves (0, 1).
+
+    Args:
+        a: First shape parameter (> 0)
+        b: Second shape parameter (> 0)
+        target: Probability in (0, 1)
+        x0: Starting guess in (0, 1)
+
+    Returns:
+        float: x such that I_x(a, b) == target
+    """
+    log_beta = _log_beta(a, b)
+    lower, upper = 0.0, 1.0
+    x = x0 if 0 < x0 < 1 else 0.5
+
+    for _ in range(200):
+        error = betainc(a, b, x) - target
+        if error == 0:
+            return x
+        if error < 0:
+            lower = x
+        else:
+            upper = x
+
+        log_density = (a - 1) * math.log(x) + (b - 1) * math.log1p(-x) - log_beta
+        density = math.exp(log_density)
+        x_new = x - error / density if density > 0 else lower
+        if not lower < x_new < upper:
+            x_new = (x + (lower if error > 0 else upper)) / 2
+
+        if abs(x_new - x) <= 4 * _EPSILON * x_new:
+            return x_new
+        x = x_new
+
+    return x
+
+
+def t_cdf(t, df):
+    """
+    Student-t cumulative distribution function
+
+    Args:
+        t: Quantile
+        df: Degrees of freedom (> 0, need not be an integer)
+
+    Returns:
+        float: P(T <= t)
+    """
+    if df <= 0:
+        raise ValueError("Degrees of freedom must be positive")
+
+    t2 = t * t
+    if t2 < df:
+        # Central region: integrate from the centre to avoid 1 - x cancellation
+        centre = 0.5 * betainc(0.5, df / 2, t2 / (df + t2))
+        return 0.5 + centre if t > 0 else 0.5 - centre
+
+    tail = 0.5 * betainc(df / 2, 0.5, df / (df + t2))
+    return 1 - tail if t > 0 else tail
+
+
+def _t_quantile(df, p, tail=None):
+    """
+    Exact t quantile for p > 0.5 (no caching, no validation)
+
+    tail is 1 - p when known more precisely than 1 - p itself (p reflected
+    from a tiny lower-tail probability).
+    """
+    if tail is None:
+        tail = 1 - p
+        z = normal_quantile(p)
+    else:
+        z = -normal_quantile(tail)
+    guess = _cornish_fisher(df, z)
+    if df > LARGE_DF:
+        return guess
+
+    # P(|T| > t) = I_x(df/2, 1/2) with x = df / (df + t^2)
+    two_sided_tail = 2 * tail
+    # Near x = 0, I_x(a, 1/2) ~ x^a / (a B(a, 1/2)); for tiny df the root x
+    # underflows and the quantile is beyond the float range
+    a = df / 2
+    log_x = (math.log(two_sided_tail) + math.log(a) + _log_beta(a, 0.5)) / a
+    if log_x < _LOG_MIN_FLOAT:
+        return math.inf
+    if not math.isfinite(guess) or guess <= 0:
+        guess = z
+    if two_sided_tail < 0.5:
+        # Far in the tail the leading term above is a better start than the
+        # Cornish-Fisher guess
+        x0 = math.exp(log_x) if log_x < -30 else df / (df + guess * guess)
+        x = betaincinv(df / 2, 0.5, two_sided_tail, x0)
+        return math.sqrt(df * (1 - x) / x)
+
+    # Near the centre solve for y = 1 - x to avoid cancellation in 1 - x
+    y0 = guess * guess / (df + guess * guess)
+    y = betaincinv(0.5, df / 2, 1 - two_sided_tail, y0)
+    return math.sqrt(df * y / (1 - y))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _t_quantile_cached(df, p):
+    if p == 0.5:
+        return 0.0
+    if p < _PRECISE_TAIL:
+        return -_t_quantile(df, 1 - p, tail=p)
+    if p < 0.5:
+        return -_t_quantile(df, 1 - p)
+    return _t_quantile(df, p)
+
+
+def large_df_quantile(df, p):
+    """
+    t quantile for df above LARGE_DF, where the engine uses the series
+
+    Pure arithmetic in df, so df may be a NumPy array; gives the same values
+    as t_quantile for those df.
+    """
+    p = _quantize_probability(p)
+    if p == 0.5:
+        return 0 * df
+    if p < 0.5:
+        return -_cornish_fisher(df, normal_quantile(1 - p))
+    return _cornish_fisher(df, normal_quantile(p))
+
+
+def quantile_df_slope(df, p):
+    """
+    Approximate derivative of the t quantile with respect to df
+
+    Differentiates the Cornish-Fisher series term by term; used as the
+    Newton derivative when solving for a sample size. df may be an array.
+    """
+    g1, g2, g3, g4 = _cornish_fisher_terms(normal_quantile(p))
+    return -(g1 + (2 * g2 + (3 * g3 + 4 * g4 / df) / df) / df) / (df * df)
+
+
+def _significant(x, digits):
+    """x rounded to a number of significant digits"""
+    return float(f"{x:.{digits}g}")
+
+
+def _quantize_probability(p):
+    """p rounded to 12 significant digits of its smaller tail, min(p, 1 - p)"""
+    if p <= 0.5:
+        return _significant(p, 12)
+    return 1 - _significant(1 - p, 12)
+
+
+def quantize(df, p):
+    """Cache key for (df, p): df to 9 significant digits, the tail of p to 12"""
+    return _significant(df, DF_SIGNIFICANT_DIGITS), _quantize_probability(p)
+
+
+def t_quantile(df, p):
+    """
+    Exact Student-t quantile with a bounded (df, p) memo cache
+
+    Args:
+        df: Degrees of freedom (> 0, need not be an integer)
+        p: Probability in (0, 1)
+
+    Returns:
+        float: t such that P(T <= t) == p
+    """
+    df, p = quantize(df, p)
+    if df <= 0:
+        raise ValueError("Degrees of freedom must be positive")
+    if not 0 < p < 1:
+        raise ValueError("p must be between 0 and 1")
+
+    return _t_quantile_cached(df, p)
+
+
+def cache_info():
+    """Hit/miss counters for the t quantile cache"""
+    info = _t_quantile_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+def cache_clear():
+    """Empty the t quantile cache and reset its counters"""
+    _t_quantile_cached.cache_clear()
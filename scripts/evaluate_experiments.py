@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Evaluate the current week of many mSPRT experiments from a CSV or JSON Lines file.
+
+Input records need baseline_mean, baseline_std, absolute_improvement, alpha,
+weekly_visitors and week; experiment_id and use_t_test are optional. Results
+are streamed to the output as each chunk is evaluated:
+
+    python scripts/evaluate_experiments.py experiments.csv -o statuses.csv
+    python scripts/evaluate_experiments.py - --format json < experiments.jsonl
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from calculations.bulk_monitoring import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    evaluate_stream,
+)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="Input file, or - for stdin")
+    parser.add_argument(
+        "-o", "--output", default="-", help="Output file (default stdout)"
+    )
+    parser.add_argument("--format", choices=("csv", "json"), default="csv")
+    parser.add_argument("--output-format", choices=("csv", "json"), default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    source = sys.stdin if args.input == "-" else open(args.input, newline="")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    start = time.time()
+    try:
+        count = evaluate_stream(
+            source, target, args.format, args.output_format, args.chunk_size
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    print(
+        f"Evaluated {count} experiments in {time.time() - start:.2f}s", file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
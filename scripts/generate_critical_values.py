@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Regenerate calculations/critical_values.py from the live quantile functions.
+
+Run from the repository root after changing norm_ppf or the t engine, and
+bump TABLE_VERSION so stale tables are easy to spot in review:
+
+    python scripts/generate_critical_values.py
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from calculations import student_t  # noqa: E402
+from calculations.statistics import _norm_ppf  # noqa: E402
+
+TABLE_VERSION = 1
+
+# 1 - alpha/2 and 1 - alpha for alpha in {0.01, 0.05, 0.1}, plus the power options
+PROBABILITIES = (0.8, 0.85, 0.9, 0.95, 0.975, 0.99, 0.995)
+MAX_TABLE_DF = 60
+
+OUTPUT_PATH = os.path.join(ROOT, "calculations", "critical_values.py")
+
+HEADER = '''"""
+Precomputed z and t critical values for the common alpha/power settings
+
+Generated by scripts/generate_critical_values.py - do not edit by hand.
+"""
+
+TABLE_VERSION = {version}
+'''
+
+
+def build_table():
+    """Compute every table entry with the uncached live kernels"""
+    z_critical = {p: _norm_ppf(p) for p in PROBABILITIES}
+    t_critical = {
+        (df, p): student_t._t_quantile(df, p)
+        for df in range(1, MAX_TABLE_DF + 1)
+        for p in PROBABILITIES
+    }
+    return z_critical, t_critical
+
+
+def render_table(z_critical, t_critical):
+    """Render the table as Python source"""
+    lines = [HEADER.format(version=TABLE_VERSION), "Z_CRITICAL = {"]
+    lines += [f"    {p!r}: {value!r}," for p, value in z_critical.items()]
+    lines += ["}", "", "T_CRITICAL = {"]
+    lines += [f"    ({df}, {p!r}): {value!r}," for (df, p), value in t_critical.items()]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def main():
+    source = render_table(*build_table())
+    with open(OUTPUT_PATH, "w") as f:
+        f.write(source)
+    print(f"Wrote {OUTPUT_PATH} (version {TABLE_VERSION})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
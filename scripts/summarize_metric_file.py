@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compute standard deviation statistics for a large metric file in one pass.
+
+Reads CSV/TSV (optionally gzipped), .npy, raw little-endian float64 or Parquet
+files in chunks, so memory stays constant whatever the file size. Parquet needs
+the optional pyarrow package:
+
+    python scripts/summarize_metric_file.py revenue.csv.gz --column revenue
+    python scripts/summarize_metric_file.py revenue.npy --percentiles
+    python scripts/summarize_metric_file.py daily.parquet \\
+        --conversions conversions --visitors visitors
+    python scripts/summarize_metric_file.py users.parquet \\
+        --numerator revenue --denominator sessions
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from calculations.ingestion import (  # noqa: E402
+    DELIMITERS,
+    binary_format_for,
+    iter_float64_chunks,
+    iter_parquet_columns,
+    open_float64_file,
+    read_delimited_column,
+)
+from calculations.std_calculator import (  # noqa: E402
+    calculate_ratio_metric_std_from_chunks,
+    calculate_std_from_chunks,
+    calculate_std_from_conversion_chunks,
+    calculate_std_from_stream,
+)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="Metric file")
+    parser.add_argument(
+        "--format",
+        choices=("csv", "npy", "float64", "parquet"),
+        default=None,
+        help="File format (default: from the file extension, else csv)",
+    )
+    parser.add_argument("--column", help="Value column (name, or number for CSV)")
+    parser.add_argument("--delimiter", choices=sorted(DELIMITERS), default=None)
+    parser.add_argument("--percentiles", action="store_true")
+    parser.add_argument("--conversions", help="Parquet conversions column")
+    parser.add_argument("--visitors", help="Parquet visitors column")
+    parser.add_argument("--numerator", help="Parquet per-user ratio numerator column")
+    parser.add_argument(
+        "--denominator", help="Parquet per-user ratio denominator column"
+    )
+    return parser.parse_args(argv)
+
+
+def summarize(args):
+    file_format = args.format or binary_format_for(args.input) or "csv"
+
+    if args.conversions or args.visitors:
+        if file_format != "parquet":
+            raise ValueError("Conversion data must be read from a Parquet file")
+        if not (args.conversions and args.visitors):
+            raise ValueError("Both --conversions and --visitors are required")
+        chunks = iter_parquet_columns(args.input, [args.conversions, args.visitors])
+        return calculate_std_from_conversion_chunks(chunks)
+
+    if args.numerator or args.denominator:
+        if file_format != "parquet":
+            raise ValueError("Ratio metric data must be read from a Parquet file")
+        if not (args.numerator and args.denominator):
+            raise ValueError("Both --numerator and --denominator are required")
+        chunks = iter_parquet_columns(args.input, [args.numerator, args.denominator])
+        return calculate_ratio_metric_std_from_chunks(chunks)
+
+    if file_format == "parquet":
+        if not args.column:
+            raise ValueError("--column is required for Parquet files")
+        chunks = iter_parquet_columns(args.input, args.column)
+        return calculate_std_from_chunks(chunks, args.percentiles)
+
+    if file_format in ("npy", "float64"):
+        values = open_float64_file(args.input, file_format)
+        return calculate_std_from_chunks(iter_float64_chunks(values), args.percentiles)
+
+    with open(args.input, "rb") as f:
+        _, values = read_delimited_column(
+            f, args.column, DELIMITERS.get(args.delimiter)
+        )
+        return calculate_std_from_stream(values, args.percentiles)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.time()
+    try:
+        results = summarize(args)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(results.to_dict(), indent=2, default=float))
+    print(f"Read {args.input} in {time.time() - start:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,9 @@
 Integration tests for Flask routes
 """
 
+import gzip
+import io
+import struct
 
 import pytest
 from bs4 import BeautifulSoup
@@ -50,6 +53,14 @@ class TestSampleSizeCalculator:
         assert response.status_code == 200
         assert b"Sample Size Calculator" in response.data
 
+    def test_sample_size_form_prefill(self, client):
+        """Test that query parameters prefill the baseline fields"""
+        response = client.get(
+            "/sample-size-calculator?baseline_mean=12.5&baseline_std=3.25"
+        )
+        assert b'value="12.5"' in response.data
+        assert b'value="3.25"' in response.data
+
     def test_valid_sample_size_calculation(self, client):
         """Test valid sample size calculation"""
         response = client.post(
@@ -183,6 +194,107 @@ class TestSampleSizeCalculator:
         assert b"estimated" in response.data.lower()
 
 
+class TestPowerCalculator:
+    """Test power and minimum detectable effect routes"""
+
+    def test_power_form_loads(self, client):
+        """Test that power calculator form loads"""
+        response = client.get("/power-calculator")
+        assert response.status_code == 200
+        assert b"Minimum Detectable Effect" in response.data
+
+    def test_valid_mde_calculation(self, client):
+        """Test valid MDE calculation with a power curve"""
+        response = client.post(
+            "/calculate-mde",
+            data={
+                "baseline_mean": "100",
+                "baseline_std": "20",
+                "sample_size_per_group": "20000",
+                "relative_improvement": "1",
+                "power": "0.8",
+                "alpha": "0.05",
+                "test_type": "two-sided",
+            },
+        )
+
+        assert response.status_code == 200
+        assert b"Power & MDE Calculator Results" in response.data
+        soup = BeautifulSoup(response.data, "html.parser")
+        rows = soup.find("table", class_="monitoring-table").find_all("tr")
+        assert len(rows) == 9  # Header + 8 curve points
+
+    def test_mde_with_missing_sample_size(self, client):
+        """Test error handling for missing sample size"""
+        response = client.post(
+            "/calculate-mde",
+            data={
+                "baseline_mean": "100",
+                "power": "0.8",
+                "alpha": "0.05",
+                "test_type": "two-sided",
+            },
+        )
+
+        assert response.status_code == 200
+        assert b"Sample size per group is required" in response.data
+
+    def test_mde_with_fractional_sample_size(self, client):
+        """Test that a fractional sample size is rejected, not truncated"""
+        response = client.post(
+            "/calculate-mde",
+            data={
+                "baseline_mean": "100",
+                "baseline_std": "20",
+                "sample_size_per_group": "1000.7",
+                "power": "0.8",
+                "alpha": "0.05",
+                "test_type": "two-sided",
+            },
+        )
+
+        assert response.status_code == 200
+        assert b"Sample size per group must be a whole number" in response.data
+
+    def test_mde_json_api(self, client):
+        """Test that the JSON API evaluates a list of sample sizes at once"""
+        response = client.post(
+            "/api/minimum-detectable-effect",
+            json={
+                "sample_size_per_group": [1000, 20000],
+                "baseline_mean": 100,
+                "baseline_std": 20,
+                "power": 0.8,
+                "alpha": 0.05,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert len(data["relative_mde"]) == 2
+        assert data["relative_mde"][0] > data["relative_mde"][1]
+
+    def test_achieved_power_json_api(self, client):
+        """Test the achieved power JSON API and its error response"""
+        response = client.post(
+            "/api/achieved-power",
+            json={
+                "sample_size_per_group": 252,
+                "baseline_mean": 100,
+                "baseline_std": 20,
+                "improvement_type": "relative",
+                "improvement_value": 5,
+                "alpha": 0.05,
+            },
+        )
+        assert response.status_code == 200
+        assert abs(response.get_json()["power"] - 0.8) < 0.01
+
+        response = client.post("/api/achieved-power", json={"baseline_mean": 100})
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+
+
 class TestMSPRTCalculator:
     """Test mSPRT calculator routes"""
 
@@ -271,6 +383,160 @@ class TestStdCalculator:
         assert b"Standard Deviation" in response.data
         assert b"Calculated from" in response.data
 
+    def test_std_from_data_with_percentiles(self, client):
+        """Test that requested percentiles are shown on the results page"""
+        response = client.post(
+            "/calculate-std-from-data",
+            data={"data_points": "1,2,3,4,5,6,7,8,9,10", "include_percentiles": "on"},
+        )
+
+        assert response.status_code == 200
+        assert b"Percentiles" in response.data
+        assert b"P99:" in response.data
+
+    def test_std_from_upload_gzip_csv(self, client):
+        """Test std calculation from an uploaded gzip-compressed CSV"""
+        body = gzip.compress(b"user,revenue\n1,2.0\n2,4.0\n3,\n4,6.0\n")
+        response = client.post(
+            "/calculate-std-from-upload",
+            data={
+                "data_file": (io.BytesIO(body), "export.csv.gz"),
+                "column": "revenue",
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        assert b"Calculated from 3 Data Points (column revenue)" in response.data
+        assert b"2.0000" in response.data
+
+    def test_std_from_upload_raw_body(self, client):
+        """Test std calculation from a raw TSV request body"""
+        response = client.post(
+            "/calculate-std-from-upload?column=2",
+            data=b"a\tb\n1\t10\n2\t20\n",
+            content_type="text/tab-separated-values",
+        )
+
+        assert response.status_code == 200
+        assert b"(column b)" in response.data
+
+    def test_std_from_upload_raw_float64(self, client):
+        """Test std calculation from a raw little-endian float64 upload"""
+        body = b"".join(struct.pack("<d", value) for value in (1.0, 2.0, 3.0, 4.0))
+        response = client.post(
+            "/calculate-std-from-upload",
+            data={"data_file": (io.BytesIO(body), "metric.f64")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        assert b"Calculated from 4 Data Points" in response.data
+        assert b"1.2910" in response.data
+
+    def test_conversion_historical_data_page(self, client):
+        """Test that historical conversion data renders its results page"""
+        response = client.post(
+            "/calculate-conversion-rate-std",
+            data={
+                "calc_type": "historical_data",
+                "conversions": "23, 31, 19",
+                "visitors": "1000, 1050, 980",
+            },
+        )
+
+        assert response.status_code == 200
+        assert b"from 3 Periods" in response.data
+
+    def test_conversion_upload_requires_parquet(self, client):
+        """Test that conversion uploads explain the Parquet requirement"""
+        response = client.post(
+            "/calculate-conversion-std-from-upload",
+            data={
+                "data_file": (io.BytesIO(b"c,v\n1,10\n"), "daily.csv"),
+                "conversions_column": "c",
+                "visitors_column": "v",
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        assert b"must be Parquet" in response.data
+
+    def test_std_from_upload_by_segment(self, client):
+        """Test per-segment statistics from an uploaded CSV"""
+        body = b"platform,revenue\nios,2\nweb,10\nios,4\nweb,14\nios,6\n"
+        response = client.post(
+            "/calculate-std-from-upload",
+            data={
+                "data_file": (io.BytesIO(body), "export.csv"),
+                "segment_column": "platform",
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        assert b"2 Segments (platform) from 5 Data Points" in response.data
+        assert b"All segments" in response.data
+
+    def test_segmented_std_json_api(self, client):
+        """Test the per-segment std JSON API and its error response"""
+        response = client.post(
+            "/api/segmented-std",
+            json={"segments": ["a", "b", "a", "b", "a"], "values": [1, 5, 2, 7, 3]},
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["n_segments"] == 2
+        assert data["segments"]["a"]["std_dev"] == 1.0
+        assert data["total"]["n"] == 5
+
+        response = client.post(
+            "/api/segmented-std", json={"segments": ["a"], "values": [1, 2]}
+        )
+        assert response.status_code == 400
+        assert "same length" in response.get_json()["error"]
+
+    def test_std_from_upload_bad_value(self, client):
+        """Test that a non-numeric cell reports its line"""
+        response = client.post(
+            "/calculate-std-from-upload?column=x",
+            data=b"x\n1\noops\n",
+            content_type="text/csv",
+        )
+
+        assert response.status_code == 200
+        assert b"Line 3" in response.data
+
+    def test_std_from_data_with_bootstrap(self, client):
+        """Test that the bootstrap intervals for the std are shown"""
+        response = client.post(
+            "/calculate-std-from-data",
+            data={"data_points": "1,2,3,4,5,6,7,8,9,30", "bootstrap_ci": "on"},
+        )
+
+        assert response.status_code == 200
+        assert b"Std Dev CI (BCa)" in response.data
+        assert b"Planning with an uncertain std" in response.data
+
+    def test_std_from_data_with_robust_estimates(self, client):
+        """Test the robust estimates and their links to the planning forms"""
+        response = client.post(
+            "/calculate-std-from-data",
+            data={"data_points": "1,2,3,4,5,6,7,8,9,1000", "robust_std": "on"},
+        )
+
+        assert response.status_code == 200
+        assert b"Robust Spread Estimates" in response.data
+        assert b"/sequential-calculator?baseline_mean=" in response.data
+
+        # MAD x 1.4826 for this data is 2.5 * 1.4826
+        response = client.get(
+            "/sequential-calculator?baseline_mean=104.5&baseline_std=3.7065"
+        )
+        assert b'value="3.7065"' in response.data
+        assert b'value="known" checked' in response.data
+
     def test_std_from_data_newline_separated(self, client):
         """Test std calculation from newline-separated data"""
         response = client.post(
@@ -305,6 +571,48 @@ class TestStdCalculator:
         assert response.status_code == 200
         assert b"error" in response.data.lower()
 
+    def test_std_from_data_mixed_separators(self, client):
+        """Test pasted data with mixed delimiters and thousands separators"""
+        response = client.post(
+            "/calculate-std-from-data",
+            data={"data_points": "1,000\n2,000; 3,000\t\n\n4,000\n"},
+        )
+
+        assert response.status_code == 200
+        assert b"4 Data Points" in response.data
+        assert b"2500.0000" in response.data
+
+    def test_std_from_data_reports_bad_value(self, client):
+        """Test that the error names the position of the bad value"""
+        response = client.post(
+            "/calculate-std-from-data", data={"data_points": "1, 2, 3O, 4"}
+        )
+
+        assert b"Value 3" in response.data
+
+    def test_ratio_metric_std(self, client):
+        """Test the delta-method ratio metric page"""
+        response = client.post(
+            "/calculate-ratio-metric-std",
+            data={
+                "numerators": "12.5, 0, 40.2, 8.1, 19.9",
+                "denominators": "3 1 5 2 4",
+            },
+        )
+
+        assert response.status_code == 200
+        assert b"Ratio Metric from 5 Users" in response.data
+        assert b"/sample-size-calculator?baseline_mean=5.38" in response.data
+
+    def test_ratio_metric_mismatched_lengths(self, client):
+        """Test error handling for unpaired numerators and denominators"""
+        response = client.post(
+            "/calculate-ratio-metric-std",
+            data={"numerators": "1 2 3", "denominators": "1 2"},
+        )
+
+        assert b"must match" in response.data
+
     def test_std_from_range(self, client):
         """Test std calculation from range"""
         response = client.post(
@@ -9,8 +9,10 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from calculations.fixed_horizon import calculate_sample_size
-from calculations.msprt import calculate_msprt_plan
+from calculations.fixed_horizon import calculate_sample_size, calculate_sample_size_grid
+from calculations.group_sequential import spending_boundaries
+from calculations.ingestion import parse_numbers
+from calculations.msprt import _generate_weekly_monitoring_table, calculate_msprt_plan
 from calculations.std_calculator import calculate_std_from_data
 
 
@@ -64,6 +66,52 @@ class TestPerformance:
         # Should complete in under 10ms per calculation
         assert avg_time < 0.01, f"mSPRT calculation too slow: {avg_time: .4f}s"
 
+    @pytest.mark.performance
+    def test_long_monitoring_schedule_performance(self):
+        """Test that a 3000-week monitoring table takes microseconds per look"""
+        pytest.importorskip("numpy")
+        weeks = 3000
+        for use_t_test in (False, True):
+            args = (100, 20, 5, 0.05, 1000, weeks, use_t_test)
+            _generate_weekly_monitoring_table(*args)  # Warm up
+
+            start_time = time.perf_counter()
+            table = _generate_weekly_monitoring_table(*args)
+            per_look = (time.perf_counter() - start_time) / weeks
+
+            assert len(table) == weeks
+            assert per_look < 1e-5, f"Monitoring table too slow: {per_look: .2e}s/look"
+
+    @pytest.mark.performance
+    def test_spending_boundaries_performance(self):
+        """Test that a 52-look alpha-spending schedule solves well under 0.2 s"""
+        np = pytest.importorskip("numpy")
+        information = np.arange(1, 53) / 52
+        spending_boundaries(information, 0.05, "obrien_fleming")  # Warm up
+
+        start_time = time.time()
+        result = spending_boundaries(information, 0.05, "pocock")
+        elapsed = time.time() - start_time
+
+        assert len(result["z"]) == 52
+        assert elapsed < 0.2, f"Spending boundaries too slow: {elapsed: .4f}s"
+
+    @pytest.mark.performance
+    def test_parse_numbers_performance(self):
+        """Test that 1M pasted values parse in well under a second"""
+        np = pytest.importorskip("numpy")
+        values = np.random.default_rng(0).lognormal(size=1_000_000)
+        comma_separated = ",".join(f"{v:.2f}" for v in values.tolist())
+        one_per_line = ",\n".join(f"{v * 1000:,.2f}" for v in values.tolist())
+
+        for text in (comma_separated, one_per_line):
+            start_time = time.perf_counter()
+            result = parse_numbers(text)
+            elapsed = time.perf_counter() - start_time
+
+            assert result.size == 1_000_000
+            assert elapsed < 0.5, f"Parsing 1M values too slow: {elapsed: .4f}s"
+
     @pytest.mark.performance
     def test_std_calculation_performance(self):
         """Test that std calculation completes within reasonable time"""
@@ -82,6 +130,23 @@ class TestPerformance:
         # Should complete in under 1ms per calculation
         assert avg_time < 0.001, f"Std calculation too slow: {avg_time: .4f}s"
 
+    @pytest.mark.performance
+    def test_sample_size_grid_performance(self):
+        """Test that a 1M-cell sample size sweep finishes well under a second"""
+        np = pytest.importorskip("numpy")
+        baselines = np.linspace(10, 1000, 1000)[:, None, None]
+        improvements = np.linspace(1, 20, 500)[None, :, None]
+        powers = np.array([0.8, 0.9])[None, None, :]
+
+        start_time = time.time()
+        grid = calculate_sample_size_grid(
+            baselines, 20, "relative", improvements, powers, 0.05
+        )
+        elapsed = time.time() - start_time
+
+        assert grid["sample_size_per_group"].size == 1_000_000
+        assert elapsed < 0.5, f"Sample size grid too slow: {elapsed: .4f}s"
+
     @pytest.mark.performance
     def test_sample_size_with_varying_parameters(self):
         """Test performance with different parameter values"""
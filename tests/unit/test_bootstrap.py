@@ -0,0 +1,76 @@
+"""
+Unit tests for the vectorized bootstrap engine
+"""
+
+import pytest
+
+from calculations.bootstrap import _jackknife_std, bootstrap_std_ci, iter_bootstrap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+class TestBootstrap:
+    """Test suite for bootstrap_std_ci and iter_bootstrap"""
+
+    def test_intervals_cover_the_estimate(self):
+        """Test the shape of the std, mean and median intervals"""
+        data = np.random.default_rng(0).normal(50, 10, 400)
+        result = bootstrap_std_ci(data, seed=1, n_resamples=2000, tolerance=None)
+
+        assert result["resamples"] == 2000
+        assert result["stop_reason"] == "completed"
+        assert result["std_dev"] == pytest.approx(data.std(ddof=1))
+        for key in ("std_ci_percentile", "std_ci_bca"):
+            lower, upper = result[key]
+            assert lower < result["std_dev"] < upper
+        # Normal theory: se(s) is about sigma / sqrt(2 (n - 1))
+        assert result["std_se"] == pytest.approx(10 / np.sqrt(798), rel=0.2)
+        assert result["mean_ci_percentile"][0] < data.mean()
+        assert result["median_ci_percentile"][1] > np.median(data)
+
+    def test_bca_shifts_right_for_skewed_data(self):
+        """Test that BCa moves the std interval up for heavy right tails"""
+        data = np.random.default_rng(2).lognormal(0, 1, 300)
+        result = bootstrap_std_ci(data, seed=3, n_resamples=4000, tolerance=None)
+
+        assert result["std_ci_bca"][1] > result["std_ci_percentile"][1]
+
+    def test_reproducible_across_workers(self):
+        """Test that replicates depend on the seed, not the worker count"""
+        data = np.arange(30.0)
+        serial = list(iter_bootstrap(data, 600, seed=5, shard_size=200))
+        parallel = list(iter_bootstrap(data, 600, seed=5, workers=2, shard_size=200))
+
+        for a, b in zip(serial, parallel):
+            assert np.array_equal(a["std_dev"], b["std_dev"])
+            assert np.array_equal(a["median"], b["median"])
+
+    def test_early_stopping(self):
+        """Test the stability check and the time budget"""
+        data = np.random.default_rng(4).normal(0, 1, 200)
+
+        stable = bootstrap_std_ci(data, seed=6, n_resamples=50000, tolerance=0.05)
+        assert stable["stop_reason"] == "stable"
+        assert stable["resamples"] < 50000
+
+        timed = bootstrap_std_ci(data, seed=6, n_resamples=50000, time_budget=0)
+        assert timed["stop_reason"] == "time_budget"
+        assert timed["resamples"] == 250
+
+    def test_jackknife_matches_leave_one_out(self):
+        """Test the O(n) jackknife against explicit deletion"""
+        data = np.random.default_rng(7).exponential(size=50)
+        expected = [np.delete(data, i).std(ddof=1) for i in range(data.size)]
+
+        assert _jackknife_std(data) == pytest.approx(expected, rel=1e-10)
+
+    def test_invalid_inputs(self):
+        """Test error handling"""
+        with pytest.raises(ValueError, match="at least 3 data points"):
+            bootstrap_std_ci([1.0, 2.0])
+        with pytest.raises(ValueError, match="Confidence must be between"):
+            bootstrap_std_ci([1.0, 2.0, 3.0], confidence=1.5)
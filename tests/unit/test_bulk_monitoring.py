@@ -0,0 +1,128 @@
+"""
+Unit tests for the bulk weekly monitoring evaluator
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from calculations.bulk_monitoring import evaluate_experiments, evaluate_stream
+from calculations.msprt import WeekStatus, determine_week_status
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EXPERIMENTS = [
+    # baseline_mean, baseline_std, absolute_improvement, alpha, weekly_visitors, week
+    (100, 20, 5, 0.05, 100, 4),
+    (100, 20, 5, 0.05, 10, 2),
+    (50, 10, -3, 0.01, 500, 6),
+    (200, 40, 1, 0.1, 20, 1),
+]
+FIELDS = (
+    "baseline_mean",
+    "baseline_std",
+    "absolute_improvement",
+    "alpha",
+    "weekly_visitors",
+    "week",
+)
+
+
+def _columns(use_t_test):
+    columns = {field: [row[i] for row in EXPERIMENTS] for i, field in enumerate(FIELDS)}
+    columns["use_t_test"] = [use_t_test] * len(EXPERIMENTS)
+    return columns
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+class TestBulkMonitoring:
+    """Test suite for evaluate_experiments and evaluate_stream"""
+
+    @pytest.mark.parametrize("use_t_test", [False, True])
+    def test_matches_determine_week_status(self, use_t_test):
+        """Test that every experiment agrees with the scalar week status"""
+        results = evaluate_experiments(_columns(use_t_test))
+
+        for i, (mean, std, delta, alpha, visitors, week) in enumerate(EXPERIMENTS):
+            expected = determine_week_status(
+                week, delta, mean, std, alpha, visitors, use_t_test
+            )
+            assert results["n"][i] == expected["n"]
+            assert results["boundary_upper"][i] == expected["boundary_upper"]
+            assert results["status_label"][i] == expected["status"]
+            assert results["explanation"][i] == expected["explanation"]
+
+    def test_status_codes(self):
+        """Test that statuses are machine-readable codes"""
+        results = evaluate_experiments(_columns(False), explanations=False)
+
+        assert list(results["status"]) == [
+            WeekStatus.SIGNIFICANT_IMPROVEMENT,
+            WeekStatus.KEEP_TESTING,
+            WeekStatus.SIGNIFICANT_DECLINE,
+            WeekStatus.KEEP_TESTING,
+        ]
+        assert "explanation" not in results
+
+    def test_csv_stream_round_trip(self):
+        """Test CSV in, CSV out across several chunks"""
+        source = io.StringIO()
+        writer = csv.writer(source)
+        writer.writerow(("experiment_id",) + FIELDS)
+        for i, row in enumerate(EXPERIMENTS):
+            writer.writerow((f"exp-{i}",) + row)
+        source.seek(0)
+
+        output = io.StringIO()
+        count = evaluate_stream(source, output, chunk_size=3)
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+
+        assert count == 4
+        assert [row["experiment_id"] for row in rows] == [f"exp-{i}" for i in range(4)]
+        assert rows[0]["status"] == "significant_improvement"
+        assert rows[0]["n"] == "400"
+
+    def test_json_lines_stream(self):
+        """Test JSON Lines in and out, with blank lines skipped"""
+        lines = [json.dumps(dict(zip(FIELDS, row))) for row in EXPERIMENTS[:2]]
+        source = io.StringIO(lines[0] + "\n\n" + lines[1] + "\n")
+
+        output = io.StringIO()
+        evaluate_stream(source, output, input_format="json")
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        assert [record["experiment_id"] for record in records] == [1, 2]
+        assert records[1]["status"] == "keep_testing"
+
+    def test_reports_first_bad_experiment(self):
+        """Test that errors name the offending experiment across chunks"""
+        columns = _columns(False)
+        columns["alpha"][2] = 1.5
+        with pytest.raises(ValueError, match="Experiment 3: alpha must be between"):
+            evaluate_experiments(columns)
+
+        lines = [json.dumps(dict(zip(FIELDS, row))) for row in EXPERIMENTS]
+        lines.append(json.dumps({"baseline_mean": 1}))
+        with pytest.raises(ValueError, match="Experiment 5: invalid value"):
+            evaluate_stream(
+                io.StringIO("\n".join(lines)), io.StringIO(), "json", chunk_size=2
+            )
+
+    @pytest.mark.parametrize(
+        "field, value, message",
+        [
+            ("baseline_mean", 0, "baseline mean must be positive"),
+            ("week", 2.5, "week must be a whole number"),
+        ],
+    )
+    def test_rejects_invalid_rows(self, field, value, message):
+        """Test a zero baseline mean and a fractional week"""
+        columns = _columns(False)
+        columns[field][1] = value
+        with pytest.raises(ValueError, match=f"Experiment 2: {message}"):
+            evaluate_experiments(columns)
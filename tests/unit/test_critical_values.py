@@ -0,0 +1,44 @@
+"""
+Unit tests for the precomputed critical-value table
+"""
+
+from calculations import critical_values, student_t
+from calculations.statistics import _norm_ppf, norm_ppf, t_ppf
+
+
+class TestCriticalValueTable:
+    """Test that the generated table matches the live quantile functions"""
+
+    def test_table_is_versioned(self):
+        """Test that the table carries a version number"""
+        assert isinstance(critical_values.TABLE_VERSION, int)
+        assert critical_values.TABLE_VERSION >= 1
+
+    def test_hot_alpha_and_power_values_covered(self):
+        """Test that every form option resolves from the table"""
+        for alpha in (0.01, 0.05, 0.1):
+            assert 1 - alpha / 2 in critical_values.Z_CRITICAL
+            assert 1 - alpha in critical_values.Z_CRITICAL
+        for power in (0.8, 0.85, 0.9, 0.95):
+            assert power in critical_values.Z_CRITICAL
+            assert 1 - (1 - power) in critical_values.Z_CRITICAL
+
+    def test_z_table_matches_live_norm_ppf(self):
+        """Test that z entries are identical to the computed quantiles"""
+        for p, value in critical_values.Z_CRITICAL.items():
+            assert value == _norm_ppf(p)
+            assert norm_ppf(p) == value
+            assert norm_ppf(1 - p) == _norm_ppf(1 - p)
+
+    def test_t_table_matches_live_t_engine(self):
+        """Test that t entries are identical to the exact t engine"""
+        for (df, p), value in critical_values.T_CRITICAL.items():
+            assert value == student_t._t_quantile(df, p)
+            assert t_ppf(df, p) == value
+            assert t_ppf(df, 1 - p) == -value
+
+    def test_fallback_for_values_outside_table(self):
+        """Test that other values are still computed"""
+        assert 0.7 not in critical_values.Z_CRITICAL
+        assert norm_ppf(0.7) == _norm_ppf(0.7)
+        assert t_ppf(12.5, 0.975) == student_t.t_quantile(12.5, 0.975)
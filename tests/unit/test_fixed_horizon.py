@@ -5,7 +5,17 @@ Unit tests for fixed horizon sample size calculations
 
 import pytest
 
-from calculations.fixed_horizon import calculate_sample_size
+from calculations.fixed_horizon import (
+    achieved_power,
+    calculate_sample_size,
+    calculate_sample_size_grid,
+    minimum_detectable_effect,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestFixedHorizonCalculator:
@@ -326,3 +336,160 @@ class TestFixedHorizonCalculator:
         assert result["baseline_std"] == baseline_std
         assert result["power"] == power
         assert result["alpha"] == alpha
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+class TestSampleSizeGrid:
+    """Test suite for the vectorized sample size grid solver"""
+
+    def test_grid_matches_scalar_calculation(self):
+        """Test that every grid cell equals the scalar result"""
+        baselines = np.array([50.0, 100.0, 1000.0])[:, None, None, None]
+        improvements = np.array([2.0, 5.0, 10.0])[None, :, None, None]
+        powers = np.array([0.8, 0.9])[None, None, :, None]
+        alphas = np.array([0.01, 0.05, 0.1])[None, None, None, :]
+
+        grid = calculate_sample_size_grid(
+            baselines, 20, "relative", improvements, powers, alphas
+        )
+
+        assert grid["sample_size_per_group"].shape == (3, 3, 2, 3)
+        for index in np.ndindex(grid["sample_size_per_group"].shape):
+            i, j, k, m = index
+            scalar = calculate_sample_size(
+                baseline_mean=float(baselines[i, 0, 0, 0]),
+                baseline_std=20,
+                improvement_type="relative",
+                improvement_value=float(improvements[0, j, 0, 0]),
+                power=float(powers[0, 0, k, 0]),
+                alpha=float(alphas[0, 0, 0, m]),
+            )
+            assert (
+                grid["sample_size_per_group"][index] == scalar["sample_size_per_group"]
+            )
+            assert grid["effect_size"][index] == scalar["effect_size"]
+            assert grid["effect_size_ci_lower"][index] == pytest.approx(
+                scalar["effect_size_ci_lower"]
+            )
+            assert grid["effect_size_ci_upper"][index] == pytest.approx(
+                scalar["effect_size_ci_upper"]
+            )
+
+    def test_grid_estimated_std_and_one_sided(self):
+        """Test unknown std and one-sided tests across a 1-D sweep"""
+        improvements = np.array([1.0, 2.0, 5.0])
+        grid = calculate_sample_size_grid(
+            100, None, "absolute", improvements, 0.8, 0.05, test_type="one-sided"
+        )
+
+        assert grid["std_estimated"] is True
+        assert np.all(grid["baseline_std"] == 50)
+        for value, n in zip(improvements, grid["sample_size_per_group"]):
+            scalar = calculate_sample_size(
+                100, None, "absolute", float(value), 0.8, 0.05, "one-sided"
+            )
+            assert n == scalar["sample_size_per_group"]
+        assert np.all(grid["total_sample_size"] == grid["sample_size_per_group"] * 2)
+
+    def test_grid_validation(self):
+        """Test that a single invalid cell rejects the whole grid"""
+        with pytest.raises(ValueError, match="Baseline mean must be positive"):
+            calculate_sample_size_grid([100, -1], 20, "relative", 5, 0.8, 0.05)
+        with pytest.raises(ValueError, match="Power must be between 0 and 1"):
+            calculate_sample_size_grid(100, 20, "relative", 5, [0.8, 1.0], 0.05)
+        with pytest.raises(ValueError, match="Alpha must be between 0 and 1"):
+            calculate_sample_size_grid(100, 20, "relative", 5, 0.8, [0.0])
+        with pytest.raises(ValueError, match="Effect size cannot be zero"):
+            calculate_sample_size_grid(100, 20, "relative", [5, 0], 0.8, 0.05)
+
+    def test_grid_rejects_non_finite_inputs(self):
+        """Test that NaN and inf cells are rejected instead of solved"""
+        with pytest.raises(ValueError, match="Improvement value must be a finite"):
+            calculate_sample_size_grid(100, 20, "relative", [5, np.nan], 0.8, 0.05)
+        with pytest.raises(ValueError, match="Baseline standard deviation must"):
+            calculate_sample_size_grid(100, [20, np.inf], "relative", 5, 0.8, 0.05)
+        with pytest.raises(ValueError, match="Power must be a finite"):
+            calculate_sample_size_grid(100, 20, "relative", 5, np.nan, 0.05)
+
+
+class TestInverseSolvers:
+    """Test suite for minimum detectable effect and achieved power"""
+
+    def test_mde_inverts_sample_size(self):
+        """Test that the MDE at the planned n is the planned effect"""
+        planned = calculate_sample_size(100, 20, "relative", 5, 0.8, 0.05)
+        result = minimum_detectable_effect(
+            planned["sample_size_per_group"], 100, 20, 0.8, 0.05
+        )
+
+        # n is rounded up, so the detectable effect is at most the planned one
+        assert result["relative_mde"] <= 5
+        assert result["relative_mde"] == pytest.approx(5, rel=0.01)
+        assert result["absolute_mde"] == pytest.approx(
+            result["effect_size"] * 20, rel=1e-12
+        )
+        assert result["std_estimated"] is False
+
+    def test_power_inverts_sample_size(self):
+        """Test that the achieved power at the planned n is the planned power"""
+        for power, alpha, test_type in [
+            (0.8, 0.05, "two-sided"),
+            (0.9, 0.01, "two-sided"),
+            (0.95, 0.1, "one-sided"),
+        ]:
+            planned = calculate_sample_size(
+                100, 20, "absolute", 3, power, alpha, test_type
+            )
+            result = achieved_power(
+                planned["sample_size_per_group"],
+                100,
+                20,
+                "absolute",
+                3,
+                alpha,
+                test_type,
+            )
+            assert result["power"] >= power - 0.001
+            assert result["power"] == pytest.approx(power, abs=0.01)
+
+    def test_estimated_std(self):
+        """Test that an unknown std uses the conservative estimate"""
+        result = minimum_detectable_effect(1000, 100, None, 0.8, 0.05)
+
+        assert result["std_estimated"] is True
+        assert result["baseline_std"] == 50
+
+    def test_validation(self):
+        """Test error handling for invalid inputs"""
+        with pytest.raises(ValueError, match="Sample size must be positive"):
+            minimum_detectable_effect(0, 100, 20, 0.8, 0.05)
+        with pytest.raises(ValueError, match="Power must be between 0 and 1"):
+            minimum_detectable_effect(100, 100, 20, 1.2, 0.05)
+        with pytest.raises(ValueError, match="Effect size cannot be zero"):
+            achieved_power(100, 100, 20, "relative", 0, 0.05)
+
+    def test_rejects_non_finite_inputs(self):
+        """Test that NaN and inf are rejected instead of returning NaN"""
+        nan, inf = float("nan"), float("inf")
+        with pytest.raises(ValueError, match="Baseline mean must be a finite"):
+            minimum_detectable_effect(100, nan, 20, 0.8, 0.05)
+        with pytest.raises(ValueError, match="Power must be a finite"):
+            minimum_detectable_effect(100, 100, None, nan, 0.05)
+        with pytest.raises(ValueError, match="Sample size must be a finite"):
+            achieved_power(inf, 100, 20, "relative", 5, 0.05)
+        with pytest.raises(ValueError, match="Improvement value must be a finite"):
+            achieved_power(100, 100, 20, "relative", nan, 0.05)
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_curves_are_single_array_evaluations(self):
+        """Test that array sample sizes give monotone power and MDE curves"""
+        sizes = np.array([100, 250, 500, 1000, 5000])
+        power = achieved_power(sizes, 100, 20, "relative", 5, 0.05)["power"]
+        mde = minimum_detectable_effect(sizes, 100, 20, 0.8, 0.05)["relative_mde"]
+
+        assert power.shape == sizes.shape
+        assert np.all(np.diff(power) > 0)
+        assert np.all(np.diff(mde) < 0)
+        for n, value in zip(sizes, mde):
+            scalar = minimum_detectable_effect(int(n), 100, 20, 0.8, 0.05)
+            assert value == pytest.approx(scalar["relative_mde"], rel=1e-12)
@@ -0,0 +1,106 @@
+"""
+Unit tests for group-sequential alpha-spending boundaries
+"""
+
+import pytest
+
+from calculations.group_sequential import (
+    alpha_spent,
+    spending_boundaries,
+    spending_boundary_provider,
+)
+from calculations.msprt import calculate_msprt_plan
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FIVE_LOOKS = [0.2, 0.4, 0.6, 0.8, 1.0]
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+class TestSpendingBoundaries:
+    """Test suite for spending_boundaries"""
+
+    @pytest.mark.parametrize(
+        "spending, expected",
+        [
+            # Published Lan-DeMets values, two-sided alpha = 0.05, five equal looks
+            ("obrien_fleming", [4.8769, 3.3569, 2.6803, 2.2898, 2.0310]),
+            ("pocock", [2.4380, 2.4268, 2.4101, 2.3966, 2.3859]),
+        ],
+    )
+    def test_matches_published_boundaries(self, spending, expected):
+        """Test the recursion against reference boundary tables"""
+        result = spending_boundaries(FIVE_LOOKS, 0.05, spending)
+
+        for value, reference in zip(result["z"], expected):
+            assert value == pytest.approx(reference, abs=2e-4)
+
+    def test_spends_exactly_alpha(self):
+        """Test the cumulative spending and the per-look nominal levels"""
+        result = spending_boundaries(FIVE_LOOKS, 0.05, "power", rho=2.0)
+
+        assert result["cumulative_alpha"][-1] == pytest.approx(0.05)
+        assert list(alpha_spent(FIVE_LOOKS, 0.05, "power", 2.0)) == pytest.approx(
+            [0.05 * t**2 for t in FIVE_LOOKS]
+        )
+        assert np.all(result["nominal_alpha"] <= result["cumulative_alpha"] + 1e-12)
+
+    def test_controls_type_i_error_by_simulation(self):
+        """Test that crossing any of 52 weekly boundaries happens with rate alpha"""
+        t = np.arange(1, 53) / 52
+        z = spending_boundaries(t, 0.05, "pocock")["z"]
+
+        rng = np.random.default_rng(0)
+        scores = np.cumsum(rng.standard_normal((40000, 52)) * np.sqrt(1 / 52), axis=1)
+        rate = np.mean(np.any(np.abs(scores / np.sqrt(t)) >= z, axis=1))
+        assert rate == pytest.approx(0.05, abs=0.005)
+
+    def test_invalid_inputs(self):
+        """Test error handling for bad schedules and spending functions"""
+        with pytest.raises(ValueError, match="increase within"):
+            spending_boundaries([0.5, 0.4, 1.0], 0.05)
+        with pytest.raises(ValueError, match="Spending function must be one of"):
+            spending_boundaries(FIVE_LOOKS, 0.05, "haybittle")
+        with pytest.raises(ValueError, match="Alpha must be between 0 and 1"):
+            spending_boundaries(FIVE_LOOKS, 1.5)
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+class TestBoundaryProvider:
+    """Test suite for spending boundaries in mSPRT monitoring tables"""
+
+    def test_weekly_table_uses_spending_boundaries(self):
+        """Test that the plan's weekly table follows the provider's critical values"""
+        result = calculate_msprt_plan(
+            baseline_mean=100,
+            std_known="known",
+            baseline_std=20,
+            improvement_type="relative",
+            improvement_value=5,
+            alpha=0.05,
+            beta=0.2,
+            max_n=1000,
+            min_n=200,
+            weekly_visitors=200,
+            max_weeks=5,
+            spending_function="obrien_fleming",
+        )
+        critical = spending_boundary_provider("obrien_fleming")(
+            [200, 400, 600, 800, 1000], 0.05
+        )
+
+        assert result["spending_function"] == "obrien_fleming"
+        for point, value in zip(result["monitoring_points"], critical):
+            se = result["baseline_std"] * (2 / point["n"]) ** 0.5
+            assert point["boundary_upper"] == pytest.approx(value * se)
+
+    def test_t_test_mode_widens_boundaries(self):
+        """Test that t-test mode converts each look's level to a t critical value"""
+        provider = spending_boundary_provider("pocock")
+        z = provider([10, 20, 30], 0.05)
+        t = provider([10, 20, 30], 0.05, use_t_test=True)
+
+        assert np.all(t > z)
@@ -0,0 +1,260 @@
+"""
+Unit tests for streaming metric file readers
+"""
+
+import gzip
+import io
+import struct
+
+import pytest
+
+from calculations import ingestion
+from calculations.ingestion import (
+    binary_format_for,
+    iter_float64_chunks,
+    iter_float64_stream,
+    iter_parquet_columns,
+    open_binary_stream,
+    open_float64_file,
+    parse_numbers,
+    read_delimited_column,
+    read_segmented_column,
+)
+from calculations.std_calculator import (
+    calculate_std_from_chunks,
+    calculate_std_from_conversion_chunks,
+    calculate_std_from_conversion_data,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+CSV = b"user,platform,revenue\n1,ios,2.5\n2,android,\n3,web,4.0\n"
+
+
+class TestParseNumbers:
+    """Test suite for the pasted-text tokenizer"""
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("1,2,3", [1, 2, 3]),
+            ("2.5, -1e3;\t4\n\n\n 5 ", [2.5, -1000, 4, 5]),
+            ("1,234; 5,678.5\r\n2,000\n", [1234, 5678.5, 2000]),
+            ("100,200,300\n", [100, 200, 300]),
+            (" 1,\n2,\n", [1, 2]),
+            ("1,000\n2,000", [1000, 2000]),
+            ("1,000,\n2,500.5,\n", [1000, 2500.5]),
+            ("1,000, 2,000", [1000, 2000]),
+            ("1,234, 5", [1234, 5]),
+            ("1.5,2.5,3.5\n100,200,300", [1.5, 2.5, 3.5, 100, 200, 300]),
+            ("", []),
+        ],
+    )
+    def test_separators(self, text, expected, use_numpy, monkeypatch):
+        """Test mixed delimiters, blank lines and thousands separators"""
+        if not use_numpy:
+            monkeypatch.setattr(ingestion, "np", None)
+        assert list(parse_numbers(text)) == expected
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_first_bad_token(self, use_numpy, monkeypatch):
+        """Test that errors name the first value that does not parse"""
+        if not use_numpy:
+            monkeypatch.setattr(ingestion, "np", None)
+        with pytest.raises(ValueError, match=r"Value 3 \('1\.2\.3'\) is not a number"):
+            parse_numbers("1\n2\n1.2.3\nabc")
+        with pytest.raises(ValueError, match=r"Value 2 \('2\.5'\) is not a whole"):
+            parse_numbers("1 2.5 x", integers=True)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    @pytest.mark.parametrize("token", ["nan", "inf", "-Infinity"])
+    def test_non_finite_rejected(self, token, use_numpy, monkeypatch):
+        """Test that nan and inf are not accepted as values"""
+        if not use_numpy:
+            monkeypatch.setattr(ingestion, "np", None)
+        with pytest.raises(ValueError, match=rf"Value 2 \('{token}'\) is not a number"):
+            parse_numbers(f"1, {token}, 3")
+
+    @pytest.mark.parametrize(
+        "text, line, value",
+        [
+            ("1,5\n2,5", 1, "1,5"),
+            ("7\n1.5,250\n", 2, "1.5,250"),
+            ("100,200\n300,400", 1, "100,200"),
+            ("100,200,300\n400,500,600", 1, "100,200,300"),
+            ("1,5, 2,000", 1, "2,000"),
+        ],
+    )
+    def test_ambiguous_commas(self, text, line, value):
+        """Test that commas that could group digits or join values are not guessed"""
+        with pytest.raises(
+            ValueError, match=rf"Line {line} \('{value}'\) is ambiguous"
+        ):
+            parse_numbers(text)
+
+    def test_integers(self, monkeypatch):
+        """Test whole-number parsing for counts"""
+        assert list(parse_numbers("10; 20\n1,500\n", integers=True)) == [10, 20, 1500]
+        monkeypatch.setattr(ingestion, "np", None)
+        result = parse_numbers(b"7 8", integers=True)
+        assert result.typecode == "q" and list(result) == [7, 8]
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_large_paste(self):
+        """Test that a large paste comes back as one float64 array"""
+        values = np.random.default_rng(0).lognormal(size=100000)
+        text = "\n".join(repr(v) for v in values.tolist())
+
+        result = parse_numbers(text)
+        assert result.dtype == np.float64
+        assert np.array_equal(result, values)
+
+
+class TestDelimitedColumn:
+    """Test suite for read_delimited_column"""
+
+    def test_named_column_skips_blanks(self):
+        """Test selecting a column by header name"""
+        name, values = read_delimited_column(io.BytesIO(CSV), "revenue")
+
+        assert name == "revenue"
+        assert list(values) == [2.5, 4.0]
+
+    def test_gzip_tsv_by_number(self):
+        """Test gzip detection, tab detection and 1-based column numbers"""
+        body = gzip.compress(CSV.replace(b",", b"\t"))
+        name, values = read_delimited_column(io.BytesIO(body), "3")
+
+        assert name == "revenue"
+        assert list(values) == [2.5, 4.0]
+
+    def test_headerless_file(self):
+        """Test that an all-numeric first row is data, with numbered columns"""
+        name, values = read_delimited_column(io.BytesIO(b"7;1.5\n8;2\n"))
+        assert (name, list(values)) == ("1", [7.0, 8.0])
+
+        name, values = read_delimited_column(io.BytesIO(b"7;1.5\n8;2\n"), "2")
+        assert (name, list(values)) == ("2", [1.5, 2.0])
+
+    def test_segmented_pairs(self):
+        """Test (segment, value) pairs with the default value column"""
+        segment, name, pairs = read_segmented_column(io.BytesIO(CSV), "platform")
+
+        assert (segment, name) == ("platform", "user")
+        assert list(pairs) == [("ios", 1.0), ("android", 2.0), ("web", 3.0)]
+
+        _, _, pairs = read_segmented_column(io.BytesIO(CSV), "platform", "revenue")
+        assert list(pairs) == [("ios", 2.5), ("web", 4.0)]
+
+    def test_errors(self):
+        """Test unknown columns, empty files and bad cells"""
+        with pytest.raises(ValueError, match="Column 'cost' not found"):
+            read_delimited_column(io.BytesIO(CSV), "cost")
+        with pytest.raises(ValueError, match="empty"):
+            read_delimited_column(io.BytesIO(b""))
+        _, values = read_delimited_column(io.BytesIO(CSV), "platform")
+        with pytest.raises(ValueError, match="Line 2: 'ios'"):
+            list(values)
+
+    def test_reads_in_chunks(self):
+        """Test that the buffered reader replays sniffed bytes across chunks"""
+        data = bytes(range(256)) * 10
+        assert open_binary_stream(io.BytesIO(data), chunk_size=7).read() == data
+
+
+class TestFloat64Files:
+    """Test suite for memory-mapped and streamed float64 input"""
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_memmapped_files_match_in_memory_data(self, tmp_path):
+        """Test .npy and raw files reduce to the moments of the original array"""
+        data = np.random.default_rng(0).normal(10, 2, 5000)
+        np.save(tmp_path / "values.npy", data)
+        data.astype("<f8").tofile(tmp_path / "values.f64")
+
+        for name in ("values.npy", "values.f64"):
+            values = open_float64_file(tmp_path / name)
+            assert isinstance(values, np.memmap)
+            result = calculate_std_from_chunks(iter_float64_chunks(values, 1024))
+            assert result["n"] == 5000
+            assert result["std_dev"] == pytest.approx(data.std(ddof=1), rel=1e-12)
+
+    def test_raw_file_without_numpy(self, tmp_path, monkeypatch):
+        """Test the mmap + memoryview.cast('d') fallback"""
+        monkeypatch.setattr(ingestion, "np", None)
+        path = tmp_path / "values.bin"
+        path.write_bytes(struct.pack("<4d", 1.5, -2.0, 3.25, 8.0))
+
+        values = open_float64_file(path)
+        assert isinstance(values, memoryview)
+        assert list(values) == [1.5, -2.0, 3.25, 8.0]
+        result = calculate_std_from_chunks(iter_float64_chunks(values, 3))
+        assert result["mean"] == pytest.approx(2.6875)
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_streamed_npy_upload(self):
+        """Test .npy header parsing and chunked reads from a stream"""
+        data = np.arange(10, dtype=np.int32)
+        buffer = io.BytesIO()
+        np.save(buffer, data)
+        buffer.seek(0)
+
+        chunks = list(iter_float64_stream(buffer, chunk_size=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert np.concatenate(chunks).tolist() == data.tolist()
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_streamed_raw_errors(self):
+        """Test truncated raw data and a raw body claimed to be .npy"""
+        with pytest.raises(ValueError, match="whole number of values"):
+            list(iter_float64_stream(io.BytesIO(b"\0" * 12)))
+        with pytest.raises(ValueError, match="not a .npy file"):
+            iter_float64_stream(io.BytesIO(b"\0" * 16), "npy")
+
+    def test_binary_format_for(self):
+        """Test file-name based format detection"""
+        assert binary_format_for("metric.npy") == "npy"
+        assert binary_format_for("metric.f64.gz") == "float64"
+        assert binary_format_for("metric.csv") is None
+
+
+class TestParquetColumns:
+    """Test suite for the optional Parquet reader"""
+
+    def test_missing_pyarrow_message(self, monkeypatch):
+        """Test the error shown when pyarrow is not installed"""
+        monkeypatch.setattr(ingestion, "pq", None)
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            iter_parquet_columns("metric.parquet", "revenue")
+
+    @pytest.mark.skipif(pa is None, reason="pyarrow not installed")
+    def test_batches_match_lists(self, tmp_path):
+        """Test batched conversion sums against the list-based calculator"""
+        conversions = [23, 31, None, 28, 25]
+        visitors = [1000, 1050, 990, 1020, 995]
+        path = tmp_path / "daily.parquet"
+        pq.write_table(
+            pa.table({"conversions": conversions, "visitors": visitors}), path
+        )
+
+        chunks = iter_parquet_columns(path, ["conversions", "visitors"], batch_size=2)
+        result = calculate_std_from_conversion_chunks(chunks)
+        expected = calculate_std_from_conversion_data(
+            [23, 31, 28, 25], [1000, 1050, 1020, 995]
+        )
+
+        assert result["n_periods"] == 4
+        assert result["pooled_rate"] == pytest.approx(expected["pooled_rate"])
+        assert result["std_dev_observed"] == pytest.approx(expected["std_dev_observed"])
+        with pytest.raises(ValueError, match="Column 'cost' not found"):
+            iter_parquet_columns(path, "cost")
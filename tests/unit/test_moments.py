@@ -0,0 +1,133 @@
+"""
+Unit tests for the one-pass moment accumulators
+"""
+
+import pickle
+import random
+import statistics
+
+import pytest
+
+from calculations.moments import MomentAccumulator, RatioAccumulator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestMomentAccumulator:
+    """Test suite for MomentAccumulator"""
+
+    def test_matches_two_pass_statistics(self):
+        """Test one-pass moments against the statistics module"""
+        rng = random.Random(1)
+        data = [rng.gauss(1e6, 3) for _ in range(5000)]
+        moments = MomentAccumulator(data)
+
+        assert moments.n == 5000
+        assert moments.mean == pytest.approx(statistics.fmean(data), rel=1e-14)
+        assert moments.variance == pytest.approx(statistics.variance(data), rel=1e-9)
+        assert moments.min == min(data)
+        assert moments.max == max(data)
+
+    def test_merge_equals_single_pass(self):
+        """Test that merged chunk accumulators equal one accumulator over all data"""
+        rng = random.Random(2)
+        data = [rng.expovariate(0.1) for _ in range(3001)]
+        whole = MomentAccumulator(data)
+
+        merged = MomentAccumulator()
+        for start in range(0, len(data), 700):
+            merged.merge(MomentAccumulator(data[start : start + 700]))
+        merged.merge(MomentAccumulator())
+
+        assert merged.n == whole.n
+        assert merged.mean == pytest.approx(whole.mean, rel=1e-12)
+        assert merged.variance == pytest.approx(whole.variance, rel=1e-12)
+        assert (merged.min, merged.max) == (whole.min, whole.max)
+
+    def test_streams_generators_and_pickles(self):
+        """Test single-pass input and round-tripping through pickle (for workers)"""
+        moments = MomentAccumulator(x for x in (1, 3))
+        moments.add(5)
+        restored = pickle.loads(pickle.dumps(moments))
+
+        assert (restored.n, restored.mean, restored.variance) == (3, 3.0, 4.0)
+
+    def test_needs_two_values_for_variance(self):
+        """Test that variance is undefined below two values"""
+        with pytest.raises(ValueError, match="at least 2"):
+            MomentAccumulator([1.0]).variance
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_array_chunks(self):
+        """Test that NumPy chunks merge to the same moments as scalar updates"""
+        data = np.random.default_rng(3).normal(50, 10, 10000)
+        moments = MomentAccumulator()
+        for chunk in np.array_split(data, 7):
+            moments.add_array(chunk)
+
+        assert moments.mean == pytest.approx(data.mean(), rel=1e-12)
+        assert moments.variance == pytest.approx(data.var(ddof=1), rel=1e-12)
+        assert moments.max == data.max()
+
+
+class TestRatioAccumulator:
+    """Test suite for RatioAccumulator"""
+
+    @staticmethod
+    def _pairs(seed, n, offset=0.0):
+        rng = random.Random(seed)
+        pairs = []
+        for _ in range(n):
+            sessions = rng.randint(1, 6)
+            pairs.append((offset + sessions * rng.expovariate(0.2), sessions))
+        return pairs
+
+    def test_matches_statistics_module(self):
+        """Test co-moments against two-pass covariance, even with a large offset"""
+        pairs = self._pairs(1, 3000, offset=1e8)
+        xs, ys = zip(*pairs)
+        moments = RatioAccumulator(pairs)
+        # Two-pass reference covariance (statistics.covariance needs 3.10)
+        mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+        co_moment = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+
+        assert moments.n == 3000
+        assert moments.mean_x == pytest.approx(statistics.fmean(xs), rel=1e-14)
+        assert moments.variance_x == pytest.approx(statistics.variance(xs), rel=1e-9)
+        assert moments.variance_y == pytest.approx(statistics.variance(ys), rel=1e-12)
+        assert moments.covariance == pytest.approx(co_moment / 2999, rel=1e-9)
+
+    def test_merge_and_pickle(self):
+        """Test that merged chunks equal one pass and state round-trips"""
+        pairs = self._pairs(2, 1000)
+        whole = RatioAccumulator(pairs)
+        merged = RatioAccumulator(pairs[:10]).merge(RatioAccumulator())
+        merged.merge(RatioAccumulator(pairs[10:]))
+        merged = pickle.loads(pickle.dumps(merged))
+
+        assert merged.n == whole.n
+        for name in ("mean_x", "mean_y", "m2_x", "m2_y", "c_xy"):
+            assert getattr(merged, name) == pytest.approx(getattr(whole, name))
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_array_chunks(self):
+        """Test vectorized chunks against the per-pair path"""
+        pairs = self._pairs(3, 2000)
+        xs, ys = map(np.array, zip(*pairs))
+        moments = RatioAccumulator().add_arrays(xs[:700], ys[:700])
+        moments.add_arrays(xs[700:], ys[700:])
+        expected = RatioAccumulator(pairs)
+
+        assert moments.covariance == pytest.approx(expected.covariance, rel=1e-12)
+        with pytest.raises(ValueError, match="same length"):
+            moments.add_arrays(xs[:2], ys[:3])
+
+    def test_needs_two_pairs(self):
+        """Test error handling for too little data"""
+        moments = RatioAccumulator()
+        moments.add(1.0, 2.0)
+        with pytest.raises(ValueError, match="Need at least 2 data points"):
+            moments.covariance
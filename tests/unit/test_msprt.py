@@ -6,7 +6,23 @@ import math
 
 import pytest
 
-from calculations.msprt import calculate_msprt_plan
+from calculations.msprt import (
+    MonitoringTable,
+    MSPRTMonitor,
+    calculate_boundary_at_sample_size,
+    calculate_msprt_plan,
+    calculate_sample_size_for_boundary,
+    calculate_sample_sizes_for_boundaries,
+    determine_week_status,
+    solve_sample_size_for_boundary,
+    validate_msprt_consistency,
+    validate_msprt_consistency_grid,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestMSPRTCalculator:
@@ -338,3 +354,283 @@ class TestMSPRTCalculator:
         assert result["min_n"] == min_n
         assert result["power"] == 1 - beta
         assert len(result["monitoring_points"]) > 0
+
+
+class TestMonitoringTable:
+    """Test suite for the columnar monitoring tables"""
+
+    @pytest.mark.parametrize("std_known", ["known", "unknown"])
+    def test_weekly_rows_match_determine_week_status(self, std_known):
+        """Test that every weekly row agrees with the scalar week status"""
+        result = calculate_msprt_plan(
+            baseline_mean=100,
+            std_known=std_known,
+            baseline_std=20,
+            improvement_type="relative",
+            improvement_value=5,
+            alpha=0.05,
+            beta=0.2,
+            max_n=5200,
+            min_n=100,
+            weekly_visitors=100,
+            max_weeks=52,
+        )
+        table = result["monitoring_points"]
+
+        assert isinstance(table, MonitoringTable)
+        assert len(table) == 52
+        for point in table:
+            expected = determine_week_status(
+                point["week"],
+                result["absolute_improvement"],
+                100,
+                result["baseline_std"],
+                0.05,
+                100,
+                result["use_t_test"],
+            )
+            for key, value in expected.items():
+                assert point[key] == value
+            assert point["se"] == result["baseline_std"] * math.sqrt(2 / point["n"])
+
+    def test_sample_size_rows_match_scalar_boundary(self):
+        """Test the non-weekly table against the scalar boundary"""
+        result = calculate_msprt_plan(
+            baseline_mean=100,
+            std_known="unknown",
+            baseline_std=None,
+            improvement_type="relative",
+            improvement_value=5,
+            alpha=0.05,
+            beta=0.2,
+            max_n=1000,
+            min_n=2,
+        )
+
+        for point in result["monitoring_points"]:
+            boundary = calculate_boundary_at_sample_size(
+                point["n"], result["baseline_std"], 0.05, use_t_test=True
+            )
+            assert point["boundary_upper"] == boundary
+            assert point["boundary_lower"] == -boundary
+            assert "status" not in point
+
+    def test_sequence_behaviour(self):
+        """Test indexing, slicing and equality like the list it replaces"""
+        result = calculate_msprt_plan(
+            baseline_mean=100,
+            std_known="known",
+            baseline_std=20,
+            improvement_type="relative",
+            improvement_value=5,
+            alpha=0.05,
+            beta=0.2,
+            max_n=1200,
+            min_n=100,
+            weekly_visitors=100,
+            max_weeks=12,
+        )
+        table = result["monitoring_points"]
+
+        assert table[-1] == table[11]
+        assert table[2:4] == [table[2], table[3]]
+        assert table == list(table)
+        assert isinstance(table[0]["n"], int)
+        assert isinstance(table[0]["boundary_upper"], float)
+        with pytest.raises(IndexError):
+            table[12]
+
+
+class TestBoundarySolver:
+    """Test suite for the sample size solvers that invert the boundary"""
+
+    @pytest.mark.parametrize("target", [0.5, 2.0, 5.0, 20.0, 100.0])
+    def test_t_test_solution_round_trips(self, target):
+        """Test that the solved n reproduces the target boundary"""
+        result = solve_sample_size_for_boundary(target, 10.0, 0.05, use_t_test=True)
+
+        assert result["converged"]
+        assert 1 < result["n"]
+        boundary = calculate_boundary_at_sample_size(result["n"], 10.0, 0.05, True)
+        assert boundary == pytest.approx(target, rel=1e-6)
+
+    def test_converges_in_few_iterations(self):
+        """Test that typical plans stop well before the iteration cap"""
+        result = solve_sample_size_for_boundary(1.0, 20.0, 0.05, use_t_test=True)
+
+        assert result["converged"]
+        assert result["iterations"] <= 4
+
+    def test_z_test_is_closed_form(self):
+        """Test that z-test mode needs no iterations"""
+        result = solve_sample_size_for_boundary(2.0, 10.0, 0.05)
+
+        assert result["iterations"] == 0
+        assert result["n"] == calculate_sample_size_for_boundary(2.0, 10.0, 0.05)
+
+    def test_small_samples_use_exact_t(self):
+        """Test that boundaries below four observations use the exact t value"""
+        boundary = calculate_boundary_at_sample_size(2, 1.0, 0.05, use_t_test=True)
+
+        assert boundary == pytest.approx(4.302652729911275)
+        with pytest.raises(ValueError, match="more than one observation"):
+            calculate_boundary_at_sample_size(1, 1.0, 0.05, use_t_test=True)
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_batched_solver_matches_scalar(self):
+        """Test that the batched solver agrees with one scalar solve per target"""
+        targets = [0.3, 1.0, 4.0, 15.0, 60.0]
+        batch = calculate_sample_sizes_for_boundaries(targets, 10.0, 0.05, True)
+
+        assert batch["converged"].all()
+        for target, n, iterations in zip(targets, batch["n"], batch["iterations"]):
+            scalar = solve_sample_size_for_boundary(target, 10.0, 0.05, True)
+            assert n == pytest.approx(scalar["n"], rel=1e-12)
+            assert iterations == scalar["iterations"]
+
+
+class TestConsistencyValidation:
+    """Test suite for validate_msprt_consistency"""
+
+    PLAN = {
+        "baseline_mean": 100,
+        "baseline_std": 20,
+        "improvement_type": "relative",
+        "alpha": 0.05,
+        "beta": 0.2,
+        "max_n": 100000,
+        "min_n": 100,
+        "max_weeks": 52,
+    }
+
+    @staticmethod
+    def _scanned_week(results):
+        for point in results["monitoring_points"]:
+            if point["status"] == "✅ Significant Improvement":
+                return point["week"]
+        return None
+
+    @pytest.mark.parametrize("std_known", ["known", "estimated", "unknown"])
+    @pytest.mark.parametrize("weekly_visitors", [7, 100, 1234])
+    @pytest.mark.parametrize("improvement_value", [-5, 1, 5, 30])
+    def test_first_week_matches_table(
+        self, std_known, weekly_visitors, improvement_value
+    ):
+        """Test that the solved crossing week is the first significant table row"""
+        results = calculate_msprt_plan(
+            std_known=std_known,
+            improvement_value=improvement_value,
+            weekly_visitors=weekly_visitors,
+            **self.PLAN,
+        )
+        validation = validate_msprt_consistency(results)
+
+        assert validation.get("first_significant_week") == self._scanned_week(results)
+
+    def test_grid_validation(self):
+        """Test that a whole parameter grid validates in one call"""
+        report = validate_msprt_consistency_grid(
+            {
+                "std_known": ["known", "unknown"],
+                "improvement_value": [2, 5, 10],
+                "weekly_visitors": [500, 2000],
+            },
+            **self.PLAN,
+        )
+
+        assert report["checked"] == 12
+        assert report["consistent"]
+        assert report["inconsistent"] == []
+        assert report["cases"][0]["parameters"]["std_known"] == "known"
+
+
+class TestMSPRTMonitor:
+    """Test suite for the streaming mSPRT monitor"""
+
+    def _plan(self, std_known="known"):
+        return calculate_msprt_plan(
+            baseline_mean=100,
+            std_known=std_known,
+            baseline_std=20,
+            improvement_type="relative",
+            improvement_value=5,
+            alpha=0.05,
+            beta=0.2,
+            max_n=1000,
+            min_n=100,
+        )
+
+    def test_configured_from_plan(self):
+        """Test that alpha, beta and the mixing variance come from the plan"""
+        plan = self._plan()
+        monitor = MSPRTMonitor.from_plan(plan)
+
+        assert monitor.alpha == plan["alpha"]
+        assert monitor.beta == plan["beta"]
+        assert monitor.A == plan["A"]
+        assert monitor.B == plan["B"]
+        assert monitor.mixing_variance == pytest.approx(25 / 2.0)
+        assert monitor.baseline_std == plan["baseline_std"]
+        assert MSPRTMonitor.from_plan(self._plan("unknown")).baseline_std is None
+
+    def test_no_evidence_before_both_arms_have_data(self):
+        """Test that the likelihood ratio stays at 1 until both arms report"""
+        monitor = MSPRTMonitor(0.05, 0.2, mixing_variance=4.0)
+        state = monitor.add("control", 10.0)
+
+        assert state["likelihood_ratio"] == 1.0
+        assert state["p_value"] == 1.0
+        assert state["decision"] == "continue"
+        assert state["difference"] is None
+
+    def test_batch_matches_single_updates(self):
+        """Test that sufficient statistics agree for single and batch input"""
+        control = [98.0, 101.5, 99.2, 103.1, 100.4, 97.7]
+        treatment = [104.2, 106.0, 103.3, 105.1, 107.9, 102.6]
+
+        single = MSPRTMonitor(0.05, 0.2, mixing_variance=9.0)
+        for c, t in zip(control, treatment):
+            single.add("control", c)
+            single.add("treatment", t)
+        batch = MSPRTMonitor(0.05, 0.2, mixing_variance=9.0)
+        batch.add_batch("control", control)
+        state = batch.add_batch("treatment", treatment)
+
+        assert state["n_control"] == single.state()["n_control"] == 6
+        assert state["control_mean"] == pytest.approx(sum(control) / 6)
+        assert state["difference"] == pytest.approx(single.state()["difference"])
+        assert state["likelihood_ratio"] == pytest.approx(single.likelihood_ratio)
+
+    def test_mixture_likelihood_ratio_formula(self):
+        """Test the normal-mixture likelihood ratio with known variance"""
+        monitor = MSPRTMonitor(0.05, 0.2, mixing_variance=4.0, baseline_std=2.0)
+        monitor.add_batch("control", [0.0, 0.0])
+        state = monitor.add_batch("treatment", [1.0, 1.0])
+
+        v = 4.0 * (1 / 2 + 1 / 2)
+        expected = math.sqrt(v / (v + 4.0)) * math.exp(4.0 / (2 * v * (v + 4.0)))
+        assert state["likelihood_ratio"] == pytest.approx(expected)
+        assert state["p_value"] == pytest.approx(min(1.0, 1 / expected))
+
+    def test_detects_large_effect_and_stops(self):
+        """Test that a clear effect crosses the upper threshold and stays stopped"""
+        monitor = MSPRTMonitor(0.05, 0.2, mixing_variance=25.0, baseline_std=10.0)
+        for week in range(20):
+            monitor.add_batch("control", [100.0 + (i % 7) - 3 for i in range(50)])
+            state = monitor.add_batch(
+                "treatment", [110.0 + (i % 5) - 2 for i in range(50)]
+            )
+
+        assert state["decision"] == "reject_h0"
+        assert state["likelihood_ratio"] >= monitor.A
+        assert state["p_value"] < 0.05
+        assert state["stopped_at"][0] < state["n_control"]
+
+    def test_invalid_configuration(self):
+        """Test error handling for invalid configuration and arms"""
+        with pytest.raises(ValueError, match="Alpha must be between 0 and 1"):
+            MSPRTMonitor(0, 0.2, 1.0)
+        with pytest.raises(ValueError, match="Mixing variance must be positive"):
+            MSPRTMonitor(0.05, 0.2, 0)
+        with pytest.raises(ValueError, match="Arm must be one of"):
+            MSPRTMonitor(0.05, 0.2, 1.0).add("variant_b", 1.0)
@@ -0,0 +1,79 @@
+"""
+Unit tests for the streaming quantile sketch
+"""
+
+import pickle
+import random
+
+import pytest
+
+from calculations.quantile_sketch import QuantileSketch
+
+PROBABILITIES = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+
+def _rank_errors(sketch, ordered):
+    """Distance between requested and true ranks of the sketch's answers"""
+    n = len(ordered)
+    errors = []
+    for p, value in zip(PROBABILITIES, sketch.quantiles(PROBABILITIES)):
+        low = sum(1 for x in ordered if x < value) / n
+        high = sum(1 for x in ordered if x <= value) / n
+        errors.append(0 if low <= p <= high else min(abs(p - low), abs(p - high)))
+    return errors
+
+
+class TestQuantileSketch:
+    """Test suite for QuantileSketch"""
+
+    def test_accuracy_and_bounded_memory(self):
+        """Test rank error against the exact distribution and retained size"""
+        rng = random.Random(0)
+        data = [rng.lognormvariate(0, 1) for _ in range(100000)]
+        sketch = QuantileSketch(k=200, seed=1).update(data)
+
+        assert sketch.n == len(data)
+        assert sketch.retained < 1000
+        assert (sketch.min, sketch.max) == (min(data), max(data))
+        assert max(_rank_errors(sketch, sorted(data))) < 0.01
+
+    def test_merged_sketches(self):
+        """Test that sketches built per chunk merge with the same accuracy"""
+        rng = random.Random(2)
+        data = [rng.gauss(100, 15) for _ in range(60000)]
+        parts = [QuantileSketch(seed=i).update(data[i::4]) for i in range(4)]
+        merged = QuantileSketch(seed=9)
+        for part in parts:
+            merged.merge(pickle.loads(pickle.dumps(part)))
+
+        assert merged.n == len(data)
+        assert max(_rank_errors(merged, sorted(data))) < 0.01
+
+    def test_small_inputs_are_exact(self):
+        """Test that inputs below the sketch capacity give exact quantiles"""
+        sketch = QuantileSketch(seed=0)
+        for value in [5, 1, 4, 2, 3]:
+            sketch.add(value)
+
+        assert sketch.quantiles([0, 0.5, 1]) == [1, 3, 5]
+        assert sketch.rank(2) == pytest.approx(0.4)
+
+    def test_larger_k_is_more_accurate(self):
+        """Test that the accuracy parameter trades memory for error"""
+        rng = random.Random(3)
+        data = [rng.random() for _ in range(50000)]
+        ordered = sorted(data)
+        coarse = QuantileSketch(k=16, seed=4).update(data)
+        fine = QuantileSketch(k=800, seed=4).update(data)
+
+        assert fine.retained > coarse.retained
+        assert max(_rank_errors(fine, ordered)) < max(_rank_errors(coarse, ordered))
+
+    def test_invalid_inputs(self):
+        """Test error handling"""
+        with pytest.raises(ValueError, match="at least 8"):
+            QuantileSketch(k=4)
+        with pytest.raises(ValueError, match="empty"):
+            QuantileSketch().quantile(0.5)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            QuantileSketch().update([1, 2]).quantile(2)
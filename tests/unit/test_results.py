@@ -0,0 +1,60 @@
+"""
+Unit tests for slotted calculator result records
+"""
+
+import pytest
+from jinja2 import Template
+
+from calculations.fixed_horizon import calculate_sample_size
+from calculations.msprt import calculate_msprt_plan
+from calculations.std_calculator import calculate_std_from_data
+
+
+class TestResultRecords:
+    """Test suite for ResultRecord results"""
+
+    def test_attribute_and_mapping_access(self):
+        """Test that fields read the same as attributes and as keys"""
+        result = calculate_std_from_data([1, 2, 3, 4, 5])
+
+        assert result.std_dev == result["std_dev"]
+        assert result.get("n") == 5
+        assert "mean" in result
+        assert "missing" not in result
+        with pytest.raises(KeyError):
+            result["missing"]
+
+    def test_no_instance_dict(self):
+        """Test that records are slotted"""
+        result = calculate_sample_size(100, 20, "relative", 5, 0.8, 0.05)
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = 1
+
+    def test_to_dict_and_equality(self):
+        """Test that dicts are built on demand and compare equal to the record"""
+        result = calculate_std_from_data([2, 4, 4, 4, 5, 5, 7, 9])
+        fields = result.to_dict()
+
+        assert type(fields) is dict
+        assert fields == result
+        assert list(fields) == list(result)
+        assert dict(**result) == fields
+
+    def test_template_attribute_access(self):
+        """Test that Jinja templates can read fields as attributes"""
+        result = calculate_msprt_plan(
+            baseline_mean=100,
+            std_known="known",
+            baseline_std=20,
+            improvement_type="relative",
+            improvement_value=5,
+            alpha=0.05,
+            beta=0.2,
+            max_n=1000,
+            min_n=200,
+        )
+
+        rendered = Template("{{ r.max_n }}/{{ r['min_n'] }}").render(r=result)
+        assert rendered == f"{result.max_n}/{result.min_n}"
@@ -0,0 +1,81 @@
+"""
+Unit tests for selection-based order statistics
+"""
+
+import random
+
+import pytest
+
+from calculations import selection
+from calculations.selection import (
+    median,
+    order_statistics,
+    quantiles,
+    quantiles_with_ranks,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PROBABILITIES = [0.5, 0.01, 0.05, 0.25, 0.75, 0.95, 0.99]
+
+
+def _sorted_quantile(values, p):
+    """Reference quantile from a full sort (linear interpolation)"""
+    ordered = sorted(values)
+    position = p * (len(ordered) - 1)
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+class TestSelection:
+    """Test suite for order_statistics and quantiles"""
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 17, 100, 1001])
+    def test_quickselect_matches_sort(self, n, monkeypatch):
+        """Test the pure-Python path against a full sort, with many ties"""
+        monkeypatch.setattr(selection, "np", None)
+        rng = random.Random(n)
+        data = [rng.choice([rng.random(), 1.0, 2.0]) for _ in range(n)]
+
+        result = quantiles(data, PROBABILITIES)
+        for value, p in zip(result, PROBABILITIES):
+            assert value == pytest.approx(_sorted_quantile(data, p), rel=1e-12)
+
+    def test_order_statistics(self):
+        """Test exact ranks and that the input is left untouched"""
+        data = [5, 3, 9, 1, 7]
+        assert order_statistics(data, [0, 2, 4]) == {0: 1, 2: 5, 4: 9}
+        assert data == [5, 3, 9, 1, 7]
+        with pytest.raises(ValueError, match="Ranks must be between"):
+            order_statistics(data, [5])
+
+    def test_quantiles_with_ranks(self):
+        """Test that extra ranks come back from the same selection"""
+        data = [5, 3, 9, 1, 7, 2]
+        result, found = quantiles_with_ranks(data, [0.5], [0, 5])
+
+        assert result == [4.0]
+        assert found[0] == 1 and found[5] == 9
+
+    def test_median(self):
+        """Test odd and even medians"""
+        assert median([3, 1, 2]) == 2
+        assert median([4, 1, 3, 2]) == 2.5
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_numpy_path_matches_percentile(self):
+        """Test the numpy.partition path against numpy.percentile"""
+        data = np.random.default_rng(0).lognormal(size=10001).tolist()
+
+        result = quantiles(data, PROBABILITIES)
+        expected = np.percentile(data, [p * 100 for p in PROBABILITIES])
+        assert result == pytest.approx(expected.tolist(), rel=1e-12)
+
+    def test_invalid_probabilities(self):
+        """Test error handling for probabilities outside [0, 1]"""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            quantiles([1, 2, 3], [1.5])
@@ -0,0 +1,78 @@
+"""
+Unit tests for the mSPRT Monte Carlo simulation
+"""
+
+import pytest
+
+from calculations.msprt import calculate_msprt_plan
+from calculations.simulation import iter_msprt_simulation, simulate_msprt_plan
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _plan(std_known="known", **overrides):
+    params = {
+        "baseline_mean": 100,
+        "std_known": std_known,
+        "baseline_std": 20,
+        "improvement_type": "relative",
+        "improvement_value": 5,
+        "alpha": 0.05,
+        "beta": 0.2,
+        "max_n": 2600,
+        "min_n": 100,
+        "weekly_visitors": 100,
+        "max_weeks": 26,
+    }
+    params.update(overrides)
+    return calculate_msprt_plan(**params)
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+class TestMSPRTSimulation:
+    """Test suite for simulate_msprt_plan"""
+
+    @pytest.mark.parametrize("std_known", ["known", "unknown"])
+    def test_operating_characteristics(self, std_known):
+        """Test that the plan controls type I error and detects the planned effect"""
+        result = simulate_msprt_plan(_plan(std_known), n_sims=4000, seed=7)
+
+        assert result["complete"]
+        assert result["simulations"] == 4000
+        assert result["type_i_error"] <= 0.05 + 3 * result["type_i_error_se"]
+        assert result["power"] > 0.5
+        assert result["expected_n_h1"] < result["expected_n_h0"]
+        assert len(result["stopping_distribution_h1"]) == 26 + 1
+        assert sum(result["stopping_distribution_h1"]) == pytest.approx(1.0)
+
+    def test_reproducible_and_independent_of_workers(self):
+        """Test that a seed fixes the result whatever the number of workers"""
+        plan = _plan("unknown")
+        single = simulate_msprt_plan(plan, n_sims=3000, seed=11, shard_size=1000)
+        pooled = simulate_msprt_plan(
+            plan, n_sims=3000, seed=11, shard_size=1000, workers=2
+        )
+
+        assert single == pooled
+
+    def test_streams_partial_estimates(self):
+        """Test that one estimate is yielded per shard and callers can stop early"""
+        stream = iter_msprt_simulation(_plan(), n_sims=5000, seed=3, shard_size=2000)
+        seen = [estimate["simulations"] for estimate in stream]
+        assert seen == [2000, 4000, 5000]
+
+        early = simulate_msprt_plan(
+            _plan(), n_sims=50000, seed=3, shard_size=1000, tolerance=0.01
+        )
+        assert early["simulations"] < 50000
+        assert not early["complete"]
+
+    def test_invalid_arguments(self):
+        """Test error handling for invalid simulation settings"""
+        with pytest.raises(ValueError, match="at least 1"):
+            simulate_msprt_plan(_plan(), n_sims=0)
+        with pytest.raises(ValueError, match="non-zero expected improvement"):
+            simulate_msprt_plan(_plan(improvement_value=0), n_sims=10)
@@ -0,0 +1,88 @@
+"""
+Unit tests for shared statistical functions
+"""
+
+import math
+from array import array
+
+import pytest
+
+from calculations import statistics
+from calculations.statistics import (
+    norm_cdf,
+    norm_cdf_batch,
+    norm_ppf,
+    norm_ppf_batch,
+    t_ppf,
+    t_ppf_batch,
+)
+
+PROBABILITIES = [0.001, 0.025, 0.05, 0.2, 0.5, 0.8, 0.9, 0.95, 0.975, 0.995]
+
+
+class TestBatchFunctions:
+    """Test suite for the vectorized batch API"""
+
+    def test_norm_ppf_batch_matches_scalar(self):
+        """Test that norm_ppf_batch agrees with norm_ppf"""
+        result = norm_ppf_batch(PROBABILITIES)
+
+        assert len(result) == len(PROBABILITIES)
+        for value, p in zip(result, PROBABILITIES):
+            assert abs(value - norm_ppf(p)) < 1e-12
+
+    def test_norm_ppf_batch_table_hits(self):
+        """Test that both tails of tabled probabilities match norm_ppf exactly"""
+        probabilities = [0.025, 0.975, 0.2, 0.8, 0.005, 0.3]
+        result = norm_ppf_batch(probabilities)
+
+        assert list(result) == [norm_ppf(p) for p in probabilities]
+
+    def test_norm_cdf_batch_matches_scalar(self):
+        """Test that norm_cdf_batch gives exactly the scalar norm_cdf values"""
+        values = [-40, -6, -4.5, -3, -1.96, -0.3, 0, 0.1, 0.46875, 1, 2.5, 4, 8]
+        result = norm_cdf_batch(values)
+
+        for value, x in zip(result, values):
+            assert value == norm_cdf(x)
+
+    def test_t_ppf_batch_matches_scalar(self):
+        """Test that t_ppf_batch broadcasts df against p and agrees with t_ppf"""
+        dfs = [1, 2, 5, 10, 29, 30, 100, 10, 1]
+        result = t_ppf_batch(dfs, 0.975)
+
+        for value, df in zip(result, dfs):
+            assert abs(value - t_ppf(df, 0.975)) < 1e-12
+
+    def test_batch_rejects_invalid_probabilities(self):
+        """Test that a single bad probability fails the whole batch"""
+        with pytest.raises(ValueError, match="p must be between 0 and 1"):
+            norm_ppf_batch([0.5, 1.0])
+        with pytest.raises(ValueError, match="p must be between 0 and 1"):
+            t_ppf_batch([10, 20], [0.0, 0.5])
+
+    def test_scalar_functions_unchanged(self):
+        """Test that the scalar wrappers keep their reference values"""
+        assert norm_ppf(0.025) == -norm_ppf(0.975)
+        assert abs(norm_ppf(0.975) - 1.96) < 0.001
+        assert norm_cdf(0) == 0.5
+        assert t_ppf(10, 0.975) > t_ppf(30, 0.975) > 1.96
+
+        with pytest.raises(ValueError):
+            norm_ppf(0)
+        with pytest.raises(ValueError):
+            t_ppf(10, 1)
+
+    def test_fallback_without_numpy(self, monkeypatch):
+        """Test that batch functions return array('d') when NumPy is missing"""
+        monkeypatch.setattr(statistics, "np", None)
+
+        ppf = norm_ppf_batch(PROBABILITIES)
+        cdf = norm_cdf_batch([-1.0, 0.0, 1.0])
+        t = t_ppf_batch(5, [0.9, 0.975])
+
+        assert isinstance(ppf, array)
+        assert list(ppf) == [norm_ppf(p) for p in PROBABILITIES]
+        assert list(cdf) == [norm_cdf(x) for x in (-1.0, 0.0, 1.0)]
+        assert list(t) == [t_ppf(5, 0.9), t_ppf(5, 0.975)]
+        assert math.isclose(norm_ppf_batch(0.975)[0], norm_ppf(0.975))
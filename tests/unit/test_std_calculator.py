@@ -6,15 +6,29 @@ import math
 
 import pytest
 
+from calculations import std_calculator
+from calculations.quantile_sketch import QuantileSketch
 from calculations.std_calculator import (
+    calculate_ratio_metric_std,
+    calculate_ratio_metric_std_from_chunks,
+    calculate_robust_std,
+    calculate_segmented_std,
+    calculate_std_from_conversion_chunks,
     calculate_std_from_conversion_data,
     calculate_std_from_data,
+    calculate_std_from_stream,
     estimate_conversion_rate_std,
     estimate_std_from_percentiles,
     estimate_std_from_range,
+    estimate_std_from_sketch,
     sample_size_for_std_estimation,
 )
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestStdCalculatorFromData:
     """Test suite for calculating std from data points"""
@@ -86,6 +100,46 @@ class TestStdCalculatorFromData:
         assert result["ci_lower"] < result["mean"]
         assert result["ci_upper"] > result["mean"]
 
+    def test_percentiles(self):
+        """Test the optional percentile set"""
+        data = list(range(101))  # 0 to 100, so the p-th percentile is p
+        result = calculate_std_from_data(data, percentiles=True)
+
+        assert result["median"] == 50
+        assert result["percentiles"] == {
+            "p1": 1,
+            "p5": 5,
+            "p25": 25,
+            "p75": 75,
+            "p95": 95,
+            "p99": 99,
+        }
+        assert calculate_std_from_data(data)["percentiles"] is None
+
+    def test_stream_matches_exact(self):
+        """Test the bounded-memory path against the exact calculation"""
+        data = [(i * 7919) % 1000 / 10 for i in range(20000)]
+        exact = calculate_std_from_data(data, percentiles=True)
+        streamed = calculate_std_from_stream(
+            iter(data), percentiles=True, chunk_size=3000
+        )
+
+        assert streamed["quantiles_approximate"] is True
+        assert streamed["n"] == exact["n"]
+        assert streamed["std_dev"] == pytest.approx(exact["std_dev"], rel=1e-12)
+        assert streamed["median"] == pytest.approx(exact["median"], abs=1.0)
+        assert streamed["percentiles"]["p95"] == pytest.approx(
+            exact["percentiles"]["p95"], abs=1.0
+        )
+
+    def test_std_from_sketch(self):
+        """Test the quartile-based estimate from a sketch"""
+        sketch = QuantileSketch(seed=0).update(range(1, 101))
+        result = estimate_std_from_sketch(sketch)
+
+        assert result["median"] == pytest.approx(50, abs=1)
+        assert result["estimated_std_iqr"] == pytest.approx(50 / 1.35, rel=0.05)
+
     def test_empty_data(self):
         """Test error handling for empty data"""
         with pytest.raises(ValueError, match="Need at least 2 data points"):
@@ -97,6 +151,99 @@ class TestStdCalculatorFromData:
             calculate_std_from_data([5])
 
 
+class TestSegmentedStd:
+    """Test suite for per-segment standard deviation"""
+
+    def test_segments_and_totals(self):
+        """Test per-segment statistics, the overall totals and pooled std"""
+        rows = [("ios", 2), ("web", 10), ("ios", 4), ("web", 14), ("ios", 6)]
+        result = calculate_segmented_std(iter(rows))
+
+        assert list(result["segments"]) == ["ios", "web"]
+        assert result["segments"]["ios"]["mean"] == 4
+        assert result["segments"]["ios"]["std_dev"] == 2
+        assert result["segments"]["web"]["cv"] == pytest.approx(math.sqrt(8) / 12 * 100)
+        overall = calculate_std_from_data([2, 10, 4, 14, 6])
+        assert result["total"]["std_dev"] == pytest.approx(overall["std_dev"])
+        # (8 + 8) / (5 - 2) within-segment squared deviations
+        assert result["pooled_within_std"] == pytest.approx(math.sqrt(16 / 3))
+
+    def test_single_value_segment(self):
+        """Test that a one-row segment has no std but counts in the totals"""
+        result = calculate_segmented_std([("a", 1), ("a", 3), ("b", 5)])
+
+        assert result["segments"]["b"]["std_dev"] is None
+        assert result["total"]["n"] == 3
+
+    def test_needs_two_values(self):
+        """Test error handling for too little data"""
+        with pytest.raises(ValueError, match="Need at least 2 data points"):
+            calculate_segmented_std([("a", 1)])
+
+
+class TestRobustStd:
+    """Test suite for the robust spread estimators"""
+
+    @staticmethod
+    def _expected(data, k):
+        """Trimmed and winsorized std from a full sort"""
+        ordered = sorted(data)
+        trimmed = ordered[k : len(ordered) - k]
+        winsorized = [ordered[k]] * k + trimmed + [ordered[-k - 1]] * k
+        return (
+            calculate_std_from_data(trimmed)["std_dev"],
+            calculate_std_from_data(winsorized)["std_dev"],
+        )
+
+    def test_heavy_tail(self):
+        """Test that the robust estimates ignore a single huge outlier"""
+        data = [float(x % 10) for x in range(199)] + [10000.0]
+        result = calculate_robust_std(data)
+
+        trimmed_std, winsorized_std = self._expected(data, 2)
+        assert result["trimmed_n"] == 196
+        assert result["trimmed_std"] == pytest.approx(trimmed_std)
+        assert result["winsorized_std"] == pytest.approx(winsorized_std)
+        assert result["median"] == 4.5
+        assert result["mad"] == 2.5
+        assert result["mad_std"] == pytest.approx(1.4826 * 2.5)
+        assert result["iqr_std"] == pytest.approx((7 - 2) / 1.349)
+        assert result["std_dev"] > 100 * result["trimmed_std"]
+
+    def test_ties_at_the_cut_offs(self, monkeypatch):
+        """Test trimming by rank when the cut-off values repeat"""
+        monkeypatch.setattr(std_calculator, "np", None)
+        data = [1.0] * 30 + [2.0, 3.0, 5.0] * 20 + [100.0] * 10
+        result = calculate_robust_std(data, trim=0.05)
+
+        trimmed_std, winsorized_std = self._expected(data, 5)
+        assert result["trimmed_std"] == pytest.approx(trimmed_std)
+        assert result["winsorized_std"] == pytest.approx(winsorized_std)
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_numpy_path_matches_list(self):
+        """Test that array input gives the same estimates as a list"""
+        data = np.random.default_rng(0).lognormal(0, 1.5, 5000)
+        from_array = calculate_robust_std(data)
+        from_list = calculate_robust_std(data.tolist())
+
+        for key in ("mad_std", "iqr_std", "trimmed_std", "winsorized_std"):
+            assert from_array[key] == pytest.approx(from_list[key], rel=1e-9)
+        ordered = np.sort(data)
+        assert from_array["trimmed_std"] == pytest.approx(
+            ordered[50:-50].std(ddof=1), rel=1e-9
+        )
+
+    def test_invalid_inputs(self):
+        """Test error handling"""
+        with pytest.raises(ValueError, match="Need at least 2 data points"):
+            calculate_robust_std([1])
+        with pytest.raises(ValueError, match="Trim fraction"):
+            calculate_robust_std([1, 2, 3], trim=0.5)
+        with pytest.raises(ValueError, match="at least 2 data points"):
+            calculate_robust_std([1, 2, 3], trim=0.4)
+
+
 class TestStdCalculatorFromRange:
     """Test suite for estimating std from range"""
 
@@ -193,6 +340,59 @@ class TestConversionRateStd:
         assert result["std_dev_observed"] > 0
         assert result["theoretical_std"] > 0
 
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_conversion_chunks_match_lists(self):
+        """Test the chunked calculator against the list-based one"""
+        conversions = [50, 45, 55, 48, 52]
+        visitors = [1000, 980, 1010, 1000, 995]
+        chunks = [
+            (np.array(conversions[:2]), np.array(visitors[:2])),
+            (np.array(conversions[2:]), np.array(visitors[2:])),
+        ]
+
+        result = calculate_std_from_conversion_chunks(chunks)
+        expected = calculate_std_from_conversion_data(conversions, visitors)
+
+        assert result["conversion_rates"] is None
+        for key in ("n_periods", "mean_rate", "std_dev_observed", "pooled_std"):
+            assert result[key] == pytest.approx(expected[key], rel=1e-12)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_rates_optional(self, use_numpy, monkeypatch):
+        """Test the per-period rates array and skipping it"""
+        if not use_numpy:
+            monkeypatch.setattr(std_calculator, "np", None)
+        conversions = [50, 45, 55, 48, 52]
+        visitors = [1000, 900, 1100, 960, 1040]
+
+        result = calculate_std_from_conversion_data(conversions, visitors)
+        assert list(result["conversion_rates"]) == [0.05] * 5
+        assert result["std_dev_observed"] == pytest.approx(0, abs=1e-15)
+        assert result["total_visitors"] == 5000
+
+        result = calculate_std_from_conversion_data(
+            conversions, visitors, return_rates=False
+        )
+        assert result["conversion_rates"] is None
+        assert result["n_periods"] == 5
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_conversion_arrays_match_pure_python(self, monkeypatch):
+        """Test the vectorized path against the single Python loop"""
+        rng = np.random.default_rng(0)
+        visitors = rng.integers(500, 1500, 365)
+        conversions = rng.binomial(visitors, 0.04)
+
+        vectorized = calculate_std_from_conversion_data(conversions, visitors)
+        monkeypatch.setattr(std_calculator, "np", None)
+        looped = calculate_std_from_conversion_data(
+            conversions.tolist(), visitors.tolist()
+        )
+
+        assert vectorized["total_conversions"] == looped["total_conversions"]
+        for key in ("mean_rate", "std_dev_observed", "pooled_rate", "theoretical_std"):
+            assert vectorized[key] == pytest.approx(looped[key], rel=1e-12)
+
     def test_mismatched_lengths(self):
         """Test error handling for mismatched array lengths"""
         with pytest.raises(ValueError, match="same length"):
@@ -202,6 +402,8 @@ class TestConversionRateStd:
         """Test error handling for zero visitors"""
         with pytest.raises(ValueError, match="at least 2 data points"):
             calculate_std_from_conversion_data([50], [0])
+        with pytest.raises(ValueError, match="cannot be zero"):
+            calculate_std_from_conversion_data([50, 1], [1000, 0])
 
     def test_conversions_exceed_visitors(self):
         """Test handling when conversions exceed visitors"""
@@ -225,6 +427,60 @@ class TestConversionRateStd:
             calculate_std_from_conversion_data([50], [1000])
 
 
+class TestRatioMetricStd:
+    """Test suite for the delta-method ratio metric calculator"""
+
+    ROWS = [(12.5, 3), (0.0, 1), (40.2, 5), (8.1, 2), (19.9, 4), (3.0, 1)]
+
+    def test_delta_method(self):
+        """Test the delta-method variance against the five-sum formula"""
+        result = calculate_ratio_metric_std(iter(self.ROWS))
+
+        n = len(self.ROWS)
+        sx = sum(x for x, _ in self.ROWS)
+        sy = sum(y for _, y in self.ROWS)
+        sxx = sum(x * x for x, _ in self.ROWS)
+        syy = sum(y * y for _, y in self.ROWS)
+        sxy = sum(x * y for x, y in self.ROWS)
+        ratio = sx / sy
+        var_x = (sxx - sx * sx / n) / (n - 1)
+        var_y = (syy - sy * sy / n) / (n - 1)
+        cov = (sxy - sx * sy / n) / (n - 1)
+        mean_y = sy / n
+        expected = (var_x - 2 * ratio * cov + ratio**2 * var_y) / (n * mean_y**2)
+
+        assert result["ratio"] == pytest.approx(ratio)
+        assert result["delta_variance"] == pytest.approx(expected)
+        assert result["effective_std"] == pytest.approx(math.sqrt(expected * n))
+        assert result["ci_margin"] == pytest.approx(1.96 * math.sqrt(expected))
+        assert -1 <= result["correlation"] <= 1
+
+    def test_constant_ratio_has_no_variance(self):
+        """Test that users with identical ratios give zero delta variance"""
+        result = calculate_ratio_metric_std([(2, 1), (4, 2), (10, 5)])
+
+        assert result["ratio"] == 2
+        assert result["effective_std"] == pytest.approx(0, abs=1e-12)
+
+    @pytest.mark.skipif(np is None, reason="NumPy not installed")
+    def test_chunks_match_rows(self):
+        """Test array chunks against the per-row path"""
+        xs, ys = map(np.array, zip(*self.ROWS))
+        chunks = [(xs[:4], ys[:4]), (xs[4:], ys[4:])]
+
+        result = calculate_ratio_metric_std_from_chunks(chunks)
+        expected = calculate_ratio_metric_std(self.ROWS)
+        for key in ("ratio", "delta_variance", "effective_std", "correlation"):
+            assert result[key] == pytest.approx(expected[key], rel=1e-12)
+
+    def test_invalid_inputs(self):
+        """Test error handling"""
+        with pytest.raises(ValueError, match="Need at least 2 data points"):
+            calculate_ratio_metric_std([(1, 1)])
+        with pytest.raises(ValueError, match="Denominator mean cannot be zero"):
+            calculate_ratio_metric_std([(1, 0), (2, 0)])
+
+
 class TestTheoreticalConversionStd:
     """Test suite for theoretical conversion rate std"""
 
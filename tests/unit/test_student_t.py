@@ -0,0 +1,89 @@
+"""
+Unit tests for the exact Student-t quantile engine
+"""
+
+import math
+
+import pytest
+
+from calculations import student_t
+from calculations.statistics import t_ppf
+from calculations.student_t import betainc, betaincinv, t_cdf, t_quantile
+
+
+class TestStudentT:
+    """Test suite for the incomplete-beta based t distribution"""
+
+    @pytest.mark.parametrize("p", [0.6, 0.8, 0.9, 0.975, 0.995, 0.9999])
+    def test_closed_form_quantiles(self, p):
+        """Test df=1 (Cauchy) and df=2 against their closed forms"""
+        cauchy = math.tan(math.pi * (p - 0.5))
+        df2 = (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+        assert math.isclose(t_quantile(1, p), cauchy, rel_tol=1e-12)
+        assert math.isclose(t_quantile(2, p), df2, rel_tol=1e-12)
+
+    def test_reference_values(self):
+        """Test against published two-sided 95% critical values"""
+        assert abs(t_quantile(5, 0.975) - 2.570581835636314) < 1e-12
+        assert abs(t_quantile(10, 0.975) - 2.228138851986274) < 1e-12
+        assert abs(t_quantile(30, 0.975) - 2.042272456301238) < 1e-12
+        assert abs(t_quantile(100, 0.975) - 1.983971518523552) < 1e-12
+
+    @pytest.mark.parametrize("df", [0.5, 3.7, 58.25, 2500.5, 1e5])
+    def test_round_trip_with_cdf(self, df):
+        """Test that t_cdf inverts t_quantile, including non-integer df"""
+        for p in (0.05, 0.5 + 1e-6, 0.8, 0.975):
+            assert math.isclose(t_cdf(t_quantile(df, p), df), p, rel_tol=1e-9)
+
+    def test_symmetry_and_large_df_limit(self):
+        """Test symmetry and convergence to the normal quantile"""
+        assert t_quantile(7, 0.025) == -t_quantile(7, 0.975)
+        assert t_quantile(7, 0.5) == 0
+        assert abs(t_quantile(1e9, 0.975) - 1.959963984540054) < 1e-8
+
+    @pytest.mark.parametrize("p", [1e-13, 1e-100, 1 - 1e-13])
+    def test_extreme_tail_probabilities(self, p):
+        """Test that tiny tails are kept, not rounded to 0 or 1"""
+        t = t_quantile(5, p)
+        tail = min(p, 1 - p)
+
+        assert math.isfinite(t)
+        assert math.isclose(min(t_cdf(t, 5), 1 - t_cdf(t, 5)), tail, rel_tol=1e-6)
+
+    def test_tiny_degrees_of_freedom(self):
+        """Test small df values, which must not be rounded to zero"""
+        assert math.isclose(t_cdf(t_quantile(0.05, 0.6), 0.05), 0.6, rel_tol=1e-9)
+        # The 0.9 quantile for df = 1e-7 exceeds the float range
+        assert t_quantile(1e-7, 0.9) == math.inf
+        assert t_quantile(1e-7, 0.1) == -math.inf
+        with pytest.raises(ValueError, match="Degrees of freedom"):
+            t_quantile(0, 0.9)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            t_quantile(5, 1.0)
+
+    def test_incomplete_beta_inverse(self):
+        """Test that betaincinv inverts betainc"""
+        for a, b, target in [(0.5, 0.5, 0.3), (2.0, 5.0, 0.01), (50.0, 0.5, 0.9)]:
+            x = betaincinv(a, b, target)
+            assert math.isclose(betainc(a, b, x), target, rel_tol=1e-12)
+
+    def test_cache_counters(self):
+        """Test that repeated (df, p) pairs are served from the cache"""
+        student_t.cache_clear()
+        t_ppf(12.5, 0.975)
+        t_ppf(12.5, 0.975)
+        t_ppf(12.5000000001, 0.975)  # Quantizes to the same key
+
+        info = student_t.cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 2
+        assert info["size"] == 1
+        assert info["maxsize"] == student_t.CACHE_SIZE
+
+    def test_invalid_arguments(self):
+        """Test error handling for out-of-range inputs"""
+        with pytest.raises(ValueError, match="Degrees of freedom must be positive"):
+            t_quantile(0, 0.975)
+        with pytest.raises(ValueError, match="p must be between 0 and 1"):
+            t_quantile(10, 1.0)